@@ -18,6 +18,7 @@ Event shape:
 - override: If true, overwrite existing output (default: false)
 - save_raw: If true, save raw HTML to raw/details/details_chunk_{i}.html.gz (default: true)
 - details_rate_limit: Requests per second to FIDE (default: 0.33; 0 = unlimited)
+- details_workers: Concurrent fetch threads sharing one session (default: 4)
 """
 
 import logging
@@ -40,6 +41,15 @@ def _rate_limit_req_s(event: dict, key: str, default: float) -> float:
     return f if f >= 0 else default
 
 
+def _workers(event: dict, key: str, default: int) -> int:
+    v = event.get(key, default)
+    try:
+        n = int(v)
+    except (TypeError, ValueError):
+        return default
+    return n if n >= 1 else default
+
+
 def _derive_sample_and_reports_paths(output_path: str) -> tuple[str | None, str | None]:
     """
     Derive output_sample_path and output_reports_base from output_path.
@@ -65,6 +75,7 @@ def lambda_handler(event: dict, context) -> dict:
     override = event.get("override", False)
     save_raw = event.get("save_raw", True)
     rate_limit = _rate_limit_req_s(event, "details_rate_limit", 0.33)
+    workers = _workers(event, "details_workers", 4)
 
     if run_type not in ("prod", "custom", "test"):
         return {
@@ -138,6 +149,7 @@ def lambda_handler(event: dict, context) -> dict:
         output_sample_path=output_sample_path,
         output_reports_base=output_reports_base,
         save_raw=save_raw,
+        workers=workers,
     )
 
     if exit_code != 0:
@@ -8,7 +8,8 @@ For test: run_name defaults to "test" when omitted.
 When the handler runs in **AWS Lambda** (Step Functions), optional tuning is
 merged from SSM (``PIPELINE_CONFIG_SSM_PARAM``) for any key omitted from the
 execution input: chunk_size, max_concurrency, tournaments_max_concurrency,
-details_rate_limit, reports_rate_limit. Local runs do not read SSM.
+details_rate_limit, reports_rate_limit, details_workers, reports_workers.
+Local runs do not read SSM.
 Precedence: execution input > SSM JSON > code defaults below.
 
 Event shape (passthrough from execution input):
@@ -22,7 +23,9 @@ Event shape (passthrough from execution input):
     "max_concurrency": 5,
     "chunk_size": 300,
     "details_rate_limit": 0.33,
-    "reports_rate_limit": 0.33
+    "reports_rate_limit": 0.33,
+    "details_workers": 4,
+    "reports_workers": 4
 }
 
 Returns the same input with run_name set. Fails with 400 if validation fails.
@@ -71,6 +74,8 @@ def lambda_handler(event: dict, context) -> dict:
     out.setdefault("max_concurrency", 5)
     out.setdefault("details_rate_limit", 0.25)
     out.setdefault("reports_rate_limit", 0.4)
+    out.setdefault("details_workers", 4)
+    out.setdefault("reports_workers", 4)
     # Optional; Tournaments Lambda uses default 1 if null (avoid JSONPath missing-key errors)
     if "tournaments_max_concurrency" not in out:
         out["tournaments_max_concurrency"] = None
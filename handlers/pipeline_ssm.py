@@ -24,6 +24,8 @@ PIPELINE_CONFIG_KEYS = (
     "tournaments_max_concurrency",
     "details_rate_limit",
     "reports_rate_limit",
+    "details_workers",
+    "reports_workers",
 )
 
 _ssm_client = None
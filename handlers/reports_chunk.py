@@ -20,6 +20,7 @@ Event shape:
 - save_raw: If true, save raw HTML to raw/reports/reports_chunk_{i}.html.gz (default: true)
 - details_path: Optional S3 URI to details chunk parquet for date inference.
 - reports_rate_limit: Requests per second to FIDE (default: 0.33; 0 = unlimited)
+- reports_workers: Concurrent fetch threads sharing one session (default: 4)
 
 Outputs: parquet, plus reports_chunk_{i}_verbose_sample.json and reports_chunk_{i}_games_sample.csv.
 When tournaments have no original report (page says "updated or replaced"), writes
@@ -46,6 +47,15 @@ def _rate_limit_req_s(event: dict, key: str, default: float) -> float:
     return f if f >= 0 else default
 
 
+def _workers(event: dict, key: str, default: int) -> int:
+    v = event.get(key, default)
+    try:
+        n = int(v)
+    except (TypeError, ValueError):
+        return default
+    return n if n >= 1 else default
+
+
 def _derive_sample_and_reports_paths(output_path: str) -> tuple[str, str, str | None]:
     """
     Derive sample JSON, CSV, and reports base from output_path.
@@ -75,6 +85,7 @@ def lambda_handler(event: dict, context) -> dict:
     save_raw = event.get("save_raw", True)
     details_path = event.get("details_path")
     rate_limit = _rate_limit_req_s(event, "reports_rate_limit", 0.33)
+    workers = _workers(event, "reports_workers", 4)
 
     if run_type not in ("prod", "custom", "test"):
         return {
@@ -158,6 +169,7 @@ def lambda_handler(event: dict, context) -> dict:
         output_sample_json=output_sample_json,
         output_sample_csv=output_sample_csv,
         output_reports_base=output_reports_base,
+        workers=workers,
     )
 
     if exit_code != 0:
@@ -206,6 +206,20 @@ def main() -> int:
         metavar="REQ_PER_S",
         help="Reports chunk: FIDE requests per second (omit to use SSM or pipeline default)",
     )
+    parser.add_argument(
+        "--details-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Details chunk: concurrent fetch threads (omit to use SSM or pipeline default)",
+    )
+    parser.add_argument(
+        "--reports-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Reports chunk: concurrent fetch threads (omit to use SSM or pipeline default)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -311,6 +325,10 @@ def main() -> int:
             input_dict["details_rate_limit"] = args.details_rate_limit
         if args.reports_rate_limit is not None:
             input_dict["reports_rate_limit"] = args.reports_rate_limit
+        if args.details_workers is not None:
+            input_dict["details_workers"] = args.details_workers
+        if args.reports_workers is not None:
+            input_dict["reports_workers"] = args.reports_workers
         try:
             resp = client.start_execution(
                 stateMachineArn=arn,
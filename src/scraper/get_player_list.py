@@ -12,6 +12,8 @@ import csv
 import gzip
 import io
 import logging
+import mmap
+import shutil
 import signal
 import sys
 import tempfile
@@ -20,14 +22,14 @@ import datetime
 import json
 import random
 import time
-import xml.etree.ElementTree as ET
 import zipfile
 from io import BytesIO
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import pandas as pd
 import requests
+from lxml import etree
 
 from s3_io import (
     build_player_lists_data_uri,
@@ -61,6 +63,11 @@ _shutdown_state = {}
 # Combined list STD, BLZ, RPD - XML format
 DOWNLOAD_URL = "https://ratings.fide.com/download/players_list_xml.zip"
 
+# Streamed zip download: socket read size, and how much of the zip stays in
+# memory before the spooled temp file rolls over to disk
+_DOWNLOAD_CHUNK = 1 << 20
+_ZIP_SPOOL_MAX = 8 * 1024 * 1024
+
 # Title normalization: single-letter -> full code
 TITLE_MAP = {
     "g": "GM",
@@ -81,8 +88,9 @@ WOMEN_TITLES = frozenset({"WGM", "WIM", "WFM", "WCM"})
 EXPECTED_TITLES = OPEN_TITLES | WOMEN_TITLES
 
 
-def _elem_text(elem: ET.Element | None, default: str = "") -> str:
-    return (elem.text or "").strip() if elem is not None else default
+def _normalize_title(raw: str) -> str:
+    """Map a raw XML title via TITLE_MAP (case-insensitive); "" stays ""."""
+    return TITLE_MAP.get(raw.lower(), raw) if raw else ""
 
 
 def _safe_int(value: str | None, allow_zero: bool = True) -> int | None:
@@ -95,23 +103,39 @@ def _safe_int(value: str | None, allow_zero: bool = True) -> int | None:
         return None
 
 
-def _sanitize_byear(value: int | None) -> int | None:
-    """Return byear if in valid range (1900..current_year), else None."""
+def _sanitize_byear(value: int | None, current_year: int | None = None) -> int | None:
+    """
+    Return byear if in valid range (1900..current_year), else None.
+
+    Pass current_year when calling per player so the clock is read once.
+    """
     if value is None:
         return None
-    current_year = datetime.datetime.now().year
+    if current_year is None:
+        current_year = datetime.datetime.now().year
     if 1900 <= value < current_year:
         return value
     return None
 
 
-def _local_tag(elem: ET.Element) -> str:
+def _local_tag(elem: etree._Element) -> str:
     """Return local tag name, stripping XML namespace if present."""
     tag = elem.tag
     return tag.split("}")[-1] if "}" in tag else tag
 
 
-def parse_xml_content(xml_bytes: bytes) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def _release_player(elem: etree._Element) -> None:
+    """Free a parsed <player> and its already-processed siblings."""
+    elem.clear(keep_tail=True)
+    parent = elem.getparent()
+    if parent is not None:
+        while elem.getprevious() is not None:
+            del parent[0]
+
+
+def parse_xml_content(
+    xml_bytes: bytes | mmap.mmap | IO[bytes],
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     """
     Parse XML into list of player dicts: byear, id, fed, name, sex, title, w_title.
 
@@ -124,7 +148,10 @@ def parse_xml_content(xml_bytes: bytes) -> tuple[list[dict[str, Any]], dict[str,
         - skipped_no_id: count of players skipped for missing/invalid fideid
         - byear_out_of_range: count of players with byear outside 1900..current_year
 
-    Uses iterparse (streaming) to avoid loading the full DOM into memory.
+    Accepts the XML as bytes, an mmap, or a binary file object. Uses lxml iterparse
+    (streaming) filtered to <player> end events in C; each player and its
+    processed siblings are freed as we go, so the tree never grows with the
+    list. Malformed XML raises lxml.etree.XMLSyntaxError.
     """
     current_year = datetime.datetime.now().year
     rows: list[dict[str, Any]] = []
@@ -139,40 +166,50 @@ def parse_xml_content(xml_bytes: bytes) -> tuple[list[dict[str, Any]], dict[str,
     title_w_title_to_ids: dict[tuple[str, str], list[int]] = {}
     players_with_multiple_titles = 0
     BYEAR_OUT_OF_RANGE_CAP = 100
+    # Raw title -> normalized; the list has only a handful of distinct values
+    title_norm: dict[str, str] = {}
+    # Raw country -> uppercase fed, likewise (~200 federations)
+    fed_upper: dict[str, str] = {}
 
-    context = ET.iterparse(BytesIO(xml_bytes), events=("end",))
+    source = (
+        BytesIO(xml_bytes) if isinstance(xml_bytes, (bytes, bytearray)) else xml_bytes
+    )
+    context = etree.iterparse(
+        source,
+        events=("end",),
+        tag="{*}player",
+        remove_comments=True,
+        remove_pis=True,
+        resolve_entities=False,
+    )
     for _event, elem in context:
-        if _local_tag(elem) != "player":
-            continue
+        # One pass over the children: local tag -> stripped text
+        fields = {_local_tag(c): (c.text or "").strip() for c in elem}
+        xml_fields.update(fields)
+        get = fields.get
 
-        children = {_local_tag(c): c for c in elem}
-        for tag in children:
-            xml_fields.add(tag)
-
-        fideid = _safe_int(_elem_text(children.get("fideid")))
+        fideid = _safe_int(get("fideid", ""))
         if fideid is None:
             skipped_no_id += 1
-            elem.clear()
+            _release_player(elem)
             continue
 
-        byear_raw = _safe_int(_elem_text(children.get("birthday")), allow_zero=False)
-        byear = _sanitize_byear(byear_raw)
+        byear_raw = _safe_int(get("birthday", ""), allow_zero=False)
+        byear = _sanitize_byear(byear_raw, current_year)
         if byear_raw is not None and byear is None:
             byear_out_of_range += 1
             if len(byear_out_of_range_data) < BYEAR_OUT_OF_RANGE_CAP:
                 byear_out_of_range_data.append((fideid, byear_raw))
 
-        title_raw = _elem_text(children.get("title"))
-        title_normalized = ""
-        if title_raw:
-            tit_lo = title_raw.lower()
-            title_normalized = TITLE_MAP.get(tit_lo, title_raw)
-        w_title_raw = _elem_text(children.get("w_title"))
-        w_title_normalized = ""
-        if w_title_raw:
-            wt_lo = w_title_raw.lower()
-            w_title_normalized = TITLE_MAP.get(wt_lo, w_title_raw)
-        o_title_raw = _elem_text(children.get("o_title"))
+        title_raw = get("title", "")
+        title_normalized = title_norm.get(title_raw)
+        if title_normalized is None:
+            title_normalized = title_norm[title_raw] = _normalize_title(title_raw)
+        w_title_raw = get("w_title", "")
+        w_title_normalized = title_norm.get(w_title_raw)
+        if w_title_normalized is None:
+            w_title_normalized = title_norm[w_title_raw] = _normalize_title(w_title_raw)
+        o_title_raw = get("o_title", "")
 
         if title_normalized:
             title_counter[title_normalized] += 1
@@ -198,23 +235,24 @@ def parse_xml_content(xml_bytes: bytes) -> tuple[list[dict[str, Any]], dict[str,
         elif title_normalized in WOMEN_TITLES:
             output_w_title = title_normalized
 
-        fed = _elem_text(children.get("country"))
-        if fed:
-            fed = fed.upper()
+        fed_raw = get("country", "")
+        fed = fed_upper.get(fed_raw)
+        if fed is None:
+            fed = fed_upper[fed_raw] = fed_raw.upper()
 
         rows.append(
             {
                 "byear": byear,
                 "id": fideid,
                 "fed": fed,
-                "name": _elem_text(children.get("name")) or None,
-                "sex": _elem_text(children.get("sex")) or None,
+                "name": get("name") or None,
+                "sex": get("sex") or None,
                 "title": output_title,
                 "w_title": output_w_title,
             }
         )
 
-        elem.clear()
+        _release_player(elem)
 
     parse_stats: dict[str, Any] = {
         "xml_fields_found": sorted(xml_fields),
@@ -280,28 +318,84 @@ def download_player_list(
     raise RuntimeError("Download failed")  # unreachable
 
 
-def process_zip(zip_bytes: bytes) -> list[dict[str, Any]]:
-    """Extract and parse the XML from the zip. Returns list of player dicts."""
-    players, _, _ = _process_zip_internal(zip_bytes)
+def download_player_list_to_file(
+    max_retries: int = 3,
+    retry_delay: float = 2.0,
+    session: requests.Session | None = None,
+) -> IO[bytes]:
+    """
+    Stream the FIDE players_list_xml.zip into a spooled temp file, with the same
+    retry logic as download_player_list.
+
+    The zip is copied from the socket in 1 MiB chunks; beyond _ZIP_SPOOL_MAX it
+    lives on disk, so the compressed archive never sits in RAM next to the
+    extracted XML. The caller owns (and should close) the returned file, which
+    is positioned at 0.
+    """
+    sess = session or requests.Session()
+    for attempt in range(max_retries):
+        spool = tempfile.SpooledTemporaryFile(max_size=_ZIP_SPOOL_MAX)
+        try:
+            with sess.get(DOWNLOAD_URL, timeout=120, stream=True) as resp:
+                resp.raise_for_status()
+                for chunk in resp.iter_content(chunk_size=_DOWNLOAD_CHUNK):
+                    spool.write(chunk)
+            spool.seek(0)
+            return spool
+        except requests.RequestException as e:
+            spool.close()
+            if attempt < max_retries - 1:
+                time.sleep(retry_delay * (attempt + 1))
+                continue
+            raise e
+    raise RuntimeError("Download failed")  # unreachable
+
+
+def process_zip(zip_src: bytes | IO[bytes]) -> list[dict[str, Any]]:
+    """
+    Extract and parse the XML from the zip (bytes or a seekable binary file).
+    Returns list of player dicts.
+    """
+    players, _, _ = _process_zip_internal(zip_src)
     return players
 
 
+def _extract_to_mmap(zf: zipfile.ZipFile, name: str) -> mmap.mmap | bytes:
+    """
+    Decompress one zip member into an anonymous temp file and map it read-only.
+
+    The ~200 MB XML then lives in the page cache rather than a bytes object on
+    the heap. The mapping stays valid after the temp file is closed. Returns
+    b"" for an empty member (a zero-length file cannot be mapped).
+    """
+    with zf.open(name) as src, tempfile.TemporaryFile() as tmp:
+        shutil.copyfileobj(src, tmp, _DOWNLOAD_CHUNK)
+        if tmp.tell() == 0:
+            return b""
+        tmp.flush()
+        return mmap.mmap(tmp.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def _process_zip_internal(
-    zip_bytes: bytes,
-) -> tuple[list[dict[str, Any]], dict[str, Any], bytes]:
-    """Extract and parse the XML. Returns (players, parse_stats, xml_content)."""
-    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zf:
+    zip_src: bytes | IO[bytes],
+) -> tuple[list[dict[str, Any]], dict[str, Any], mmap.mmap | bytes]:
+    """
+    Extract and parse the XML from zip bytes or a seekable binary file.
+    Returns (players, parse_stats, xml_content); xml_content is a read-only
+    mmap of the extracted XML (bytes-like, used for the gzip raw copy).
+    """
+    zip_file = BytesIO(zip_src) if isinstance(zip_src, (bytes, bytearray)) else zip_src
+    with zipfile.ZipFile(zip_file, "r") as zf:
         names = zf.namelist()
         xml_name = next((n for n in names if n.endswith(".xml")), names[0])
-        with zf.open(xml_name) as f:
-            xml_content = f.read()
+        xml_content = _extract_to_mmap(zf, xml_name)
     if not xml_content or len(xml_content) < 100:
         raise ValueError(
             "XML content is empty or too small; file may be corrupted or incomplete"
         )
     try:
         players, parse_stats = parse_xml_content(xml_content)
-    except ET.ParseError as e:
+    except etree.XMLSyntaxError as e:
         raise ValueError(f"XML parse failed (malformed XML): {e}") from e
     return players, parse_stats, xml_content
 
@@ -561,7 +655,7 @@ def build_report(
     return report
 
 
-def _compress_xml_gzip(xml_content: bytes, level: int = 9) -> bytes:
+def _compress_xml_gzip(xml_content: bytes | mmap.mmap, level: int = 9) -> bytes:
     """Compress XML with gzip. Level 9 gives ~5% of original for FIDE players_list.xml."""
     buf = io.BytesIO()
     with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=level) as z:
@@ -572,7 +666,7 @@ def _compress_xml_gzip(xml_content: bytes, level: int = 9) -> bytes:
 def _save_results(
     players: list[dict[str, Any]],
     parse_stats: dict[str, Any],
-    xml_content: bytes,
+    xml_content: bytes | mmap.mmap,
     parquet_path: str | Path,
     json_sample_path: str | Path,
     xml_path: str | Path,
@@ -724,8 +818,8 @@ def run_shared(
     start = time.time()
 
     try:
-        zip_bytes = download_player_list()
-        players, parse_stats, xml_content = _process_zip_internal(zip_bytes)
+        with download_player_list_to_file() as zip_file:
+            players, parse_stats, xml_content = _process_zip_internal(zip_file)
     except Exception as e:
         logger.error("Error: %s", e)
         raise RuntimeError(f"Player list download failed: {e}") from e
@@ -834,8 +928,8 @@ def run(
     start = time.time()
 
     try:
-        zip_bytes = download_player_list()
-        players, parse_stats, xml_content = _process_zip_internal(zip_bytes)
+        with download_player_list_to_file() as zip_file:
+            players, parse_stats, xml_content = _process_zip_internal(zip_file)
     except Exception as e:
         logger.error("Error: %s", e)
         return 1
@@ -1020,8 +1114,8 @@ def main() -> int:
     start = time.time()
 
     try:
-        zip_bytes = download_player_list()
-        players, parse_stats, xml_content = _process_zip_internal(zip_bytes)
+        with download_player_list_to_file() as zip_file:
+            players, parse_stats, xml_content = _process_zip_internal(zip_file)
     except Exception as e:
         logger.error("Error: %s", e)
         return 1
@@ -13,19 +13,25 @@ import json
 import logging
 import os
 import random
+import re
 import signal
 import sys
 import tempfile
+import threading
 import time
 from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import lxml.html
+import orjson
 import pandas as pd
+import pyarrow as pa
 import pyarrow.parquet as pq
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from tqdm import tqdm
 
 # Configure logging
@@ -39,24 +45,50 @@ logger = logging.getLogger(__name__)
 # State for graceful shutdown
 _shutdown_state = {}
 
+# tqdm refresh cadence: advance the bar every N results, redraw postfix every M
+_PBAR_UPDATE_EVERY = 10
+_PBAR_POSTFIX_EVERY = 50
+# --verbose status lines are written to stdout in batches of this many
+_VERBOSE_FLUSH_EVERY = 20
+
+# Transient connection failures worth retrying (matched against str(exception))
+_NETWORK_ERR_RE = re.compile(
+    r"eof|connection reset|connection aborted|remotedisconnected"
+    r"|remote end closed|broken pipe",
+    re.IGNORECASE,
+)
+
 
 class RateLimiter:
-    """Enforces minimum spacing between requests (no bursting)."""
+    """
+    Enforces minimum spacing between requests (no bursting). Thread-safe.
+
+    Uses the monotonic clock in integer nanoseconds. requests_per_second <= 0
+    disables limiting.
+    """
 
     def __init__(self, requests_per_second: float):
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request = 0.0
+        self.requests_per_second = requests_per_second
+        self._interval_ns = (
+            round(1e9 / requests_per_second) if requests_per_second > 0 else 0
+        )
+        self._next_ns = 0
+        self._lock = threading.Lock()
 
     def wait(self):
         """Wait until enough time has passed since the last request."""
-        now = time.perf_counter()
-        elapsed = now - self.last_request
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_request = time.perf_counter()
+        if not self._interval_ns:
+            return
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic_ns()
+            slot = max(now, self._next_ns)
+            self._next_ns = slot + self._interval_ns
+        if slot > now:
+            time.sleep((slot - now) / 1e9)
 
     def get_rate(self) -> float:
-        return 1.0 / self.min_interval
+        return self.requests_per_second
 
 
 # Optional S3 support (used by run() when paths are S3 URIs)
@@ -93,11 +125,15 @@ def _write_to_path(path: str, content: bytes | str) -> None:
 
         write_output(content, path)
     else:
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
         if isinstance(content, str):
-            p.write_text(content, encoding="utf-8")
-        else:
+            content = content.encode("utf-8")
+        p = Path(path)
+        # Create the directory only on the first write into it (checkpoints
+        # rewrite the same path many times per run)
+        try:
+            p.write_bytes(content)
+        except FileNotFoundError:
+            p.parent.mkdir(parents=True, exist_ok=True)
             p.write_bytes(content)
 
 
@@ -128,45 +164,124 @@ def format_duration(seconds: float) -> str:
 
 def read_tournament_ids(file_path: str) -> List[str]:
     """Read tournament IDs from a file."""
-    ids = []
-    with open(file_path, "r", encoding="utf-8") as f:
-        for line in f:
-            tid = line.strip()
-            if tid:
-                ids.append(tid)
-    return ids
+    text = Path(file_path).read_text(encoding="utf-8")
+    return [tid for line in text.splitlines() if (tid := line.strip())]
+
+
+# Compiled once at import; evaluated against lxml elements from the details page
+_DETAILS_TABLE_XPATH = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' details_table ')]"
+)
+_TEXT_OUTSIDE_LINKS_XPATH = etree.XPath(".//text()[not(ancestor::a)]")
+_FIRST_LINK_HREF_XPATH = etree.XPath("(.//a)[1]/@href")
+
+# Details-table labels -> JSON field names; rows with other labels are skipped
+FIELD_MAP = {
+    "Event code": "id",
+    "Tournament Name": "name",
+    "City": "city",
+    "Country": "fed",
+    "Number of players": "n_players",
+    "System": "system",
+    "Hybrid": "hybrid",
+    "Category": "category",
+    "Start Date": "start_date",
+    "End Date": "end_date",
+    "Date received": "date_received",
+    "Date registered": "date_registered",
+    "Type": "type",
+    "Time Control": "time_control",
+    "Zone": "zone",
+    "Nat. Championship": "nat_championship",
+}
+
+# HTTP statuses that will not change on retry (bad or unknown event id)
+_PERMANENT_HTTP_STATUSES = frozenset({400, 404, 410})
+
+# Cap on HTTP attempts per tournament across all retry passes
+MAX_ATTEMPTS_PER_TOURNAMENT = 5
+
+# Static per-request headers, built once
+_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Every key a details dict can hold; fetch starts from dict.fromkeys(_DETAILS_SLOTS)
+_DETAILS_SLOTS = tuple(FIELD_MAP.values())
+
+
+def _has_class(element, class_name: str) -> bool:
+    """True if the element's class attribute contains class_name."""
+    return class_name in (element.get("class") or "").split()
+
+
+def _stripped_text(element) -> str:
+    """Concatenate stripped text nodes under element (like bs4 get_text(strip=True))."""
+    return "".join(t.strip() for t in element.itertext())
+
+
+def _slice_details_table(content: bytes) -> Optional[bytes]:
+    """
+    Cut the details_table markup out of a page with byte searches.
+
+    Returns None (caller parses the whole page) if the markers are missing or
+    the table contains a nested table, where the first </table> is not its end.
+    """
+    idx = content.find(b"details_table")
+    if idx < 0:
+        return None
+    start = content.rfind(b"<table", 0, idx)
+    end = content.find(b"</table>", idx)
+    if start < 0 or end < 0 or content.find(b"<table", idx, end) >= 0:
+        return None
+    return content[start : end + len(b"</table>")]
+
+
+def find_details_table(content: bytes):
+    """Parse a details page and return its details_table element, or None."""
+    if not content or not content.strip():
+        return None
+    fragment = _slice_details_table(content)
+    if fragment is not None:
+        # The slice loses the page's <meta charset>; FIDE serves UTF-8
+        tables = _DETAILS_TABLE_XPATH(
+            lxml.html.fromstring(fragment.decode("utf-8", errors="replace"))
+        )
+        if tables:
+            return tables[0]
+    tables = _DETAILS_TABLE_XPATH(lxml.html.fromstring(content))
+    return tables[0] if tables else None
 
 
 def extract_text_from_cell(cell) -> str:
     """Extract text from a table cell, handling links properly."""
-    links = cell.find_all("a")
+    links = list(cell.iter("a"))
     if not links:
-        return cell.get_text(strip=True)
+        return _stripped_text(cell)
 
     parts = []
     for link in links:
-        text = link.get_text(strip=True)
+        text = _stripped_text(link)
         if text:
             parts.append(text)
 
-    # Get remaining text after removing links
-    cell_copy = cell.__copy__()
-    for link in cell_copy.find_all("a"):
-        link.decompose()
-    remaining = cell_copy.get_text(strip=True)
+    # Remaining text outside links
+    remaining = "".join(t.strip() for t in _TEXT_OUTSIDE_LINKS_XPATH(cell))
     if remaining:
         parts.append(remaining)
 
     if not parts:
-        return cell.get_text(strip=True)
+        return _stripped_text(cell)
     return " ".join(parts)
 
 
 def extract_links_from_cell(cell) -> List[str]:
     """Extract link texts from a table cell."""
     links = []
-    for link in cell.find_all("a"):
-        text = link.get_text(strip=True)
+    for link in cell.iter("a"):
+        text = _stripped_text(link)
         if text:
             links.append(text)
     return links
@@ -174,10 +289,8 @@ def extract_links_from_cell(cell) -> List[str]:
 
 def extract_link_href(cell) -> str:
     """Extract href from first link in a table cell."""
-    link = cell.find("a")
-    if link and link.get("href"):
-        return link.get("href")
-    return ""
+    hrefs = _FIRST_LINK_HREF_XPATH(cell)
+    return str(hrefs[0]) if hrefs else ""
 
 
 def parse_time_control(raw: str) -> tuple[str, bool]:
@@ -218,6 +331,12 @@ def parse_date(raw: str) -> Optional[datetime]:
     if not raw or not str(raw).strip():
         return None
     s = str(raw).strip()
+    # FIDE details pages use YYYY-MM-DD; fromisoformat is much cheaper than strptime
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d", "%d.%m.%Y", "%d/%m/%Y", "%Y/%m/%d"):
         try:
             return datetime.strptime(s, fmt)
@@ -252,7 +371,8 @@ def fetch_tournament_details(
 
     max_retries = 3
     last_error = None
-    attempt_times: List[float] = []
+    num_attempts = 0
+    last_duration = 0.0
 
     for attempt in range(max_retries):
         if attempt > 0:
@@ -267,20 +387,14 @@ def fetch_tournament_details(
             time.sleep(delay)
 
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Cache-Control": "max-age=0",
-            }
-
             t0 = time.perf_counter()
             try:
                 # Connect 15s, read 45s (match reports; fail connect fast for all-or-nothing)
-                response = session.get(url, headers=headers, timeout=(15, 45))
+                response = session.get(url, headers=_REQUEST_HEADERS, timeout=(15, 45))
             finally:
                 elapsed = time.perf_counter() - t0
-                attempt_times.append(elapsed)
+                num_attempts += 1
+                last_duration = elapsed
                 if elapsed > 10:
                     logger.warning(
                         "Slow details fetch: tournament_id=%s took %.1fs (attempt %d)",
@@ -303,59 +417,39 @@ def fetch_tournament_details(
                             "tournament_id": tournament_id,
                             "attempt": attempt + 1,
                             "error": last_error,
-                            "duration_s": attempt_times[-1] if attempt_times else 0,
+                            "duration_s": last_duration,
                         }
                     )
+                if response.status_code in _PERMANENT_HTTP_STATUSES:
+                    return None, last_error, num_attempts, None
                 continue
 
             raw_content = response.content if return_raw else None
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            details_table = soup.find("table", class_="details_table")
-            if not details_table:
-                return None, "no data found", len(attempt_times), None
+            details_table = find_details_table(response.content)
+            if details_table is None:
+                return None, "no data found", num_attempts, None
 
-            details = {}
+            # Pre-sized with every field; unset (None) slots are dropped below
+            details = dict.fromkeys(_DETAILS_SLOTS)
 
-            for row in details_table.find_all("tr"):
-                label_cell = row.find("td", class_="info_table_l")
-                value_cells = row.find_all("td")
+            for row in details_table.iter("tr"):
+                value_cells = list(row.iter("td"))
+                label_cell = next(
+                    (td for td in value_cells if _has_class(td, "info_table_l")), None
+                )
 
-                if not label_cell or len(value_cells) < 2:
+                if label_cell is None or len(value_cells) < 2:
                     continue
 
-                value_cell = value_cells[1]
-                label = label_cell.get_text(strip=True)
-                value = extract_text_from_cell(value_cell)
-
-                # Map labels to JSON field names
-                field_map = {
-                    "Event code": "id",
-                    "Tournament Name": "name",
-                    "City": "city",
-                    "Country": "fed",
-                    "Number of players": "n_players",
-                    "System": "system",
-                    "Hybrid": "hybrid",
-                    "Category": "category",
-                    "Start Date": "start_date",
-                    "End Date": "end_date",
-                    "Date received": "date_received",
-                    "Date registered": "date_registered",
-                    "Type": "type",
-                    "Time Control": "time_control",
-                    "Zone": "zone",
-                    "Nat. Championship": "nat_championship",
-                }
-
-                if label in field_map:
-                    details[field_map[label]] = value
+                key = FIELD_MAP.get(_stripped_text(label_cell))
+                if key is not None:
+                    details[key] = extract_text_from_cell(value_cells[1])
 
             # Remove empty fields
             return (
                 {k: v for k, v in details.items() if v},
                 None,
-                len(attempt_times),
+                num_attempts,
                 raw_content,
             )
 
@@ -373,7 +467,7 @@ def fetch_tournament_details(
                         "tournament_id": tournament_id,
                         "attempt": attempt + 1,
                         "error": last_error,
-                        "duration_s": attempt_times[-1] if attempt_times else 0,
+                        "duration_s": last_duration,
                     }
                 )
             # Connect timeout = all-or-nothing per Lambda; retries don't help
@@ -381,19 +475,8 @@ def fetch_tournament_details(
                 break
             continue
         except requests.exceptions.ConnectionError as e:
-            error_str = str(e).lower()
             # Check for various connection error patterns that should be retried
-            if any(
-                pattern in error_str
-                for pattern in [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-            ):
+            if _NETWORK_ERR_RE.search(str(e)):
                 last_error = f"network error: {e}"
                 logger.warning(
                     "Details fetch connection error: tournament_id=%s (attempt %d): %s",
@@ -407,7 +490,7 @@ def fetch_tournament_details(
                             "tournament_id": tournament_id,
                             "attempt": attempt + 1,
                             "error": last_error,
-                            "duration_s": attempt_times[-1] if attempt_times else 0,
+                            "duration_s": last_duration,
                         }
                     )
                 continue
@@ -417,21 +500,10 @@ def fetch_tournament_details(
                 tournament_id,
                 e,
             )
-            return None, last_error, len(attempt_times), None
+            return None, last_error, num_attempts, None
         except requests.exceptions.RequestException as e:
-            error_str = str(e).lower()
             # Check for various connection error patterns that should be retried
-            if any(
-                pattern in error_str
-                for pattern in [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-            ):
+            if _NETWORK_ERR_RE.search(str(e)):
                 last_error = f"network error: {e}"
                 logger.warning(
                     "Details fetch RequestException: tournament_id=%s (attempt %d): %s",
@@ -445,7 +517,7 @@ def fetch_tournament_details(
                             "tournament_id": tournament_id,
                             "attempt": attempt + 1,
                             "error": last_error,
-                            "duration_s": attempt_times[-1] if attempt_times else 0,
+                            "duration_s": last_duration,
                         }
                     )
                 continue
@@ -455,7 +527,7 @@ def fetch_tournament_details(
                 tournament_id,
                 e,
             )
-            return None, last_error, len(attempt_times), None
+            return None, last_error, num_attempts, None
         except Exception as e:
             last_error = f"parse error: {e}"
             logger.warning(
@@ -470,12 +542,86 @@ def fetch_tournament_details(
                         "tournament_id": tournament_id,
                         "attempt": attempt + 1,
                         "error": last_error,
-                        "duration_s": attempt_times[-1] if attempt_times else 0,
+                        "duration_s": last_duration,
                     }
                 )
             continue
 
-    return None, f"max retries exceeded: {last_error}", len(attempt_times), None
+    return None, f"max retries exceeded: {last_error}", num_attempts, None
+
+
+def create_session(workers: int = 1) -> requests.Session:
+    """
+    Session for details fetches. Keep-alive reuses the TCP+TLS connection to
+    FIDE; the single-host pool holds one connection per worker thread.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=max(workers, 1), max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def iter_fetches(
+    tournament_ids: List[str],
+    session: requests.Session,
+    rate_limiter: RateLimiter,
+    workers: int = 1,
+    **fetch_kwargs,
+):
+    """
+    Yield (tournament_id, fetch_tournament_details result) as fetches complete.
+
+    With workers > 1, fetches run on a thread pool sharing one session (keep-alive
+    pool) and rate limiter. At most 2 * workers fetches are queued at a time, so
+    an aborted run leaves little work in flight.
+    """
+
+    def _fetch(tid: str):
+        rate_limiter.wait()
+        return fetch_tournament_details(tid, session, **fetch_kwargs)
+
+    if workers <= 1:
+        for tid in tournament_ids:
+            yield tid, _fetch(tid)
+        return
+
+    ids = iter(tournament_ids)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = {}
+        for tid in ids:
+            pending[executor.submit(_fetch, tid)] = tid
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                tid = pending.pop(future)
+                next_tid = next(ids, None)
+                if next_tid is not None:
+                    pending[executor.submit(_fetch, next_tid)] = next_tid
+                yield tid, future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+# flatten_result() output fields (besides tournament_id/success/error)
+_STRING_FIELDS = (
+    "id",
+    "name",
+    "city",
+    "fed",
+    "system",
+    "hybrid",
+    "category",
+    "type",
+    "zone",
+)
+_DATE_FIELDS = ("start_date", "end_date", "date_received", "date_registered")
+_EMPTY_STRING_FIELDS = dict.fromkeys(_STRING_FIELDS, "")
 
 
 def flatten_result(result: Dict) -> Dict:
@@ -486,36 +632,26 @@ def flatten_result(result: Dict) -> Dict:
         "error": result.get("error", ""),
     }
 
-    details = result.get("details", {})
+    details = result.get("details")
     if details:
-        # Simple string fields
-        for field in [
-            "id",
-            "name",
-            "city",
-            "fed",
-            "system",
-            "hybrid",
-            "category",
-            "type",
-            "zone",
-        ]:
-            flattened[field] = details.get(field, "")
+        # Simple string fields: "" unless present
+        flattened.update(_EMPTY_STRING_FIELDS)
+        for field in _STRING_FIELDS:
+            value = details.get(field)
+            if value:
+                flattened[field] = value
 
         # n_players: int, None if invalid
-        n_players_val, _ = parse_n_players(details.get("n_players", ""))
-        flattened["n_players"] = n_players_val
+        flattened["n_players"], _ = parse_n_players(details.get("n_players", ""))
 
         # time_control: S/R/B from first word
-        tc_raw = details.get("time_control", "")
-        tc_code, _ = parse_time_control(tc_raw)
-        flattened["time_control"] = tc_code
+        flattened["time_control"], _ = parse_time_control(
+            details.get("time_control", "")
+        )
 
         # Dates: datetime or None
-        for field in ["start_date", "end_date", "date_received", "date_registered"]:
-            raw = details.get(field, "")
-            parsed = parse_date(raw)
-            flattened[field] = parsed
+        for field in _DATE_FIELDS:
+            flattened[field] = parse_date(details.get(field, ""))
 
         # nat_championship: bool (true if non-null)
         flattened["nat_championship"] = parse_nat_championship(
@@ -633,21 +769,92 @@ def save_time_control_unique_values(results: List[Dict], output_path: str):
 _NULLABLE_NUMERIC_COLS = ("n_players",)
 
 
-def save_results_parquet(results: List[Dict], parquet_path: str) -> None:
-    """Save results as Parquet file (local or S3)."""
+def save_results_parquet(
+    results: List[Dict], parquet_path: str, flat_rows: Optional[List[Dict]] = None
+) -> None:
+    """
+    Save results as Parquet file (local or S3).
+
+    flat_rows: flatten_result() output for results, if the caller already has it.
+    """
     try:
-        df = results_to_dataframe(results)
+        if flat_rows is not None:
+            df = pd.DataFrame(flat_rows)
+        else:
+            df = results_to_dataframe(results)
         for col in _NULLABLE_NUMERIC_COLS:
             if col in df.columns:
                 df[col] = df[col].astype("float64")
         buf = io.BytesIO()
-        df.to_parquet(buf, index=False, engine="pyarrow")
+        df.to_parquet(
+            buf,
+            index=False,
+            engine="pyarrow",
+            compression="zstd",
+            compression_level=3,
+        )
         _write_to_path(parquet_path, buf.getvalue())
         logger.info(f"Saved {len(results)} records to {parquet_path}")
     except Exception as e:
         logger.error(f"Parquet save failed: {e}")
 
 
+# Column types of flatten_result() output, for building Arrow batches directly
+_PARQUET_SCHEMA = pa.schema(
+    [("tournament_id", pa.string()), ("success", pa.bool_()), ("error", pa.string())]
+    + [
+        (field, pa.string())
+        for field in [
+            "id",
+            "name",
+            "city",
+            "fed",
+            "system",
+            "hybrid",
+            "category",
+            "type",
+            "zone",
+        ]
+    ]
+    + [("n_players", pa.float64()), ("time_control", pa.string())]
+    + [
+        (field, pa.timestamp("us"))
+        for field in ["start_date", "end_date", "date_received", "date_registered"]
+    ]
+    + [("nat_championship", pa.bool_())]
+)
+
+
+class ParquetCheckpoint:
+    """
+    Incremental Parquet checkpoint for a growing list of flattened results.
+
+    Rows are converted into an Arrow batch once, the first time a checkpoint
+    sees them; later checkpoints only convert the new tail and concatenate the
+    cached batches, so checkpointing stays linear over a run. Each write is a
+    complete Parquet file, so the checkpoint is readable after every save.
+    """
+
+    def __init__(self):
+        self._batches: List[pa.RecordBatch] = []
+        self._seen = 0
+
+    def write(self, flat_rows: List[Dict], parquet_path: str) -> None:
+        """Convert rows not yet seen and write all rows to parquet_path."""
+        if len(flat_rows) > self._seen:
+            self._batches.append(
+                pa.RecordBatch.from_pylist(
+                    flat_rows[self._seen :], schema=_PARQUET_SCHEMA
+                )
+            )
+            self._seen = len(flat_rows)
+        table = pa.Table.from_batches(self._batches, schema=_PARQUET_SCHEMA)
+        buf = io.BytesIO()
+        pq.write_table(table, buf, compression="zstd", compression_level=3)
+        _write_to_path(parquet_path, buf.getvalue())
+        logger.info(f"Saved {table.num_rows} records to {parquet_path}")
+
+
 def save_results_json_sample(
     results: List[Dict], json_path: str, sample_size: int = 100
 ) -> None:
@@ -661,7 +868,12 @@ def save_results_json_sample(
             successful_results, min(sample_size, len(successful_results))
         )
         flattened = [flatten_result(r) for r in sample]
-        content = json.dumps(flattened, indent=2, ensure_ascii=False, default=str)
+        # Datetimes go through default=str to keep the stdlib json text format
+        content = orjson.dumps(
+            flattened,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
         _write_to_path(json_path, content)
         logger.info(f"Saved random sample of {len(flattened)} records to {json_path}")
     except Exception as e:
@@ -687,19 +899,23 @@ def build_and_save_report(
     results: List[Dict],
     parquet_path: str,
     report_base: str | None = None,
+    flat_rows: Optional[List[Dict]] = None,
 ) -> None:
     """
     Build report (n_tournaments, distributions, nulls) and write time_control
     unique values to a separate file.
     If report_base is provided, use it for report_path and time_control_path;
-    otherwise derive from parquet_path.
+    otherwise derive from parquet_path. flat_rows: pre-flattened results.
     """
     successful = [r for r in results if r.get("success", False)]
     if not successful:
         logger.warning("No successful results for report")
         return
 
-    df = results_to_dataframe(successful)
+    if flat_rows is not None:
+        df = pd.DataFrame([row for row in flat_rows if row["success"]])
+    else:
+        df = results_to_dataframe(successful)
     detail_cols = [
         "id",
         "name",
@@ -829,6 +1045,7 @@ def run(
     output_sample_path: str | None = None,
     output_reports_base: str | None = None,
     save_raw: bool = True,
+    workers: int = 4,
 ) -> int:
     """
     Scrape tournament details for IDs from input_path, write to output_path.
@@ -846,6 +1063,7 @@ def run(
             Default: output_path base. Used for _report.json, _failures.json,
             _time_control_unique_values.txt.
         save_raw: If True, save raw HTML per tournament to raw/details/{chunk}/{id}.html.gz.
+        workers: Concurrent fetch threads (requests are still paced by rate_limit).
 
     Returns:
         0 on success, 1 on failure.
@@ -885,20 +1103,22 @@ def run(
         parquet_path,
     )
 
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(
-        pool_connections=1, pool_maxsize=1, max_retries=0
-    )
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    session = create_session(workers)
     rate_limiter = RateLimiter(rate_limit)
 
     raw_base: Optional[str] = (
         _raw_base_from_output_path(output_path) if save_raw else None
     )
-    raw_accumulator: List[Tuple[str, bytes]] = []  # (tournament_id, html)
+    raw_writer = None
+    if raw_base:
+        from raw_utils import ConcatenatedGzipWriter
+
+        # Compress raw HTML as it arrives instead of holding every page in memory
+        raw_writer = ConcatenatedGzipWriter()
 
     all_results: List[Dict] = []
+    all_flat: List[Dict] = []  # flatten_result() of each entry, built once
+    checkpointer = ParquetCheckpoint()
     success_count = 0
     error_count = 0
     total_retries = 0
@@ -913,6 +1133,8 @@ def run(
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
         )
 
+    pbar_pending = 0
+    attempts_by_id: Dict[str, int] = {}
     start_time = time.time()
     consecutive_connect_timeouts = 0
     CONSECUTIVE_CONNECT_TIMEOUT_THRESHOLD = 2
@@ -933,12 +1155,17 @@ def run(
             consecutive_connect_timeouts = 0  # reset on new pass
 
         pass_failed = []
-        for tournament_id in current_tournaments:
-            rate_limiter.wait()
-            details, error, _, raw_content = fetch_tournament_details(
-                tournament_id, session, return_raw=save_raw
+        for tournament_id, (details, error, num_attempts, raw_content) in iter_fetches(
+            current_tournaments,
+            session,
+            rate_limiter,
+            workers,
+            return_raw=save_raw,
+        ):
+
+            attempts_by_id[tournament_id] = (
+                attempts_by_id.get(tournament_id, 0) + num_attempts
             )
-
             result = {"tournament_id": tournament_id}
             if details is None:
                 logger.warning(
@@ -965,19 +1192,12 @@ def run(
                         ) from None
                 else:
                     consecutive_connect_timeouts = 0
-                network_error_patterns = [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-                is_network_error = any(p in error_lower for p in network_error_patterns)
+                is_network_error = bool(_NETWORK_ERR_RE.search(error or ""))
                 if (
                     error
                     and (is_network_error or "timeout" in error_lower)
                     and pass_num < max_retries
+                    and attempts_by_id[tournament_id] < MAX_ATTEMPTS_PER_TOURNAMENT
                 ):
                     pass_failed.append(tournament_id)
             else:
@@ -985,36 +1205,49 @@ def run(
                 success_count += 1
                 result["success"] = True
                 result["details"] = details
-                if raw_base and raw_content:
-                    raw_accumulator.append((tournament_id, raw_content))
+                if raw_writer and raw_content:
+                    raw_writer.add(tournament_id, raw_content)
                 if checkpoint > 0 and success_count % checkpoint == 0:
-                    save_checkpoint(parquet_path, all_results, base + ".checkpoint")
+                    save_checkpoint(
+                        parquet_path,
+                        all_results,
+                        base + ".checkpoint",
+                        checkpointer,
+                        all_flat,
+                    )
 
             all_results.append(result)
+            all_flat.append(flatten_result(result))
             if pbar:
-                pbar.update(1)
-                pbar.set_postfix({"✓": success_count, "✗": error_count})
+                pbar_pending += 1
+                if pbar_pending >= _PBAR_UPDATE_EVERY:
+                    pbar.update(pbar_pending)
+                    pbar_pending = 0
+                    if (success_count + error_count) % _PBAR_POSTFIX_EVERY == 0:
+                        pbar.set_postfix({"✓": success_count, "✗": error_count})
 
         current_tournaments = pass_failed
 
     if pbar:
+        pbar.update(pbar_pending)
+        pbar.set_postfix({"✓": success_count, "✗": error_count})
         pbar.close()
 
-    if raw_base and raw_accumulator:
-        from raw_utils import build_concatenated_gzip
-
+    if raw_writer and raw_writer.count:
         raw_path = raw_base + ".html.gz"
-        _write_to_path(raw_path, build_concatenated_gzip(raw_accumulator))
+        _write_to_path(raw_path, raw_writer.getvalue())
         logger.info(
             "Saved concatenated raw HTML (%d tournaments) to %s",
-            len(raw_accumulator),
+            raw_writer.count,
             raw_path,
         )
 
-    save_results_parquet(all_results, parquet_path)
+    save_results_parquet(all_results, parquet_path, all_flat)
     save_results_json_sample(all_results, json_path, sample_size=100)
     if success_count > 0:
-        build_and_save_report(all_results, parquet_path, report_base=reports_base)
+        build_and_save_report(
+            all_results, parquet_path, report_base=reports_base, flat_rows=all_flat
+        )
     save_failures_json(all_results, reports_base)
 
     elapsed = time.time() - start_time
@@ -1028,9 +1261,18 @@ def run(
 
 
 def save_checkpoint(
-    output_path: str, results: List[Dict], checkpoint_path: Optional[str] = None
+    output_path: str,
+    results: List[Dict],
+    checkpoint_path: Optional[str] = None,
+    checkpointer: Optional[ParquetCheckpoint] = None,
+    flat_rows: Optional[List[Dict]] = None,
 ):
-    """Save checkpoint file as Parquet."""
+    """
+    Save checkpoint file as Parquet.
+
+    With checkpointer and flat_rows (flatten_result() output kept alongside
+    results), only rows added since the last checkpoint are converted.
+    """
     if not output_path or not checkpoint_path:
         return
 
@@ -1047,7 +1289,10 @@ def save_checkpoint(
         else:
             parquet_checkpoint = checkpoint_path + ".parquet"
 
-        save_results_parquet(results, parquet_checkpoint)
+        if checkpointer is not None and flat_rows is not None:
+            checkpointer.write(flat_rows, parquet_checkpoint)
+        else:
+            save_results_parquet(results, parquet_checkpoint, flat_rows)
     except Exception as e:
         logger.error(f"Checkpoint save failed: {e}")
 
@@ -1097,6 +1342,12 @@ def main():
     parser.add_argument(
         "--max-retries", type=int, default=3, help="Max retry passes (default: 3)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent fetch threads; requests are still paced by --rate-limit (default: 4)",
+    )
     parser.add_argument(
         "--checkpoint",
         type=int,
@@ -1248,29 +1499,37 @@ def main():
 
     start_time = time.time()
 
-    # Create HTTP session with connection reuse disabled
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(
-        pool_connections=1, pool_maxsize=1, max_retries=0
-    )
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    session = create_session(args.workers)
 
     rate_limiter = RateLimiter(args.rate_limit)
 
     all_results = []
+    all_flat = []  # flatten_result() of each entry, built once
+    checkpointer = ParquetCheckpoint()
     success_count = 0
     error_count = 0
 
+    verbose_lines: List[str] = []
+
+    def _flush_verbose():
+        if verbose_lines:
+            sys.stdout.write("\n".join(verbose_lines) + "\n")
+            sys.stdout.flush()
+            verbose_lines.clear()
+
     def _graceful_shutdown(signum, frame):
+        _flush_verbose()
         logger.warning("\nReceived interrupt, initiating graceful shutdown...")
         if all_results and parquet_path:
             try:
-                save_results_parquet(all_results, parquet_path)
+                save_results_parquet(all_results, parquet_path, all_flat)
                 if json_path:
                     save_results_json_sample(all_results, json_path, sample_size=100)
                 build_and_save_report(
-                    all_results, parquet_path, report_base=report_base
+                    all_results,
+                    parquet_path,
+                    report_base=report_base,
+                    flat_rows=all_flat,
                 )
                 save_failures_json(
                     all_results,
@@ -1296,6 +1555,7 @@ def main():
     attempt_counts: List[Tuple[str, int]] = (
         [] if args.verbose_errors else []
     )  # (tid, n) in order
+    attempts_by_id: Dict[str, int] = {}  # HTTP attempts summed over passes
 
     current_tournaments = tournament_ids
 
@@ -1308,6 +1568,7 @@ def main():
             unit="tournament",
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
         )
+    pbar_pending = 0
 
     for pass_num in range(args.max_retries + 1):
         if not current_tournaments:
@@ -1324,16 +1585,18 @@ def main():
 
         pass_failed = []
 
-        for tournament_id in current_tournaments:
-            rate_limiter.wait()
-
-            details, error, num_attempts, _ = fetch_tournament_details(
-                tournament_id,
-                session,
-                _attempt_log=attempt_log if args.verbose_errors else None,
-            )
+        for tournament_id, (details, error, num_attempts, _) in iter_fetches(
+            current_tournaments,
+            session,
+            rate_limiter,
+            args.workers,
+            _attempt_log=attempt_log if args.verbose_errors else None,
+        ):
             if args.verbose_errors:
                 attempt_counts.append((tournament_id, num_attempts))
+            attempts_by_id[tournament_id] = (
+                attempts_by_id.get(tournament_id, 0) + num_attempts
+            )
 
             result = {"tournament_id": tournament_id}
 
@@ -1344,21 +1607,14 @@ def main():
 
                 # Check if it's a rate limit/network error
                 error_lower = error.lower() if error else ""
-                network_error_patterns = [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-                is_network_error = any(
-                    pattern in error_lower for pattern in network_error_patterns
-                )
+                is_network_error = bool(_NETWORK_ERR_RE.search(error or ""))
 
-                # Retry on network errors and timeouts
+                # Retry on network errors and timeouts, within the attempt cap
                 if error and (is_network_error or "timeout" in error_lower):
-                    if pass_num < args.max_retries:
+                    if (
+                        pass_num < args.max_retries
+                        and attempts_by_id[tournament_id] < MAX_ATTEMPTS_PER_TOURNAMENT
+                    ):
                         pass_failed.append(tournament_id)
             else:
                 success_count += 1
@@ -1371,8 +1627,15 @@ def main():
                         parquet_path + ".checkpoint" if parquet_path else None
                     )
                     logger.info(f"Saving checkpoint at {success_count} successful...")
-                    save_checkpoint(parquet_path, all_results, checkpoint_path)
+                    save_checkpoint(
+                        parquet_path,
+                        all_results,
+                        checkpoint_path,
+                        checkpointer,
+                        all_flat,
+                    )
             all_results.append(result)
+            all_flat.append(flatten_result(result))
 
             total_processed = success_count + error_count
             elapsed = time.time() - start_time
@@ -1395,7 +1658,7 @@ def main():
                     http_retries = (
                         f" [{num_attempts} HTTP attempts]" if num_attempts > 1 else ""
                     )
-                    print(
+                    verbose_lines.append(
                         f"[{total_processed}/{len(tournament_ids)}] ✓ {tournament_id}: {name}{retry_info}{http_retries} | "
                         f"Rate: {rate:.2f}/s (actual: {actual_rate:.2f}/s) | "
                         f"Elapsed: {format_duration(elapsed)} | Est: {format_duration(est_remaining)} | "
@@ -1410,37 +1673,21 @@ def main():
                     )
                     retry_status = " [WILL RETRY]" if will_retry else " [FINAL FAILURE]"
 
-                    print(
+                    verbose_lines.append(
                         f"[{total_processed}/{len(tournament_ids)}] ✗ {tournament_id}: {error_msg}{retry_info}{http_retries}{retry_status} | "
                         f"Rate: {rate:.2f}/s (actual: {actual_rate:.2f}/s) | "
                         f"Elapsed: {format_duration(elapsed)} | Est: {format_duration(est_remaining)} | "
                         f"Success: {success_count} | Errors: {error_count} | Retries: {total_retries}"
                     )
+                if len(verbose_lines) >= _VERBOSE_FLUSH_EVERY:
+                    _flush_verbose()
             else:
-                # Progress bar mode
-                # Build postfix with retry info
-                postfix_dict = {
-                    "✓": success_count,
-                    "✗": error_count,
-                    "rate": f"{rate_limiter.get_rate():.2f}/s",
-                }
-
-                # Add retry information
-                if total_retries > 0 or pass_num > 0:
-                    postfix_dict["retries"] = total_retries
-                if pass_num > 0:
-                    postfix_dict["pass"] = f"{pass_num + 1}/{args.max_retries + 1}"
-                if len(pass_failed) > 0:
-                    postfix_dict["pending"] = len(pass_failed)
-
-                postfix_dict["est"] = (
-                    format_duration(est_remaining) if est_remaining > 0 else "?"
-                )
-
-                # Update progress bar
+                # Progress bar mode: advance in batches to keep tqdm redraws cheap
                 if pbar:
-                    pbar.update(1)
-                    pbar.set_postfix(postfix_dict)
+                    pbar_pending += 1
+                    if pbar_pending >= _PBAR_UPDATE_EVERY:
+                        pbar.update(pbar_pending)
+                        pbar_pending = 0
 
                 if args.show_time:
                     rate = rate_limiter.get_rate()
@@ -1462,6 +1709,23 @@ def main():
             ):
                 actual_rate = total_processed / elapsed if elapsed > 0 else 0
                 target_rate = rate_limiter.get_rate()
+                if pbar:
+                    # Build postfix with retry info
+                    postfix_dict = {
+                        "✓": success_count,
+                        "✗": error_count,
+                        "rate": f"{target_rate:.2f}/s",
+                    }
+                    if total_retries > 0 or pass_num > 0:
+                        postfix_dict["retries"] = total_retries
+                    if pass_num > 0:
+                        postfix_dict["pass"] = f"{pass_num + 1}/{args.max_retries + 1}"
+                    if len(pass_failed) > 0:
+                        postfix_dict["pending"] = len(pass_failed)
+                    postfix_dict["est"] = (
+                        format_duration(est_remaining) if est_remaining > 0 else "?"
+                    )
+                    pbar.set_postfix(postfix_dict)
                 logger.info(
                     f"Progress: {total_processed}/{len(tournament_ids)} "
                     f"({success_count}✓ {error_count}✗) | "
@@ -1469,22 +1733,26 @@ def main():
                     f"Elapsed: {format_duration(elapsed)} | Est: {format_duration(est_remaining)}"
                 )
 
+        _flush_verbose()  # before any retry-pass backoff
         current_tournaments = pass_failed
 
     if pbar:
+        pbar.update(pbar_pending)
         pbar.close()
 
     # Save final results
     if parquet_path:
         # Save all results as Parquet
-        save_results_parquet(all_results, parquet_path)
+        save_results_parquet(all_results, parquet_path, all_flat)
 
         # Save random sample of 100 successful results as JSON
         if json_path:
             save_results_json_sample(all_results, json_path, sample_size=100)
 
         # Build and save report (distributions, nulls, time_control unique values)
-        build_and_save_report(all_results, parquet_path, report_base=report_base)
+        build_and_save_report(
+            all_results, parquet_path, report_base=report_base, flat_rows=all_flat
+        )
         # Save failures for investigation
         save_failures_json(
             all_results,
@@ -9,9 +9,10 @@ Supports rate limiting, retries, checkpoints, and progress tracking.
 
 import argparse
 import copy
+import functools
 import gzip
 import io
-import json
+import itertools
 import logging
 import os
 import random
@@ -19,16 +20,29 @@ import re
 import signal
 import sys
 import tempfile
+import threading
 import time
 from collections import Counter
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+import lxml.html
+import orjson
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -38,22 +52,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fetch errors worth another pass: dropped connections and timeouts
+_RETRYABLE_ERR_RE = re.compile(
+    r"eof|connection reset|connection aborted|remotedisconnected"
+    r"|remote end closed|broken pipe|timeout",
+    re.IGNORECASE,
+)
+
+# tqdm refresh cadence: advance the bar every N results, redraw postfix every M
+_PBAR_UPDATE_EVERY = 10
+_PBAR_POSTFIX_EVERY = 50
+# --verbose status lines are written to stdout in batches of this many
+_VERBOSE_FLUSH_EVERY = 50
+
 
 class RateLimiter:
-    """Enforces minimum spacing between requests."""
+    """Enforces minimum spacing between requests. Thread-safe."""
 
     def __init__(self, requests_per_second: float):
         self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
         self.last_request = 0.0
+        self._lock = threading.Lock()
 
     def wait(self):
         if self.min_interval <= 0:
             return
-        now = time.perf_counter()
-        elapsed = now - self.last_request
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self.last_request = time.perf_counter()
+        # Reserve the next slot under the lock, sleep outside it
+        with self._lock:
+            now = time.perf_counter()
+            slot = max(now, self.last_request + self.min_interval)
+            self.last_request = slot
+        if slot > now:
+            time.sleep(slot - now)
 
 
 def format_duration(seconds: float) -> str:
@@ -104,11 +134,15 @@ def _write_to_path(path: str, content: bytes | str) -> None:
 
         write_output(content, path)
     else:
-        p = Path(path)
-        p.parent.mkdir(parents=True, exist_ok=True)
         if isinstance(content, str):
-            p.write_text(content, encoding="utf-8")
-        else:
+            content = content.encode("utf-8")
+        p = Path(path)
+        # Create the directory only on the first write into it (checkpoints
+        # rewrite the same path many times per run)
+        try:
+            p.write_bytes(content)
+        except FileNotFoundError:
+            p.parent.mkdir(parents=True, exist_ok=True)
             p.write_bytes(content)
 
 
@@ -134,33 +168,61 @@ def read_tournament_codes(file_path: str) -> List[str]:
     return codes
 
 
+# Compiled once at import; these run O(players x rounds) times per report
+_SCORE_RE = re.compile(r"(\d+\.?\d*)")
+_ISO_DATE_RE = re.compile(r"(\d{4})[.\-](\d{1,2})[.\-](\d{1,2})")
+_DMY_DATE_RE = re.compile(r"(\d{1,2})[.\-](\d{1,2})[.\-](\d{4})")
+_ROUND_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{2,4}")
+_ROUND_NUM_DATE_RE = re.compile(r"(\d+)\s+(\d{2}/\d{2}/\d{2,4})")
+_LEADING_INT_RE = re.compile(r"(\d+)")
+
+# Rule 1 of infer_date_format: FIDE round dates are from 2002..current_year+1
+_MIN_ROUND_YEAR = 2002
+
+
+# Exact score cell values seen on report pages; anything else takes the regex path
+_SCORE_MAP = {"0": 0.0, "0.0": 0.0, "0.5": 0.5, "½": 0.5, "1": 1.0, "1.0": 1.0}
+
+
 def parse_score(score_text: str) -> Optional[float]:
     """
     Parse score from text.
     Returns float (0.0, 0.5, 1.0) or None if forfeit.
     Forfeit indicators: 'forfeit', '-', '+', or text containing these.
     """
+    return parse_score_and_forfeit(score_text)[0]
+
+
+def parse_score_and_forfeit(score_text: str) -> Tuple[Optional[float], str]:
+    """
+    Parse a round score cell into (score, forfeit_indicator) in one pass.
+    Plain scores are a dict lookup; only forfeits and odd cells (e.g. stray
+    non-breaking space bytes) fall through to the slower checks.
+    """
     if not score_text:
-        return None
+        return None, ""
 
-    score_text = score_text.strip().lower()
+    score_text = score_text.strip()
+    score = _SCORE_MAP.get(score_text)
+    if score is not None:
+        return score, ""
 
-    # Check for forfeit indicators
-    if "forfeit" in score_text or score_text in ["-", "+"]:
-        return None  # Will be stored as forfeit indicator separately
+    forfeit = extract_forfeit_indicator(score_text)
+    if forfeit:
+        return None, forfeit
 
     # Try to extract numeric score
     # Look for patterns like "1.0", "0.5", "0", "1"
-    match = re.search(r"(\d+\.?\d*)", score_text)
+    match = _SCORE_RE.search(score_text)
     if match:
         try:
             score = float(match.group(1))
             if score in [0.0, 0.5, 1.0]:
-                return score
+                return score, ""
         except ValueError:
             pass
 
-    return None
+    return None, ""
 
 
 def extract_forfeit_indicator(score_text: str) -> str:
@@ -170,6 +232,11 @@ def extract_forfeit_indicator(score_text: str) -> str:
 
     score_text = score_text.strip()
 
+    # Too short to contain "forfeit" (e.g. the 3-letter Opp. Fed. cell every
+    # round row passes through here): skip the lowercase copy
+    if len(score_text) < 7:
+        return score_text if score_text in ("-", "+") else ""
+
     if "forfeit" in score_text.lower():
         if "-" in score_text or score_text.endswith("-"):
             return "-"
@@ -177,10 +244,6 @@ def extract_forfeit_indicator(score_text: str) -> str:
             return "+"
         # Default to "-" if forfeit but no explicit indicator
         return "-"
-    elif score_text == "-":
-        return "-"
-    elif score_text == "+":
-        return "+"
 
     return ""
 
@@ -193,6 +256,7 @@ def _to_year(y: str) -> int:
     return 2000 + n if n < 50 else 1900 + n
 
 
+@functools.lru_cache(maxsize=8192)
 def parse_details_date_to_iso(date_val) -> Optional[str]:
     """
     Parse start_date/end_date from tournament details to ISO (YYYY-MM-DD).
@@ -209,7 +273,7 @@ def parse_details_date_to_iso(date_val) -> Optional[str]:
     if not s or s.lower() == "nat":
         return None
     # YYYY.MM.DD or YYYY-MM-DD
-    m = re.match(r"(\d{4})[.\-](\d{1,2})[.\-](\d{1,2})", s)
+    m = _ISO_DATE_RE.match(s)
     if m:
         try:
             y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
@@ -218,7 +282,7 @@ def parse_details_date_to_iso(date_val) -> Optional[str]:
         except ValueError:
             pass
     # DD.MM.YYYY
-    m = re.match(r"(\d{1,2})[.\-](\d{1,2})[.\-](\d{4})", s)
+    m = _DMY_DATE_RE.match(s)
     if m:
         try:
             d, mo, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
@@ -229,34 +293,113 @@ def parse_details_date_to_iso(date_val) -> Optional[str]:
     return None
 
 
-def _parse_round_date_with_format(date_str: str, fmt: str) -> Optional[str]:
-    """Parse round date string (e.g. 24/12/30) using specified format to ISO."""
-    if not date_str or not re.match(r"\d{1,2}/\d{1,2}/\d{2,4}", date_str.strip()):
+def details_map_from_df(
+    df: pd.DataFrame, success_only: bool = False
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Build {event_code: (start_iso, end_iso)} from a tournament_details DataFrame,
+    for round-date format inference. Keyed by event_code (or id, in older files).
+    success_only: keep only rows with success == True.
+    """
+    ec_col = "event_code" if "event_code" in df.columns else "id"
+    if ec_col not in df.columns:
+        return {}
+    if success_only:
+        df = df[df["success"] == True]
+    n = len(df)
+    codes = [
+        ec if ok else None
+        for ec, ok in zip(df[ec_col].tolist(), df[ec_col].notna().tolist())
+    ]
+    starts = df["start_date"].tolist() if "start_date" in df.columns else [""] * n
+    ends = df["end_date"].tolist() if "end_date" in df.columns else [""] * n
+    return _details_map_from_columns(codes, starts, ends)
+
+
+def load_details_map(
+    parquet_path: str, success_only: bool = False
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """
+    Like details_map_from_df, read straight from a local tournament_details
+    Parquet file: only the code/date columns are read, success_only is pushed
+    down as a row filter, and no DataFrame is built.
+    """
+    names = set(pq.read_schema(parquet_path).names)
+    ec_col = "event_code" if "event_code" in names else "id"
+    if ec_col not in names:
+        return {}
+    columns = [ec_col] + [c for c in ("start_date", "end_date") if c in names]
+    filters = [("success", "==", True)] if success_only else None
+    cols = pq.read_table(parquet_path, columns=columns, filters=filters).to_pydict()
+    n = len(cols[ec_col])
+    return _details_map_from_columns(
+        cols[ec_col], cols.get("start_date", [""] * n), cols.get("end_date", [""] * n)
+    )
+
+
+def _details_map_from_columns(
+    codes: list, starts: list, ends: list
+) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+    """Zip code/start/end columns into a details map; None codes are skipped."""
+    details_map: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    for ec, sd, ed in zip(codes, starts, ends):
+        if ec is not None:
+            key = str(ec)
+            if key:
+                details_map[key] = (
+                    parse_details_date_to_iso(str(sd)),
+                    parse_details_date_to_iso(str(ed)),
+                )
+    return details_map
+
+
+def _parse_round_date_parts(date_str: str, fmt: str) -> Optional[Tuple[int, int, int]]:
+    """Parse round date string (e.g. 24/12/30) using specified format to (y, m, d)."""
+    if not date_str or not _ROUND_DATE_RE.match(date_str.strip()):
         return None
     parts = date_str.strip().split("/")
     if len(parts) != 3:
         return None
-    a, b, c = parts
+    return _ymd_from_parts(*parts, fmt)
+
+
+def _ymd_from_parts(a: str, b: str, c: str, fmt: str) -> Optional[Tuple[int, int, int]]:
+    """(y, m, d) from the three '/'-separated fields of a round date, or None."""
     try:
         if fmt == "yy/mm/dd":
             m, d = int(b), int(c)
             if 1 <= m <= 12 and 1 <= d <= 31:
-                year = _to_year(a)
-                return f"{year:04d}-{m:02d}-{d:02d}"
+                return _to_year(a), m, d
         elif fmt == "dd/mm/yy":
             d, m = int(a), int(b)
             if 1 <= m <= 12 and 1 <= d <= 31:
-                year = _to_year(c)
-                return f"{year:04d}-{m:02d}-{d:02d}"
+                return _to_year(c), m, d
     except ValueError:
         pass
     return None
 
 
-def _is_valid_parsed_year(year: int) -> bool:
-    """Rule 1: Years should be in 2002..current_year (FIDE round dates)."""
-    current_year = datetime.now().year
-    return 2002 <= year <= current_year + 1
+def _parse_round_date_with_format(date_str: str, fmt: str) -> Optional[str]:
+    """Parse round date string (e.g. 24/12/30) using specified format to ISO."""
+    ymd = _parse_round_date_parts(date_str, fmt)
+    if ymd is None:
+        return None
+    year, m, d = ymd
+    return f"{year:04d}-{m:02d}-{d:02d}"
+
+
+def _iso_date_to_datetime(s: str) -> datetime:
+    """
+    datetime for a YYYY-MM-DD string. Raises ValueError if unparseable.
+    The strings are ones we produced, so fromisoformat (much cheaper than
+    strptime) almost always applies; strptime covers looser input like 2024-4-3.
+    """
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            pass
+    return datetime.strptime(s, "%Y-%m-%d")
 
 
 def infer_date_format(
@@ -272,52 +415,73 @@ def infer_date_format(
     Rule 2: Prefer format that gives tightest date range; use start/end from details
     (and report_start from report page "Start: YYYY-MM-DD") to constrain/penalize.
     """
+    # Only the distinct dates matter (min/max/range), and callers pass one
+    # entry per player-round, so dedupe before parsing anything
+    date_strs = tuple(
+        sorted(
+            {s.strip() for s in date_strings if s and _ROUND_DATE_RE.match(s.strip())}
+        )
+    )
+    return _infer_date_format_cached(date_strs, start_iso, end_iso, report_start_iso)
+
+
+@functools.lru_cache(maxsize=4096)
+def _infer_date_format_cached(
+    date_strs: Tuple[str, ...],
+    start_iso: Optional[str],
+    end_iso: Optional[str],
+    report_start_iso: Optional[str],
+) -> str:
+    """
+    infer_date_format on distinct, stripped round dates. Memoized: checkpoints
+    rebuild the games frame (and re-infer) for every tournament seen so far.
+    """
     candidates = ["yy/mm/dd", "dd/mm/yy"]
-    date_strs = [
-        s for s in date_strings if s and re.match(r"\d{1,2}/\d{1,2}/\d{2,4}", s.strip())
-    ]
     if not date_strs:
         return "yy/mm/dd"  # default
 
-    # Build set of anchor dates from details and report header
-    anchor_dates: List[datetime] = []
+    # Build set of anchor dates from details and report header. All dates are
+    # compared as proleptic ordinals (days), so ranges are plain int arithmetic.
+    anchor_days: List[int] = []
     for iso in (start_iso, end_iso, report_start_iso):
         if iso:
             try:
-                anchor_dates.append(datetime.strptime(iso[:10], "%Y-%m-%d"))
+                anchor_days.append(_iso_date_to_datetime(iso[:10]).toordinal())
             except ValueError:
                 pass
-    start_dt = min(anchor_dates) if anchor_dates else None
-    end_dt = max(anchor_dates) if anchor_dates else None
+    start_day = min(anchor_days) if anchor_days else None
+    end_day = max(anchor_days) if anchor_days else None
+
+    # Rule 1 bounds, read once rather than a clock call per date
+    min_year, max_year = _MIN_ROUND_YEAR, datetime.now().year + 1
 
     best = "yy/mm/dd"
     best_score = float("inf")
 
+    # Split each date once; both candidate formats read the same fields
+    split_dates = [p for p in (s.split("/") for s in date_strs) if len(p) == 3]
     for fmt in candidates:
-        parsed = []
-        for s in date_strs:
-            iso = _parse_round_date_with_format(s, fmt)
-            if not iso:
+        parsed: List[int] = []
+        for a, b, c in split_dates:
+            ymd = _ymd_from_parts(a, b, c, fmt)
+            # Rule 1: discard if year out of valid range
+            if not ymd or not min_year <= ymd[0] <= max_year:
                 continue
             try:
-                dt = datetime.strptime(iso, "%Y-%m-%d")
-                # Rule 1: discard if year out of valid range
-                if not _is_valid_parsed_year(dt.year):
-                    continue
-                parsed.append(dt)
+                parsed.append(datetime(*ymd).toordinal())
             except ValueError:
-                pass
+                pass  # e.g. 31/02
         if not parsed:
             continue
         min_d, max_d = min(parsed), max(parsed)
-        range_days = (max_d - min_d).days
+        range_days = max_d - min_d
 
         # Rule 2: penalize dates outside [start, end] from details/report
         out_of_range = 0
-        if start_dt and min_d < start_dt:
-            out_of_range += (start_dt - min_d).days * 1000
-        if end_dt and max_d > end_dt:
-            out_of_range += (max_d - end_dt).days * 1000
+        if start_day is not None and min_d < start_day:
+            out_of_range += (start_day - min_d) * 1000
+        if end_day is not None and max_d > end_day:
+            out_of_range += (max_d - end_day) * 1000
 
         score = range_days + out_of_range
         if score < best_score:
@@ -327,11 +491,13 @@ def infer_date_format(
     return best
 
 
+@functools.lru_cache(maxsize=8192)
 def parse_date_to_iso(date_str: str, date_format: Optional[str] = None) -> str:
     """
     Convert FIDE round date string to ISO format (YYYY-MM-DD).
     If date_format is provided ('yy/mm/dd' or 'dd/mm/yy'), use it.
     Otherwise falls back to infer_date_format (caller should prefer passing format).
+    Memoized: tournaments in the same period share most of their round dates.
     """
     if not date_str:
         return ""
@@ -350,96 +516,331 @@ def parse_iso_to_datetime(iso_str: str):
     if not iso_str or not str(iso_str).strip():
         return None
     try:
-        return datetime.strptime(str(iso_str).strip()[:10], "%Y-%m-%d")
+        return _iso_date_to_datetime(str(iso_str).strip()[:10])
     except ValueError:
         return None
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_round_date(round_text: str) -> Tuple[Optional[int], Optional[str]]:
     """
     Parse round number and date from text like "1   25/11/22".
     Returns (round_number, date_string).
+    Memoized: every player's row for a round carries the same text.
     """
     if not round_text:
         return None, None
 
+    round_text = round_text.strip()
     # Match pattern: number followed by spaces and date
-    match = re.match(r"(\d+)\s+(\d{2}/\d{2}/\d{2,4})", round_text.strip())
+    match = _ROUND_NUM_DATE_RE.match(round_text)
     if match:
         round_num = int(match.group(1))
         date_str = match.group(2)
         return round_num, date_str
 
     # Try to extract just round number
-    match = re.match(r"(\d+)", round_text.strip())
+    match = _LEADING_INT_RE.match(round_text)
     if match:
         return int(match.group(1)), None
 
     return None, None
 
 
-def extract_href_anchor_from_cell(cell) -> str:
+# Compiled once at import; evaluated against lxml elements from the report page
+_CALC_TABLE_XPATH = etree.XPath(
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' calc_table ')]"
+)
+_CALC_LIST_XPATH = etree.XPath("//div[@id='calc_list']")
+_UPDATED_OR_REPLACED_MARKER = b"Tournament report was updated or replaced"
+_TEXT_OUTSIDE_LINKS_XPATH = etree.XPath(".//text()[not(ancestor::a)]")
+_START_LABEL_RE = re.compile(r"Start:\s*$", re.IGNORECASE)
+_ISO_DATE_ONLY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+# Reused HTML parser, one per thread: lxml locks a parser while it parses, so a
+# single shared instance would serialize the fetch threads. Parsing straight
+# into it also skips lxml.html.fromstring's fragment sniffing.
+_parser_local = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """This thread's HTML parser, created on first use."""
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = lxml.html.HTMLParser()
+    return parser
+
+
+def _stripped_text(element) -> str:
+    """Concatenate stripped text nodes under element (like bs4 get_text(strip=True))."""
+    if not len(element):
+        # Most cells hold a single text node; skip the itertext walk
+        text = element.text
+        return text.strip() if text else ""
+    return "".join(t.strip() for t in element.itertext())
+
+
+def extract_report_start(container) -> Optional[str]:
     """
-    Extract the href fragment from the first link in a cell.
-    E.g. <a href="#65">Name</a> -> "65".
-    Used to look up opponent's FIDE ID via anchor map.
+    Find "Start: <b>YYYY-MM-DD</b>" in the report header and return the date.
+    Returns None if container has no such label.
     """
-    link = cell.find("a", href=True)
-    if not link:
-        return ""
-    href = link.get("href", "")
-    if href.startswith("#"):
-        return href[1:].strip()
+    for b in container.iter("b"):
+        prev = b.getprevious()
+        label = prev.tail if prev is not None else b.getparent().text
+        if (
+            label
+            and _START_LABEL_RE.search(label)
+            and len(b) == 0
+            and b.text
+            and _ISO_DATE_ONLY_RE.fullmatch(b.text)
+        ):
+            return b.text
+    return None
+
+
+def extract_name_anchor_from_cell(cell) -> str:
+    """
+    Extract the name (or id) of the first named anchor in a cell.
+    E.g. <a name="65">Name</a> -> "65". Player rows carry these.
+    """
+    for a in cell.iter("a"):
+        anchor = a.get("name") or a.get("id")
+        if anchor:
+            return str(anchor)
     return ""
 
 
-def extract_color_from_cell(cell) -> str:
-    """Extract color (white/black) from a table cell."""
-    white_note = cell.find("span", class_="white_note")
-    black_note = cell.find("span", class_="black_note")
+def extract_opponent_from_cell(cell) -> Tuple[str, str]:
+    """
+    Extract (color, anchor) from a round row's opponent cell in one walk.
 
-    if white_note:
-        return "white"
-    elif black_note:
-        return "black"
-    return ""
+    color: "white"/"black" from a white_note/black_note span, else "".
+    anchor: fragment of the first link's href, e.g. <a href="#65"> -> "65";
+    used to look up the opponent's FIDE ID via the anchor map.
+    """
+    white = black = False
+    href = None
+    for element in cell.iter("a", "span"):
+        if element.tag == "a":
+            if href is None:
+                href = element.get("href")
+        elif not white:
+            classes = (element.get("class") or "").split()
+            white = "white_note" in classes
+            black = black or "black_note" in classes
+
+    color = "white" if white else "black" if black else ""
+    if href and href.startswith("#"):
+        return color, href[1:].strip()
+    return color, ""
 
 
 def extract_text_from_cell(cell) -> str:
     """Extract text from a table cell, handling links properly."""
-    links = cell.find_all("a")
+    links = list(cell.iter("a"))
     if not links:
-        return cell.get_text(strip=True)
+        return _stripped_text(cell)
 
     parts = []
     for link in links:
-        text = link.get_text(strip=True)
+        text = _stripped_text(link)
         if text:
             parts.append(text)
 
-    # Get remaining text after removing links
-    cell_copy = cell.__copy__()
-    for link in cell_copy.find_all("a"):
-        link.decompose()
-    remaining = cell_copy.get_text(strip=True)
+    # Remaining text outside links
+    remaining = "".join(t.strip() for t in _TEXT_OUTSIDE_LINKS_XPATH(cell))
     if remaining:
         parts.append(remaining)
 
     if not parts:
-        return cell.get_text(strip=True)
+        return _stripped_text(cell)
     return " ".join(parts)
 
 
+# Static per-request headers, built once. No "Connection: close", so the
+# session's pool keeps the TCP+TLS connection to FIDE alive between reports.
+_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def parse_report(
+    tournament_code: str, content: bytes
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    Parse a tournament report page into (report_dict, error_string).
+
+    Pure CPU work on the raw page bytes, kept top-level and free of lxml
+    objects in its arguments/return value so it can run in a process pool.
+    """
+    if not content or content.isspace():
+        return None, "no data found"
+
+    # Older tournaments may have no original report (no cross table).
+    # Page shows: "Tournament report was updated or replaced, please view
+    # Tournament Details for more information." Skip these. Searching the raw
+    # bytes avoids building the page's full text (or any tree) to find it.
+    if _UPDATED_OR_REPLACED_MARKER in content:
+        return None, ERROR_REPORT_UPDATED_OR_REPLACED
+
+    root = etree.fromstring(content, _html_parser())
+    if root is None:
+        return None, "parse error: document is empty"
+
+    # Extract "Start: YYYY-MM-DD" from report header for date format inference
+    calc_lists = _CALC_LIST_XPATH(root)
+    report_start_iso = extract_report_start(calc_lists[0] if calc_lists else root)
+
+    # Find the main results table
+    tables = _CALC_TABLE_XPATH(root)
+    if not tables:
+        return None, "no data found"
+
+    # Cells of every row, extracted once; the loops below index into this
+    rows = [list(tr.iter("td")) for tr in tables[0].iter("tr")]
+
+    # Player rows have <a name="X"> in the name cell; X maps to that
+    # player's FIDE ID. Round rows link to their opponent via href="#X".
+    # Anchors are collected during the single walk and resolved after it.
+    anchor_to_id: Dict[str, str] = {}
+
+    def register_anchor(cells, first_text: str) -> None:
+        if len(cells) >= 2 and first_text and first_text.isdigit():
+            anchor = extract_name_anchor_from_cell(cells[1])
+            if anchor:
+                anchor_to_id[anchor] = first_text
+
+    players = []
+    i = 0
+    while i < len(rows):
+        cells = rows[i]
+        first_cell_text = _stripped_text(cells[0]) if cells else ""
+        register_anchor(cells, first_cell_text)
+
+        # Check if this is a player summary row
+        # Format: ID, Name, Country, (empty), (empty), Rating, Total
+        if len(cells) >= 7:
+            # Player summary rows start with a numeric ID
+            if first_cell_text and first_cell_text.isdigit():
+                player_id = first_cell_text
+                player_name = extract_text_from_cell(cells[1])
+                player_country = sys.intern(_stripped_text(cells[2]))
+                player_total = _stripped_text(cells[6])
+
+                # Total score (no longer collecting rating - use profile chart if needed)
+                try:
+                    player_total_float = float(player_total) if player_total else 0.0
+                except ValueError:
+                    player_total_float = 0.0
+
+                # Rank = 1-based order on page (correlates with tournament rank/tiebreaks)
+                rank = len(players) + 1
+                player = {
+                    "id": player_id,
+                    "name": player_name,
+                    "country": player_country,
+                    "total": player_total_float,
+                    "rank": rank,
+                    "rounds": [],
+                }
+
+                # Look ahead for round data rows
+                i += 1
+                # Skip the round header row if present
+                if i < len(rows):
+                    next_cells = rows[i]
+                    if (
+                        len(next_cells) >= 7
+                        and _stripped_text(next_cells[0]).lower() == "round"
+                    ):
+                        i += 1  # Skip header row
+
+                # Collect round data rows
+                while i < len(rows):
+                    round_cells = rows[i]
+
+                    if len(round_cells) >= 7:
+                        round_first_text = _stripped_text(round_cells[0])
+                        register_anchor(round_cells, round_first_text)
+                        # Check if this is a round data row (starts with digit)
+                        if round_first_text and round_first_text[0].isdigit():
+                            round_num, round_date = parse_round_date(round_first_text)
+                            if round_date:
+                                # Same few dates on every player's rows; share one object
+                                round_date = sys.intern(round_date)
+                            score_text = _stripped_text(round_cells[6])
+
+                            color, anchor = extract_opponent_from_cell(round_cells[1])
+                            score, forfeit = parse_score_and_forfeit(score_text)
+                            # Forfeit can also appear in Opp. Fed. column (cells[2]) when score cell is empty
+                            if not forfeit and len(round_cells) >= 3:
+                                opp_fed_text = _stripped_text(round_cells[2])
+                                forfeit = extract_forfeit_indicator(opp_fed_text)
+
+                            # opp_id holds the raw anchor until the walk ends
+                            round_data = {
+                                "round": round_num,
+                                "date": round_date,
+                                "opp_id": anchor,
+                                "color": color,
+                                "score": score,
+                                "forfeit": forfeit,
+                            }
+                            player["rounds"].append(round_data)
+                            i += 1
+                        else:
+                            # Not a round row, break to process next player
+                            break
+                    else:
+                        # Not enough cells, break
+                        break
+
+                players.append(player)
+                continue
+
+        i += 1
+
+    # Resolve anchors; keep a round only when it has an opponent (can form a game)
+    for player in players:
+        resolved = []
+        for round_data in player["rounds"]:
+            anchor = round_data["opp_id"]
+            opp_id = anchor_to_id.get(anchor, "") if anchor else ""
+            if opp_id:
+                round_data["opp_id"] = opp_id
+                resolved.append(round_data)
+        player["rounds"] = resolved
+
+    if not players:
+        return None, "no players found"
+
+    report_dict = {
+        "tournament_code": tournament_code,
+        "players": players,
+    }
+    if report_start_iso:
+        report_dict["report_start"] = report_start_iso
+    return report_dict, None
+
+
 def fetch_tournament_report(
     tournament_code: str,
     session: requests.Session,
     *,
     _attempt_log: Optional[List[Dict]] = None,
     return_raw: bool = False,
+    parse_executor: Optional[Executor] = None,
 ) -> Tuple[Optional[Dict], Optional[str], int, Optional[bytes]]:
     """
     Fetch tournament report from FIDE website.
 
+    parse_executor: if given (e.g. a ProcessPoolExecutor), parse_report runs
+    there and this thread waits for it, so parsing is not bound by the GIL.
+
     Returns:
         Tuple of (report_dict, error_string, num_attempts, raw_content).
         If successful, report_dict is not None.
@@ -447,352 +848,156 @@ def fetch_tournament_report(
     """
     url = f"https://ratings.fide.com/tournament_src_report.phtml?code={tournament_code}"
 
-    max_retries = 2
     # Fail fast on connect: 15s to establish, 45s to read (large report pages)
     connect_timeout, read_timeout = 15, 45
-    last_error = None
-    attempt_times: List[float] = []
-
-    for attempt in range(max_retries):
-        if attempt > 0:
-            delay = 0.1 * (
-                2 ** (attempt - 1)
-            )  # Exponential backoff: 100ms, 200ms, 400ms
-            logger.info(
-                "Retrying report fetch: tournament_code=%s attempt=%d",
+    num_attempts = 1
+    t0 = time.perf_counter()
+
+    def _failed(error: str):
+        if _attempt_log is not None:
+            _attempt_log.append(
+                {
+                    "tournament_code": tournament_code,
+                    "attempt": num_attempts,
+                    "error": error,
+                    "duration_s": time.perf_counter() - t0,
+                }
+            )
+        return None, error, num_attempts, None
+
+    # Transient failures (429/5xx, dropped or timed-out reads) are retried by
+    # the session adapter; see create_session
+    try:
+        response = session.get(
+            url,
+            headers=_REQUEST_HEADERS,
+            timeout=(connect_timeout, read_timeout),
+        )
+        num_attempts = _attempts_from_response(response)
+        elapsed = time.perf_counter() - t0
+        if elapsed > 10:
+            logger.warning(
+                "Slow report fetch: tournament_code=%s took %.1fs (%d attempts)",
                 tournament_code,
-                attempt + 1,
+                elapsed,
+                num_attempts,
             )
-            time.sleep(delay)
 
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Connection": "close",
-                "Cache-Control": "max-age=0",
-            }
+        if response.status_code != 200:
+            logger.warning(
+                "HTTP error: tournament_code=%s status=%s (%d attempts)",
+                tournament_code,
+                response.status_code,
+                num_attempts,
+            )
+            return _failed(f"HTTP {response.status_code}")
 
-            t0 = time.perf_counter()
-            try:
-                response = session.get(
-                    url, headers=headers, timeout=(connect_timeout, read_timeout)
-                )
-            finally:
-                elapsed = time.perf_counter() - t0
-                attempt_times.append(elapsed)
-                if elapsed > 10:
-                    logger.warning(
-                        "Slow report fetch: tournament_code=%s took %.1fs (attempt %d)",
-                        tournament_code,
-                        elapsed,
-                        attempt + 1,
-                    )
+        content = response.content
+        if parse_executor is not None:
+            report, error = parse_executor.submit(
+                parse_report, tournament_code, content
+            ).result()
+        else:
+            report, error = parse_report(tournament_code, content)
+        return report, error, num_attempts, content if return_raw else None
 
-            if response.status_code != 200:
-                last_error = f"HTTP {response.status_code}"
-                logger.warning(
-                    "HTTP error: tournament_code=%s status=%s (attempt %d)",
-                    tournament_code,
-                    response.status_code,
-                    attempt + 1,
-                )
-                if _attempt_log is not None:
-                    _attempt_log.append(
-                        {
-                            "tournament_code": tournament_code,
-                            "attempt": attempt + 1,
-                            "error": last_error,
-                            "duration_s": attempt_times[-1] if attempt_times else 0,
-                        }
-                    )
-                continue
+    except requests.exceptions.Timeout as e:
+        logger.warning(
+            "Report fetch timeout: tournament_code=%s: %s", tournament_code, e
+        )
+        return _failed(f"timeout: {e}")
+    except requests.exceptions.RequestException as e:
+        logger.warning(
+            "Report fetch network error: tournament_code=%s: %s", tournament_code, e
+        )
+        return _failed(f"network error: {e}")
+    except Exception as e:
+        logger.warning("Report parse error: tournament_code=%s: %s", tournament_code, e)
+        return _failed(f"parse error: {e}")
+
+
+# Retries transient failures inside urllib3: throttling and 5xx responses, and
+# reads that time out or drop mid-response. Connect failures are not retried
+# (a connect timeout means the host is unreachable from this Lambda).
+_RETRY = Retry(
+    total=2,
+    connect=0,
+    backoff_factor=0.1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,
+    # backoff_factor alone sets the wait: urllib3 does not cap Retry-After, and
+    # a 429/503 asking for an hour would outlive the Lambda
+    respect_retry_after_header=False,
+)
 
-            soup = BeautifulSoup(response.content, "html.parser")
-
-            # Older tournaments may have no original report (no cross table).
-            # Page shows: "Tournament report was updated or replaced, please view
-            # Tournament Details for more information." Skip these.
-            page_text = soup.get_text() if soup else ""
-            if "Tournament report was updated or replaced" in page_text:
-                return (
-                    None,
-                    ERROR_REPORT_UPDATED_OR_REPLACED,
-                    len(attempt_times),
-                    response.content if return_raw else None,
-                )
 
-            # Extract "Start: YYYY-MM-DD" from report header for date format inference
-            report_start_iso = None
-            calc_body = soup.find("div", id="calc_list") or soup
-            start_match = re.search(
-                r"Start:\s*<b>(\d{4}-\d{2}-\d{2})</b>",
-                str(calc_body),
-                re.IGNORECASE,
-            )
-            if start_match:
-                report_start_iso = start_match.group(1)
-
-            # Find the main results table
-            raw_content = response.content if return_raw else None
-            table = soup.find("table", class_="calc_table")
-            if not table:
-                return None, "no data found", len(attempt_times), raw_content
-
-            rows = table.find_all("tr")
-
-            # First pass: build anchor -> FIDE ID map
-            # Player rows have <a name="X"> in the name cell; X maps to that player's FIDE ID
-            anchor_to_id: Dict[str, str] = {}
-            for row in rows:
-                cells = row.find_all("td")
-                if len(cells) >= 2:
-                    first_text = cells[0].get_text(strip=True)
-                    if first_text and first_text.isdigit():
-                        # Player summary row - FIDE ID in first cell
-                        player_id = first_text
-                        for a in cells[1].find_all("a"):
-                            anchor = a.get("name") or a.get("id")
-                            if anchor:
-                                anchor_to_id[str(anchor)] = player_id
-                                break
-
-            players = []
-            i = 0
-            while i < len(rows):
-                row = rows[i]
-                cells = row.find_all("td")
-
-                # Check if this is a player summary row
-                # Format: ID, Name, Country, (empty), (empty), Rating, Total
-                if len(cells) >= 7:
-                    first_cell_text = cells[0].get_text(strip=True)
-                    # Player summary rows start with a numeric ID
-                    if first_cell_text and first_cell_text.isdigit():
-                        player_id = first_cell_text
-                        player_name = extract_text_from_cell(cells[1])
-                        player_country = cells[2].get_text(strip=True)
-                        player_total = cells[6].get_text(strip=True)
-
-                        # Total score (no longer collecting rating - use profile chart if needed)
-                        try:
-                            player_total_float = (
-                                float(player_total) if player_total else 0.0
-                            )
-                        except ValueError:
-                            player_total_float = 0.0
-
-                        # Rank = 1-based order on page (correlates with tournament rank/tiebreaks)
-                        rank = len(players) + 1
-                        player = {
-                            "id": player_id,
-                            "name": player_name,
-                            "country": player_country,
-                            "total": player_total_float,
-                            "rank": rank,
-                            "rounds": [],
-                        }
-
-                        # Look ahead for round data rows
-                        i += 1
-                        # Skip the round header row if present
-                        if i < len(rows):
-                            next_row = rows[i]
-                            next_cells = next_row.find_all("td")
-                            if (
-                                len(next_cells) >= 7
-                                and next_cells[0].get_text(strip=True).lower()
-                                == "round"
-                            ):
-                                i += 1  # Skip header row
-
-                        # Collect round data rows
-                        while i < len(rows):
-                            round_row = rows[i]
-                            round_cells = round_row.find_all("td")
-
-                            if len(round_cells) >= 7:
-                                round_first_text = round_cells[0].get_text(strip=True)
-                                # Check if this is a round data row (starts with digit)
-                                if round_first_text and round_first_text[0].isdigit():
-                                    round_num, round_date = parse_round_date(
-                                        round_first_text
-                                    )
-                                    opp_name = extract_text_from_cell(round_cells[1])
-                                    score_text = round_cells[6].get_text(strip=True)
-
-                                    color = extract_color_from_cell(round_cells[1])
-                                    anchor = extract_href_anchor_from_cell(
-                                        round_cells[1]
-                                    )
-                                    opp_id = (
-                                        anchor_to_id.get(anchor, "") if anchor else ""
-                                    )
-                                    score = parse_score(score_text)
-                                    forfeit = extract_forfeit_indicator(score_text)
-                                    # Forfeit can also appear in Opp. Fed. column (cells[2]) when score cell is empty
-                                    if not forfeit and len(round_cells) >= 3:
-                                        opp_fed_text = round_cells[2].get_text(
-                                            strip=True
-                                        )
-                                        forfeit = extract_forfeit_indicator(
-                                            opp_fed_text
-                                        )
-
-                                    has_opponent = bool(opp_id)
-                                    if has_opponent:
-                                        # Add round only when we have an opponent (can form a game)
-                                        round_data = {
-                                            "round": round_num,
-                                            "date": round_date,
-                                            "opp_id": opp_id,
-                                            "color": color,
-                                            "score": score,
-                                            "forfeit": forfeit,
-                                        }
-                                        player["rounds"].append(round_data)
-                                    i += 1
-                                else:
-                                    # Not a round row, break to process next player
-                                    break
-                            else:
-                                # Not enough cells, break
-                                break
-
-                        players.append(player)
-                        continue
+def _attempts_from_response(response) -> int:
+    """Number of HTTP attempts the adapter made for this response."""
+    retries = getattr(getattr(response, "raw", None), "retries", None)
+    if isinstance(retries, Retry):
+        return len(retries.history) + 1
+    return 1
 
-                i += 1
 
-            if not players:
-                return None, "no players found", len(attempt_times), raw_content
+def create_session(workers: int = 1) -> requests.Session:
+    """
+    Session for report fetches. Keep-alive reuses the TCP+TLS connection to
+    FIDE; the single-host pool holds one connection per worker thread. The
+    adapter retries transient failures (see _RETRY).
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=1, pool_maxsize=max(workers, 1), max_retries=_RETRY
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
-            report_dict = {
-                "tournament_code": tournament_code,
-                "players": players,
-            }
-            if report_start_iso:
-                report_dict["report_start"] = report_start_iso
-            return (report_dict, None, len(attempt_times), raw_content)
 
-        except requests.exceptions.Timeout as e:
-            last_error = f"timeout: {e}"
-            logger.warning(
-                "Report fetch timeout: tournament_code=%s (attempt %d): %s",
-                tournament_code,
-                attempt + 1,
-                e,
-            )
-            if _attempt_log is not None:
-                _attempt_log.append(
-                    {
-                        "tournament_code": tournament_code,
-                        "attempt": attempt + 1,
-                        "error": last_error,
-                        "duration_s": attempt_times[-1] if attempt_times else 0,
-                    }
-                )
-            # Connect timeout = all-or-nothing per Lambda; retries don't help
-            if "connect" in str(e).lower() and "timeout" in str(e).lower():
-                break
-            continue
-        except requests.exceptions.ConnectionError as e:
-            error_str = str(e).lower()
-            # Check for various connection error patterns that should be retried
-            if any(
-                pattern in error_str
-                for pattern in [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-            ):
-                last_error = f"network error: {e}"
-                logger.warning(
-                    "Report fetch connection error: tournament_code=%s (attempt %d): %s",
-                    tournament_code,
-                    attempt + 1,
-                    e,
-                )
-                if _attempt_log is not None:
-                    _attempt_log.append(
-                        {
-                            "tournament_code": tournament_code,
-                            "attempt": attempt + 1,
-                            "error": last_error,
-                            "duration_s": attempt_times[-1] if attempt_times else 0,
-                        }
-                    )
-                continue
-            last_error = f"connection error: {e}"
-            logger.warning(
-                "Report fetch connection error (non-retryable): tournament_code=%s: %s",
-                tournament_code,
-                e,
-            )
-            return None, last_error, len(attempt_times), None
-        except requests.exceptions.RequestException as e:
-            error_str = str(e).lower()
-            # Check for various connection error patterns that should be retried
-            if any(
-                pattern in error_str
-                for pattern in [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-            ):
-                last_error = f"network error: {e}"
-                logger.warning(
-                    "Report fetch RequestException: tournament_code=%s (attempt %d): %s",
-                    tournament_code,
-                    attempt + 1,
-                    e,
-                )
-                if _attempt_log is not None:
-                    _attempt_log.append(
-                        {
-                            "tournament_code": tournament_code,
-                            "attempt": attempt + 1,
-                            "error": last_error,
-                            "duration_s": attempt_times[-1] if attempt_times else 0,
-                        }
-                    )
-                continue
-            last_error = f"network error: {e}"
-            logger.warning(
-                "Report fetch RequestException (non-retryable): tournament_code=%s: %s",
-                tournament_code,
-                e,
-            )
-            return None, last_error, len(attempt_times), None
-        except Exception as e:
-            last_error = f"parse error: {e}"
-            logger.warning(
-                "Report fetch error: tournament_code=%s (attempt %d): %s",
-                tournament_code,
-                attempt + 1,
-                e,
-            )
-            if _attempt_log is not None:
-                _attempt_log.append(
-                    {
-                        "tournament_code": tournament_code,
-                        "attempt": attempt + 1,
-                        "error": last_error,
-                        "duration_s": attempt_times[-1] if attempt_times else 0,
-                    }
-                )
-            continue
+def iter_fetches(
+    codes: List[str],
+    session: requests.Session,
+    rate_limiter: Optional[RateLimiter] = None,
+    workers: int = 1,
+    **fetch_kwargs,
+):
+    """
+    Yield (code, fetch_tournament_report result) as fetches complete.
 
-    return None, f"max retries exceeded: {last_error}", len(attempt_times), None
+    With workers > 1, fetches run on a thread pool sharing one session and rate
+    limiter. At most 2 * workers fetches are queued at a time, so an aborted
+    chunk leaves little work in flight.
+    """
+
+    def _fetch(code: str):
+        if rate_limiter:
+            rate_limiter.wait()
+        return fetch_tournament_report(code, session, **fetch_kwargs)
+
+    if workers <= 1:
+        for code in codes:
+            yield code, _fetch(code)
+        return
+
+    remaining = iter(codes)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = {}
+        for code in remaining:
+            pending[executor.submit(_fetch, code)] = code
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                code = pending.pop(future)
+                next_code = next(remaining, None)
+                if next_code is not None:
+                    pending[executor.submit(_fetch, next_code)] = next_code
+                yield code, future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 
 def flatten_result(result: Dict) -> List[Dict]:
@@ -903,6 +1108,9 @@ def flatten_to_games(
     if details_map and tournament_code:
         start_iso, end_iso = details_map.get(tournament_code, (None, None))
     date_format = infer_date_format(date_strs, start_iso=start_iso, end_iso=end_iso)
+    date_isos = {
+        raw: parse_date_to_iso(raw, date_format=date_format) or "" for raw in date_strs
+    }
 
     games = []
     seen: set = set()
@@ -944,9 +1152,7 @@ def flatten_to_games(
         else:
             continue
 
-        date_iso = (
-            parse_date_to_iso(row.get("round_date", ""), date_format=date_format) or ""
-        )
+        date_iso = date_isos.get(row.get("round_date", ""), "")
         games.append(
             {
                 "tournament_code": tc,
@@ -961,32 +1167,6 @@ def flatten_to_games(
     return games
 
 
-def _flatten_rounds_for_games(result: Dict) -> List[Dict]:
-    """Flatten player-round rows for games extraction (internal)."""
-    rows = []
-    tc = result.get("tournament_code", "")
-    if not result.get("success"):
-        return rows
-    for player in result.get("players", []):
-        pid = player.get("id", "")
-        for rd in player.get("rounds", []):
-            if not rd.get("opp_id"):
-                continue
-            rows.append(
-                {
-                    "tournament_code": tc,
-                    "player_id": pid,
-                    "round": rd.get("round"),
-                    "round_date": rd.get("date", ""),
-                    "opp_id": rd.get("opp_id", ""),
-                    "color": (rd.get("color") or "").strip().lower(),
-                    "score": rd.get("score"),
-                    "forfeit": (rd.get("forfeit") or "").strip(),
-                }
-            )
-    return rows
-
-
 def validate_against_players_file(result: Dict, players_df: pd.DataFrame) -> None:
     """
     Compare report player name/country to players file. Log mismatches with
@@ -1134,59 +1314,95 @@ def validate_pairings(result: Dict) -> None:
                 )
 
 
-def results_to_players_dataframe(results: List[Dict]) -> pd.DataFrame:
+# Parquet schemas of the players/games outputs; tables are built straight from
+# column lists, without a pandas intermediate
+_PLAYERS_SCHEMA = pa.schema(
+    [
+        ("player_id", pa.string()),
+        ("tournament_id", pa.string()),
+        ("player_name", pa.string()),
+        ("player_country", pa.string()),
+        ("player_total", pa.float64()),
+        ("rank", pa.int64()),
+    ]
+)
+_GAMES_SCHEMA = pa.schema(
+    [
+        ("white_player_id", pa.string()),
+        ("black_player_id", pa.string()),
+        ("tournament_id", pa.string()),
+        ("round_number", pa.int64()),
+        ("round_date", pa.timestamp("us")),
+        ("score", pa.float64()),
+        ("forfeit", pa.string()),
+    ]
+)
+
+
+def results_to_players_table(results: List[Dict]) -> pa.Table:
     """
-    Build players DataFrame. PK: (player_id, tournament_id).
+    Build players table. PK: (player_id, tournament_id).
     Columns: player_id, tournament_id, player_name, player_country, player_total, rank.
     """
-    rows = []
+    # One list per column; no per-row dicts
+    cols: Dict[str, list] = {c: [] for c in _PLAYERS_SCHEMA.names}
+    player_ids = cols["player_id"]
+    tournament_ids = cols["tournament_id"]
+    names = cols["player_name"]
+    countries = cols["player_country"]
+    totals = cols["player_total"]
+    ranks = cols["rank"]
     for result in results:
         if not result.get("success"):
             continue
-        tc = result.get("tournament_code", "")
+        tc = str(result.get("tournament_code", ""))
         for player in result.get("players", []):
-            rows.append(
-                {
-                    "player_id": str(player.get("id", "")),
-                    "tournament_id": str(tc),
-                    "player_name": player.get("name", ""),
-                    "player_country": player.get("country", ""),
-                    "player_total": player.get("total", 0.0),
-                    "rank": player.get("rank", 0),
-                }
-            )
-    if not rows:
-        return pd.DataFrame(
-            columns=[
-                "player_id",
-                "tournament_id",
-                "player_name",
-                "player_country",
-                "player_total",
-                "rank",
-            ]
-        )
-    return pd.DataFrame(rows)
+            player_ids.append(str(player.get("id", "")))
+            tournament_ids.append(tc)
+            names.append(player.get("name", ""))
+            countries.append(player.get("country", ""))
+            totals.append(player.get("total", 0.0))
+            ranks.append(player.get("rank", 0))
+    return pa.Table.from_pydict(cols, schema=_PLAYERS_SCHEMA)
 
 
-def results_to_games_dataframe(
+def results_to_players_dataframe(results: List[Dict]) -> pd.DataFrame:
+    """Players table (see results_to_players_table) as a DataFrame."""
+    return results_to_players_table(results).to_pandas()
+
+
+def results_to_games_table(
     results: List[Dict],
     details_map: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
-) -> pd.DataFrame:
+) -> pa.Table:
     """
-    Build games DataFrame. PK: (white_player_id, tournament_id, round_number).
+    Build games table. PK: (white_player_id, tournament_id, round_number).
     Columns: white_player_id, black_player_id, tournament_id, round_number, round_date, score, forfeit.
     score = white's score (0, 0.5, 1). forfeit = from white's perspective ("+", "-", or "").
     """
-    all_games = []
+    # One list per column; rounds are read straight from the result dicts
+    cols: Dict[str, list] = {c: [] for c in _GAMES_SCHEMA.names}
+    white_ids = cols["white_player_id"]
+    black_ids = cols["black_player_id"]
+    tournament_ids = cols["tournament_id"]
+    round_numbers = cols["round_number"]
+    round_dates = cols["round_date"]
+    scores = cols["score"]
+    forfeits = cols["forfeit"]
+
     for result in results:
-        tc = result.get("tournament_code", "")
-        flattened = _flatten_rounds_for_games(result)
-        if not flattened:
+        if not result.get("success"):
             continue
+        tc = result.get("tournament_code", "")
+        players = result.get("players", [])
 
         date_strs = list(
-            {r.get("round_date", "") for r in flattened if r.get("round_date")}
+            {
+                rd.get("date", "")
+                for player in players
+                for rd in player.get("rounds", [])
+                if rd.get("opp_id") and rd.get("date")
+            }
         )
         start_iso, end_iso = None, None
         if details_map and tc:
@@ -1199,85 +1415,79 @@ def results_to_games_dataframe(
             report_start_iso=report_start_iso,
         )
 
-        seen: set = set()  # (white_id, tc, round)
-        for row in flattened:
-            if (
-                row.get("round") is None
-                or not row.get("player_id")
-                or not row.get("opp_id")
-            ):
-                continue
-            color = row.get("color", "")
-            if color == "white":
-                white_id, black_id = row["player_id"], row["opp_id"]
-            elif color == "black":
-                white_id, black_id = row["opp_id"], row["player_id"]
-            else:
-                continue
+        # Raw round date -> datetime, converted once per distinct date
+        round_dts = {
+            raw: parse_iso_to_datetime(
+                parse_date_to_iso(raw, date_format=date_format) or ""
+            )
+            for raw in date_strs
+        }
 
-            key = (white_id, tc, row["round"])
-            if key in seen:
+        seen: set = set()  # (white_id, tc, round)
+        for player in players:
+            pid = player.get("id", "")
+            if not pid:
                 continue
-            seen.add(key)
-
-            forfeit = row.get("forfeit", "")
-            score_val = row.get("score")
-            if forfeit:
+            for rd in player.get("rounds", []):
+                opp_id = rd.get("opp_id")
+                rnd = rd.get("round")
+                if rnd is None or not opp_id:
+                    continue
+                color = (rd.get("color") or "").strip().lower()
                 if color == "white":
-                    white_score = 1.0 if forfeit == "+" else 0.0
-                    white_forfeit = forfeit
+                    white_id, black_id = pid, opp_id
+                elif color == "black":
+                    white_id, black_id = opp_id, pid
                 else:
-                    white_score = 0.0 if forfeit == "+" else 1.0
-                    white_forfeit = (
-                        "-" if forfeit == "+" else "+"
-                    )  # flip to white's perspective
-            elif score_val is not None:
-                white_score = (
-                    float(score_val) if color == "white" else 1.0 - float(score_val)
-                )
-                white_forfeit = ""
-            else:
-                continue
+                    continue
 
-            date_iso = (
-                parse_date_to_iso(row.get("round_date", ""), date_format=date_format)
-                or ""
-            )
-            round_dt = parse_iso_to_datetime(date_iso)
-            if round_dt is None:
-                round_dt = pd.NaT
+                key = (white_id, tc, rnd)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                forfeit = (rd.get("forfeit") or "").strip()
+                score_val = rd.get("score")
+                if forfeit:
+                    if color == "white":
+                        white_score = 1.0 if forfeit == "+" else 0.0
+                        white_forfeit = forfeit
+                    else:
+                        white_score = 0.0 if forfeit == "+" else 1.0
+                        white_forfeit = (
+                            "-" if forfeit == "+" else "+"
+                        )  # flip to white's perspective
+                elif score_val is not None:
+                    white_score = (
+                        float(score_val) if color == "white" else 1.0 - float(score_val)
+                    )
+                    white_forfeit = ""
+                else:
+                    continue
 
-            all_games.append(
-                {
-                    "white_player_id": white_id,
-                    "black_player_id": black_id,
-                    "tournament_id": tc,
-                    "round_number": row["round"],
-                    "round_date": round_dt,
-                    "score": white_score,
-                    "forfeit": white_forfeit,
-                }
-            )
+                white_ids.append(white_id)
+                black_ids.append(black_id)
+                tournament_ids.append(tc)
+                round_numbers.append(rnd)
+                round_dates.append(round_dts.get(rd.get("date", "")))
+                scores.append(white_score)
+                forfeits.append(white_forfeit)
 
-    if not all_games:
-        return pd.DataFrame(
-            columns=[
-                "white_player_id",
-                "black_player_id",
-                "tournament_id",
-                "round_number",
-                "round_date",
-                "score",
-                "forfeit",
-            ]
-        )
-    return pd.DataFrame(all_games)
+    return pa.Table.from_pydict(cols, schema=_GAMES_SCHEMA)
 
 
-def _write_parquet_to_path(df: pd.DataFrame, path: str) -> None:
-    """Write DataFrame to Parquet (local or S3)."""
+def results_to_games_dataframe(
+    results: List[Dict],
+    details_map: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+) -> pd.DataFrame:
+    """Games table (see results_to_games_table) as a DataFrame."""
+    return results_to_games_table(results, details_map=details_map).to_pandas()
+
+
+def _write_parquet_to_path(table: pa.Table, path: str) -> None:
+    """Write an Arrow table to Parquet (local or S3), zstd-compressed."""
     buf = io.BytesIO()
-    df.to_parquet(buf, index=False, engine="pyarrow")
+    pq.write_table(table, buf, compression="zstd", compression_level=3)
     _write_to_path(path, buf.getvalue())
 
 
@@ -1288,12 +1498,66 @@ SKIPPABLE_ERRORS = frozenset(
 )
 
 
+class GamesCheckpoint:
+    """
+    Incremental games Parquet checkpoint for a growing list of results.
+
+    Results are flattened into an Arrow table once, the first time a checkpoint
+    sees them; later checkpoints only flatten the new tail and concatenate the
+    cached tables, so checkpointing stays linear over a run. Each write is a
+    complete Parquet file, so the checkpoint is readable after every save.
+    The final save reuses the same cached tables (see save_games_parquet).
+
+    Safe to call from several threads, and from a signal handler that
+    interrupts a call on the main thread: each slice of results is cached once.
+    """
+
+    def __init__(
+        self,
+        details_map: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+    ):
+        self._details_map = details_map
+        self._tables: List[pa.Table] = []
+        self._seen = 0
+        # Reentrant: a shutdown handler can run on a thread that holds it
+        self._lock = threading.RLock()
+
+    def table(self, results: List[Dict]) -> pa.Table:
+        """Games table for results, flattening only results not yet seen."""
+        end = len(results)
+        while True:
+            with self._lock:
+                start = self._seen
+                if start >= end:
+                    tables = list(self._tables)
+                    break
+            # Flatten outside the lock; it is the slow part
+            tail = results_to_games_table(
+                results[start:end], details_map=self._details_map
+            )
+            with self._lock:
+                # Another caller (the backoff saver thread, or a shutdown save
+                # that interrupted this one) may have cached this slice already
+                if self._seen == start:
+                    self._tables.append(tail)
+                    self._seen = end
+        if tables:
+            return pa.concat_tables(tables)
+        return _GAMES_SCHEMA.empty_table()
+
+    def write(self, results: List[Dict], parquet_path: str) -> None:
+        """Flatten results not yet seen and write all games to parquet_path."""
+        table = self.table(results)
+        _write_parquet_to_path(table, parquet_path)
+        logger.info(f"Saved {table.num_rows} games to {parquet_path}")
+
+
 def save_skipped_json(skipped: List[Dict], base_path: str) -> None:
     """Save tournaments skipped (no original report) to JSON for reporting."""
     if not skipped:
         return
     path = base_path.rstrip("/") + "_skipped.json"
-    content = json.dumps(skipped, indent=2, ensure_ascii=False)
+    content = orjson.dumps(skipped, option=orjson.OPT_INDENT_2)
     _write_to_path(path, content)
     logger.info("Saved %d skipped (no original report) to %s", len(skipped), path)
 
@@ -1301,9 +1565,9 @@ def save_skipped_json(skipped: List[Dict], base_path: str) -> None:
 def save_players_parquet(results: List[Dict], parquet_path: str):
     """Save players Parquet. PK: (player_id, tournament_id)."""
     try:
-        df = results_to_players_dataframe(results)
-        _write_parquet_to_path(df, parquet_path)
-        logger.info(f"Saved {len(df)} player rows to {parquet_path}")
+        table = results_to_players_table(results)
+        _write_parquet_to_path(table, parquet_path)
+        logger.info(f"Saved {table.num_rows} player rows to {parquet_path}")
     except Exception as e:
         logger.error(f"Players Parquet save failed: {e}")
 
@@ -1312,15 +1576,25 @@ def save_games_parquet(
     results: List[Dict],
     parquet_path: str,
     details_map: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
-):
-    """Save games as Parquet file (one row per game, main output format)."""
+    checkpointer: Optional[GamesCheckpoint] = None,
+) -> Optional[pa.Table]:
+    """
+    Save games as Parquet file (one row per game, main output format).
+    With checkpointer, results it already flattened are not flattened again.
+    Returns the games table written, or None if the save failed.
+    """
     try:
-        df = results_to_games_dataframe(results, details_map=details_map)
-        _write_parquet_to_path(df, parquet_path)
+        if checkpointer is not None:
+            table = checkpointer.table(results)
+        else:
+            table = results_to_games_table(results, details_map=details_map)
+        _write_parquet_to_path(table, parquet_path)
         logger.info(f"Saved {len(results)} tournament(s) to {parquet_path}")
-        logger.info(f"  Total games: {len(df)}")
+        logger.info(f"  Total games: {table.num_rows}")
+        return table
     except Exception as e:
         logger.error(f"Games Parquet save failed: {e}")
+        return None
 
 
 def _transform_results_round_dates_to_datetime(
@@ -1365,7 +1639,10 @@ def save_verbose_json_sample(
 ):
     """Save a sample of raw results (tournaments with players/rounds) to JSON. Supports local and S3 paths."""
     try:
-        sample_results = [r for r in results if r.get("success")][:sample_size]
+        # Stop at the first sample_size successes; no list of all successes
+        sample_results = list(
+            itertools.islice((r for r in results if r.get("success")), sample_size)
+        )
         if not sample_results:
             logger.warning("No successful results, skipping JSON sample")
             return
@@ -1382,8 +1659,11 @@ def save_verbose_json_sample(
                 f"Object of type {type(obj).__name__} is not JSON serializable"
             )
 
-        content = json.dumps(
-            sample_results, indent=2, ensure_ascii=False, default=_json_default
+        # Round dates go through default to keep the YYYY-MM-DD format
+        content = orjson.dumps(
+            sample_results,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
         )
         _write_to_path(json_path, content)
         logger.info(f"Saved sample of {len(sample_results)} tournaments to {json_path}")
@@ -1391,40 +1671,44 @@ def save_verbose_json_sample(
         logger.error(f"Verbose JSON sample save failed: {e}")
 
 
-def save_csv_sample_from_parquet(
-    parquet_path: str,
+def save_csv_sample(
+    games: Optional[pa.Table],
     csv_path: str,
     sample_size: int = 100,
 ):
     """
-    Read parquet, sample rows, save as CSV to confirm the parquet file works.
-    Supports local and S3 paths for both input and output.
+    Save a random sample of games as CSV, from the table save_games_parquet
+    just wrote (no re-read of the Parquet file). Supports local and S3 paths.
     """
+    if games is None:
+        return
     try:
-        df = pd.read_parquet(parquet_path)
-        if df.empty:
-            logger.warning("Parquet is empty, skipping CSV sample")
+        if games.num_rows == 0:
+            logger.warning("Games table is empty, skipping CSV sample")
             return
-        n = min(sample_size, len(df))
-        sample_df = df.sample(n=n, random_state=42) if n < len(df) else df
-        content = sample_df.to_csv(index=False)
+        n = min(sample_size, games.num_rows)
+        if n < games.num_rows:
+            # O(n) index draw; sorted so the gather walks the table's chunks
+            # (one per checkpoint slice) front to back
+            indices = sorted(random.Random(42).sample(range(games.num_rows), n))
+            games = games.take(pa.array(indices, type=pa.int64()))
+        content = games.to_pandas().to_csv(index=False)
         _write_to_path(csv_path, content)
-        logger.info(f"Saved sample of {n} games to {csv_path} (confirms parquet)")
+        logger.info(f"Saved sample of {n} games to {csv_path}")
     except Exception as e:
         logger.error(f"CSV sample save failed: {e}")
 
 
 def save_checkpoint(
-    games_path: str,
     results: List[Dict],
-    checkpoint_path: Optional[str] = None,
-    details_map: Optional[Dict[str, Tuple[Optional[str], Optional[str]]]] = None,
+    checkpoint_path: Optional[str],
+    checkpointer: GamesCheckpoint,
 ):
     """Save checkpoint (games parquet) to checkpoint path."""
     if not checkpoint_path:
         return
     try:
-        save_games_parquet(results, checkpoint_path, details_map=details_map)
+        checkpointer.write(results, checkpoint_path)
     except Exception as e:
         logger.error(f"Checkpoint save failed: {e}")
 
@@ -1440,6 +1724,7 @@ def run(
     output_sample_json: Optional[str] = None,
     output_sample_csv: Optional[str] = None,
     output_reports_base: Optional[str] = None,
+    workers: int = 4,
 ) -> int:
     """
     Scrape tournament reports for codes from input_path, write to output_path.
@@ -1456,6 +1741,7 @@ def run(
         output_sample_json: Optional path for verbose JSON sample (tournaments with players/rounds).
         output_sample_csv: Optional path for CSV sample from games parquet.
         output_reports_base: Optional base path for reports (e.g. skipped tournaments JSON).
+        workers: Concurrent fetch threads (requests are still paced by rate_limit).
 
     Returns:
         0 on success, 1 on failure.
@@ -1489,16 +1775,9 @@ def run(
 
                 local_path = Path(tempfile.gettempdir()) / "details_chunk.parquet"
                 download_to_file(details_path, local_path)
-                df = pd.read_parquet(local_path)
+                details_map = load_details_map(str(local_path))
             else:
-                df = pd.read_parquet(details_path)
-            ec_col = "event_code" if "event_code" in df.columns else "id"
-            for _, row in df.iterrows():
-                ec = row.get(ec_col)
-                if pd.notna(ec) and str(ec):
-                    sd = parse_details_date_to_iso(str(row.get("start_date", "")))
-                    ed = parse_details_date_to_iso(str(row.get("end_date", "")))
-                    details_map[str(ec)] = (sd, ed)
+                details_map = load_details_map(details_path)
             logger.info(
                 "Loaded date bounds for %d tournaments from %s",
                 len(details_map),
@@ -1514,12 +1793,7 @@ def run(
         games_path,
     )
 
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(
-        pool_connections=1, pool_maxsize=1, max_retries=0
-    )
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
+    session = create_session(workers)
 
     raw_base: Optional[str] = (
         _raw_base_from_output_path(output_path) if save_raw else None
@@ -1546,19 +1820,13 @@ def run(
 
     start_time = time.time()
 
-    for code in current_codes:
-        if rate_limiter:
-            rate_limiter.wait()
-        report, error, _, raw_content = fetch_tournament_report(
-            code, session, return_raw=save_raw
-        )
-
-        result = {"tournament_code": code}
+    for code, (report, error, _, raw_content) in iter_fetches(
+        current_codes, session, rate_limiter, workers, return_raw=save_raw
+    ):
         if report is None:
             if error in SKIPPABLE_ERRORS:
                 # No usable report data — skip and record for audit
-                result["success"] = False
-                result["error"] = error
+                result = {"tournament_code": code, "success": False, "error": error}
                 skipped_reports.append({"tournament_code": code, "error": error})
                 all_results.append(result)
                 if pbar:
@@ -1570,8 +1838,7 @@ def run(
             ) from None
 
         success_count += 1
-        result["success"] = True
-        result.update(report)
+        result = {"tournament_code": code, "success": True, **report}
         if raw_base and raw_content:
             raw_accumulator.append((code, raw_content))
 
@@ -1595,7 +1862,7 @@ def run(
         )
 
     save_players_parquet(all_results, players_path)
-    save_games_parquet(all_results, games_path, details_map=details_map)
+    games = save_games_parquet(all_results, games_path, details_map=details_map)
 
     if output_reports_base and skipped_reports:
         save_skipped_json(skipped_reports, output_reports_base)
@@ -1608,7 +1875,7 @@ def run(
             details_map=details_map,
         )
     if output_sample_csv:
-        save_csv_sample_from_parquet(games_path, output_sample_csv, sample_size=100)
+        save_csv_sample(games, output_sample_csv, sample_size=100)
 
     elapsed = time.time() - start_time
     logger.info("Done: %d tournaments in %s", success_count, format_duration(elapsed))
@@ -1654,6 +1921,18 @@ def main():
     parser.add_argument(
         "--max-retries", type=int, default=3, help="Max retry passes (default: 3)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent fetch threads sharing one session (default: 4)",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        type=int,
+        default=0,
+        help="Parse report pages in a pool of N processes instead of the fetch threads (default: 0 = no pool)",
+    )
     parser.add_argument(
         "--checkpoint",
         type=int,
@@ -1735,14 +2014,7 @@ def main():
         # Optionally load details for date inference
         if args.details_path and os.path.exists(args.details_path):
             try:
-                df = pd.read_parquet(args.details_path)
-                ec_col = "event_code" if "event_code" in df.columns else "id"
-                for _, row in df.iterrows():
-                    ec = row.get(ec_col)
-                    if pd.notna(ec) and str(ec):
-                        sd = parse_details_date_to_iso(str(row.get("start_date", "")))
-                        ed = parse_details_date_to_iso(str(row.get("end_date", "")))
-                        details_map[str(ec)] = (sd, ed)
+                details_map = load_details_map(args.details_path)
                 logger.info(
                     f"Loaded date bounds for {len(details_map)} tournaments from {args.details_path}"
                 )
@@ -1807,15 +2079,7 @@ def main():
         # Optionally load tournament_details for date inference (start/end) when available
         if os.path.exists(details_path):
             try:
-                df = pd.read_parquet(details_path)
-                ec_col = "event_code" if "event_code" in df.columns else "id"
-                success_df = df[df["success"] == True]
-                for _, row in success_df.iterrows():
-                    ec = row.get(ec_col)
-                    if pd.notna(ec) and str(ec):
-                        sd = parse_details_date_to_iso(str(row.get("start_date", "")))
-                        ed = parse_details_date_to_iso(str(row.get("end_date", "")))
-                        details_map[str(ec)] = (sd, ed)
+                details_map = load_details_map(details_path, success_only=True)
                 if details_map:
                     logger.info(
                         f"Loaded date bounds for {len(details_map)} tournaments from {details_path} (for date format inference)"
@@ -1924,32 +2188,46 @@ def main():
 
     start_time = time.time()
 
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(
-        pool_connections=1, pool_maxsize=1, max_retries=0
+    session = create_session(args.workers)
+    parse_executor = (
+        ProcessPoolExecutor(max_workers=args.parse_processes)
+        if args.parse_processes > 0
+        else None
     )
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
 
     all_results: List[Dict] = []
+    checkpointer = GamesCheckpoint(details_map=details_map)
     success_count = 0
     error_count = 0
     total_retries = 0
-    attempt_log: List[Dict] = [] if args.verbose_errors else []
+    attempt_log: List[Dict] = []  # failed fetches not yet counted (--verbose-errors)
+    verbose_lines: List[str] = []
+
+    def _flush_verbose():
+        if verbose_lines:
+            sys.stdout.write("\n".join(verbose_lines) + "\n")
+            sys.stdout.flush()
+            verbose_lines.clear()
 
     def _graceful_shutdown(signum, frame):
+        _flush_verbose()
         logger.warning("\nReceived interrupt, initiating graceful shutdown...")
         if all_results and games_path:
             try:
                 if players_path:
                     save_players_parquet(all_results, players_path)
-                save_games_parquet(all_results, games_path, details_map=details_map)
+                games = save_games_parquet(
+                    all_results,
+                    games_path,
+                    details_map=details_map,
+                    checkpointer=checkpointer,
+                )
                 if not args.no_samples and json_path:
                     save_verbose_json_sample(
                         all_results, json_path, sample_size=100, details_map=details_map
                     )
                 if not args.no_samples and csv_path:
-                    save_csv_sample_from_parquet(games_path, csv_path, sample_size=100)
+                    save_csv_sample(games, csv_path, sample_size=100)
                 logger.info("Saved %d results to %s", len(all_results), games_path)
             except Exception as e:
                 logger.error("Error saving partial results: %s", e)
@@ -1957,13 +2235,18 @@ def main():
 
     signal.signal(signal.SIGINT, _graceful_shutdown)
     signal.signal(signal.SIGTERM, _graceful_shutdown)
-    attempt_counts: List[Tuple[str, int]] = [] if args.verbose_errors else []
+    # --verbose-errors summary, aggregated as results arrive
+    attempt_dist: Counter = Counter()  # num HTTP attempts -> tournaments
+    retried_codes: List[str] = []  # tournaments needing > 1 attempt, in order
+    error_counts: Counter = Counter()  # failed-attempt error -> count
     current_tournaments = tournament_codes
+    n_total = len(tournament_codes)
 
     pbar = None
+    pbar_pending = 0
     if not args.verbose:
         pbar = tqdm(
-            total=len(tournament_codes),
+            total=n_total,
             desc="Processing",
             unit="tournament",
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]",
@@ -1977,43 +2260,52 @@ def main():
             logger.info(
                 f"Retry pass {pass_num}: waiting {format_duration(delay)} before retrying {len(current_tournaments)} tournaments"
             )
+            # Checkpoint during the backoff; it also pre-builds the games
+            # table the final save reuses
+            saver = None
+            if args.checkpoint > 0 and games_path:
+                saver = threading.Thread(
+                    target=save_checkpoint,
+                    args=(all_results, games_path + ".checkpoint", checkpointer),
+                )
+                saver.start()
             time.sleep(delay)
+            if saver is not None:
+                saver.join()
             total_retries += len(current_tournaments)
 
         pass_failed = []
 
-        for tournament_code in current_tournaments:
-            report, error, num_attempts, _ = fetch_tournament_report(
-                tournament_code,
-                session,
-                _attempt_log=attempt_log if args.verbose_errors else None,
-            )
+        for tournament_code, (report, error, num_attempts, _) in iter_fetches(
+            current_tournaments,
+            session,
+            workers=args.workers,
+            _attempt_log=attempt_log if args.verbose_errors else None,
+            parse_executor=parse_executor,
+        ):
             if args.verbose_errors:
-                attempt_counts.append((tournament_code, num_attempts))
-
-            result = {"tournament_code": tournament_code}
+                attempt_dist[num_attempts] += 1
+                if num_attempts > 1:
+                    retried_codes.append(tournament_code)
+                # Fold logged failures into counts; pop() is safe while
+                # fetch threads are still appending
+                while attempt_log:
+                    error_counts[attempt_log.pop().get("error", "unknown")] += 1
 
             if report is None:
                 error_count += 1
-                result["success"] = False
-                result["error"] = error or "fetch failed"
-                error_lower = error.lower() if error else ""
-                network_error_patterns = [
-                    "eof",
-                    "connection reset",
-                    "connection aborted",
-                    "remotedisconnected",
-                    "remote end closed",
-                    "broken pipe",
-                ]
-                is_network_error = any(p in error_lower for p in network_error_patterns)
-                if error and (is_network_error or "timeout" in error_lower):
+                result = {
+                    "tournament_code": tournament_code,
+                    "success": False,
+                    "error": error or "fetch failed",
+                }
+                if error and _RETRYABLE_ERR_RE.search(error):
                     if pass_num < args.max_retries:
                         pass_failed.append(tournament_code)
             else:
                 success_count += 1
-                result["success"] = True
-                result.update(report)
+                # One dict build per tournament instead of update() growth
+                result = {"tournament_code": tournament_code, "success": True, **report}
                 if not args.no_validation:
                     validate_pairings(result)
                     if players_df is not None:
@@ -2021,24 +2313,20 @@ def main():
                 if args.checkpoint > 0 and success_count % args.checkpoint == 0:
                     checkpoint_path = games_path + ".checkpoint" if games_path else None
                     logger.info(f"Saving checkpoint at {success_count} successful...")
-                    save_checkpoint(
-                        games_path,
-                        all_results,
-                        checkpoint_path,
-                        details_map=details_map,
-                    )
+                    save_checkpoint(all_results, checkpoint_path, checkpointer)
 
             all_results.append(result)
 
             total_processed = success_count + error_count
-            elapsed = time.time() - start_time
-
-            if total_processed > 0:
+            periodic = (
+                total_processed % _PBAR_POSTFIX_EVERY == 0 or total_processed == n_total
+            )
+            # Timing figures are only shown in verbose/show-time lines and
+            # periodic updates; skip them for the other iterations
+            if args.verbose or args.show_time or periodic:
+                elapsed = time.time() - start_time
                 avg_time = elapsed / total_processed
-                remaining = len(tournament_codes) - total_processed
-                est_remaining = avg_time * remaining
-            else:
-                est_remaining = 0
+                est_remaining = avg_time * (n_total - total_processed)
 
             if args.verbose:
                 actual_rate = total_processed / elapsed if elapsed > 0 else 0
@@ -2048,8 +2336,8 @@ def main():
                     http_retries = (
                         f" [{num_attempts} HTTP attempts]" if num_attempts > 1 else ""
                     )
-                    print(
-                        f"[{total_processed}/{len(tournament_codes)}] ✓ {tournament_code}: {num_players} players{retry_info}{http_retries} | "
+                    verbose_lines.append(
+                        f"[{total_processed}/{n_total}] ✓ {tournament_code}: {num_players} players{retry_info}{http_retries} | "
                         f"Actual: {actual_rate:.2f}/s | "
                         f"Elapsed: {format_duration(elapsed)} | Est: {format_duration(est_remaining)} | "
                         f"Success: {success_count} | Errors: {error_count} | Retries: {total_retries}"
@@ -2062,76 +2350,90 @@ def main():
                         f" [{num_attempts} HTTP attempts]" if num_attempts > 1 else ""
                     )
                     retry_status = " [WILL RETRY]" if will_retry else " [FINAL FAILURE]"
-                    print(
-                        f"[{total_processed}/{len(tournament_codes)}] ✗ {tournament_code}: {error_msg}{retry_info}{http_retries}{retry_status} | "
+                    verbose_lines.append(
+                        f"[{total_processed}/{n_total}] ✗ {tournament_code}: {error_msg}{retry_info}{http_retries}{retry_status} | "
                         f"Actual: {actual_rate:.2f}/s | "
                         f"Elapsed: {format_duration(elapsed)} | Est: {format_duration(est_remaining)} | "
                         f"Success: {success_count} | Errors: {error_count} | Retries: {total_retries}"
                     )
+                if len(verbose_lines) >= _VERBOSE_FLUSH_EVERY:
+                    _flush_verbose()
             else:
-                postfix_dict = {
-                    "✓": success_count,
-                    "✗": error_count,
-                    "rate": f"{total_processed / elapsed if elapsed > 0 else 0:.2f}/s",
-                }
-                if total_retries > 0 or pass_num > 0:
-                    postfix_dict["retries"] = total_retries
-                if pass_num > 0:
-                    postfix_dict["pass"] = f"{pass_num + 1}/{args.max_retries + 1}"
-                if len(pass_failed) > 0:
-                    postfix_dict["pending"] = len(pass_failed)
-                postfix_dict["est"] = (
-                    format_duration(est_remaining) if est_remaining > 0 else "?"
-                )
+                # Progress bar mode: advance in batches to keep tqdm redraws cheap
                 if pbar:
-                    pbar.update(1)
-                    pbar.set_postfix(postfix_dict)
+                    pbar_pending += 1
+                    if pbar_pending >= _PBAR_UPDATE_EVERY:
+                        pbar.update(pbar_pending)
+                        pbar_pending = 0
 
                 if args.show_time:
                     actual_rate = total_processed / elapsed if elapsed > 0 else 0
                     if result["success"]:
                         num_players = len(result.get("players", []))
                         logger.info(
-                            f"[{total_processed}/{len(tournament_codes)}] ✓ {tournament_code}: {num_players} players | "
+                            f"[{total_processed}/{n_total}] ✓ {tournament_code}: {num_players} players | "
                             f"Rate: {actual_rate:.2f}/s | Est: {format_duration(est_remaining)}"
                         )
                     else:
                         logger.info(
-                            f"[{total_processed}/{len(tournament_codes)}] ✗ {tournament_code}: {result.get('error', 'unknown')} | "
+                            f"[{total_processed}/{n_total}] ✗ {tournament_code}: {result.get('error', 'unknown')} | "
                             f"Rate: {actual_rate:.2f}/s"
                         )
 
-            if not args.verbose and (
-                total_processed % 50 == 0 or total_processed == len(tournament_codes)
-            ):
+            if not args.verbose and periodic:
                 actual_rate = total_processed / elapsed if elapsed > 0 else 0
+                if pbar:
+                    postfix_dict = {
+                        "✓": success_count,
+                        "✗": error_count,
+                        "rate": f"{actual_rate:.2f}/s",
+                    }
+                    if total_retries > 0 or pass_num > 0:
+                        postfix_dict["retries"] = total_retries
+                    if pass_num > 0:
+                        postfix_dict["pass"] = f"{pass_num + 1}/{args.max_retries + 1}"
+                    if len(pass_failed) > 0:
+                        postfix_dict["pending"] = len(pass_failed)
+                    postfix_dict["est"] = (
+                        format_duration(est_remaining) if est_remaining > 0 else "?"
+                    )
+                    pbar.set_postfix(postfix_dict)
                 logger.info(
-                    f"Progress: {total_processed}/{len(tournament_codes)} "
+                    f"Progress: {total_processed}/{n_total} "
                     f"({success_count}✓ {error_count}✗) | "
                     f"Actual: {actual_rate:.2f}/s | "
                     f"Elapsed: {format_duration(elapsed)} | Est: {format_duration(est_remaining)}"
                 )
 
+        _flush_verbose()  # before any retry-pass backoff
         current_tournaments = pass_failed
 
+    if parse_executor is not None:
+        parse_executor.shutdown()
+
     if pbar:
+        pbar.update(pbar_pending)
         pbar.close()
 
     # Save final results
     if players_path and games_path:
         save_players_parquet(all_results, players_path)
-        save_games_parquet(all_results, games_path, details_map=details_map)
+        games = save_games_parquet(
+            all_results, games_path, details_map=details_map, checkpointer=checkpointer
+        )
 
         if not args.no_samples:
             if csv_path:
-                save_csv_sample_from_parquet(games_path, csv_path, sample_size=100)
+                save_csv_sample(games, csv_path, sample_size=100)
             if json_path:
                 save_verbose_json_sample(
                     all_results, json_path, sample_size=100, details_map=details_map
                 )
     else:
         # If no output path specified, dump to stdout as JSON (for backwards compatibility)
-        json.dump(all_results, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(all_results, option=orjson.OPT_INDENT_2))
+        sys.stdout.buffer.flush()
 
     total_time = time.time() - start_time
     final_rate = (success_count + error_count) / total_time if total_time > 0 else 0
@@ -2170,23 +2472,23 @@ def main():
         logger.info(f"  CSV sample: {csv_path}")
 
     # Verbose error analysis
-    if args.verbose_errors and attempt_counts:
-        dist = Counter(n for _, n in attempt_counts)
-        retried = [(code, n) for code, n in attempt_counts if n > 1]
-        error_counts = Counter(e.get("error", "unknown") for e in attempt_log)
+    if args.verbose_errors and attempt_dist:
+        while attempt_log:
+            error_counts[attempt_log.pop().get("error", "unknown")] += 1
         logger.info("\nVerbose Error Analysis:")
-        logger.info("  Attempt distribution: %s", dict(sorted(dist.items())))
-        if retried:
-            codes = [c for c, _ in retried]
+        logger.info("  Attempt distribution: %s", dict(sorted(attempt_dist.items())))
+        if retried_codes:
             max_show = 30
-            if len(codes) <= max_show:
-                logger.info("  Tournaments needing retries (in order): %s", codes)
+            if len(retried_codes) <= max_show:
+                logger.info(
+                    "  Tournaments needing retries (in order): %s", retried_codes
+                )
             else:
                 logger.info(
                     "  Tournaments needing retries (first %d): %s ... and %d more",
                     max_show,
-                    codes[:max_show],
-                    len(codes) - max_show,
+                    retried_codes[:max_show],
+                    len(retried_codes) - max_show,
                 )
         if error_counts:
             logger.info("  Error breakdown: %s", dict(error_counts))
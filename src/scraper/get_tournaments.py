@@ -12,6 +12,7 @@ import csv
 import io
 import json
 import logging
+import operator
 import re
 import signal
 import sys
@@ -19,9 +20,10 @@ import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import aiohttp
+import orjson
 
 from raw_utils import build_concatenated_gzip
 from s3_io import (
@@ -47,6 +49,18 @@ logger = logging.getLogger(__name__)
 # Lambda hard timeout (ms) — standard functions max at 15 minutes
 _LAMBDA_MAX_MS = 900_000
 
+# Request headers and timeout shared by every federation request. Simple
+# headers that work with curl - no need for Referer or Origin
+_TOURNAMENTS_HEADERS = {
+    "X-Requested-With": "XMLHttpRequest",
+    "Accept": "application/json, text/javascript, */*; q=0.01",
+}
+_TOURNAMENTS_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
+# Response read buffer: large federations (RUS, IND, ...) return hundreds of KB
+# of JSON, which the default 64 KiB buffer reads in many small chunks
+_READ_BUFSIZE = 1 << 20
+
 
 def _lambda_remaining_ms(lambda_context: Optional[Any]) -> Optional[int]:
     """Best-effort remaining time when running inside AWS Lambda."""
@@ -66,7 +80,7 @@ _shutdown_requested = False
 _shutdown_state = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class Tournament:
     """Represents a tournament with its metadata."""
 
@@ -79,6 +93,10 @@ class Tournament:
     federation: str
 
 
+# Sort key for output order: the ID string (IDs are kept as strings)
+_BY_ID = operator.attrgetter("tournament_id")
+
+
 def format_time(seconds: float) -> str:
     """
     Format time in seconds to a human-readable string.
@@ -148,6 +166,19 @@ def read_federations(federations_path: Path) -> List[Tuple[str, str]]:
     return federations
 
 
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _link_text(html: str) -> str:
+    """Text of an <a ...>text</a> cell; falls back to stripping any tags."""
+    _, sep, rest = html.partition(">")
+    if sep:
+        text, sep, _ = rest.partition("</a>")
+        if sep:
+            return text
+    return _TAG_RE.sub("", html).strip() or html
+
+
 def parse_tournament_row(row: List, federation: str) -> Optional[Tournament]:
     """
     Parse a tournament row from the JSON response.
@@ -166,46 +197,62 @@ def parse_tournament_row(row: List, federation: str) -> Optional[Tournament]:
         if not tournament_id:
             return None
         if not is_valid_tournament_id(tournament_id):
-            logger.warning(f"Non-numeric tournament ID skipped: {tournament_id!r}")
+            logger.warning("Non-numeric tournament ID skipped: %r", tournament_id)
             return None
 
         # Extract name from HTML link: "<a href=\/report.phtml?event=399495>4th Annual Forester Open<\/a>"
-        name_html = row[1] if len(row) > 1 else ""
-        name_start = name_html.find(">") + 1
-        name_end = name_html.find("</a>")
-        if name_start > 0 and name_end > 0:
-            name = name_html[name_start:name_end]
-        else:
-            # Fallback: try to extract from any HTML
-            name = re.sub(r"<[^>]+>", "", name_html).strip() or name_html
+        name = _link_text(row[1] if len(row) > 1 else "")
 
         location = row[2] if len(row) > 2 else ""
         time_control = row[3] if len(row) > 3 else "s"
         start_date = row[4] if len(row) > 4 else ""
 
         # End date is in a link too
-        end_html = row[5] if len(row) > 5 else ""
-        end_start = end_html.find(">") + 1
-        end_end = end_html.find("</a>")
-        if end_start > 0 and end_end > 0:
-            end_date = end_html[end_start:end_end]
-        else:
-            end_date = re.sub(r"<[^>]+>", "", end_html).strip() or end_html
+        end_date = _link_text(row[5] if len(row) > 5 else "")
 
+        # Positional args (field order): measurably cheaper than keywords here
         return Tournament(
-            tournament_id=tournament_id,
-            name=name,
-            location=location,
-            time_control=time_control,
-            start_date=start_date,
-            end_date=end_date,
-            federation=federation,
+            tournament_id,
+            name,
+            location,
+            time_control,
+            start_date,
+            end_date,
+            federation,
         )
     except Exception as e:
-        logger.debug(f"Failed to parse tournament row: {e}")
+        logger.debug("Failed to parse tournament row: %s", e)
         return None
 
 
+def _parse_batch(rows: List[List], federation: str) -> List[Tournament]:
+    """Parse a federation's JSON rows, dropping rows that fail to parse."""
+    return [t for t in (parse_tournament_row(r, federation) for r in rows) if t]
+
+
+def create_session(max_concurrency: int = 1) -> aiohttp.ClientSession:
+    """
+    Session for tournament list fetches. Uses a 1 MiB read buffer, a keep-alive
+    pool of max_concurrency connections to FIDE (reused across federations)
+    and DNS cached for the whole run. Compressed responses are negotiated by
+    aiohttp's default Accept-Encoding (gzip, deflate, plus br/zstd when those
+    codecs are installed) and inflated transparently.
+    """
+    pool_size = max(max_concurrency, 1)
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        limit_per_host=pool_size,
+        ttl_dns_cache=3600,
+        use_dns_cache=True,
+        force_close=False,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        read_bufsize=_READ_BUFSIZE,
+        auto_decompress=True,
+    )
+
+
 async def fetch_federation_tournaments(
     session: aiohttp.ClientSession,
     semaphore: asyncio.Semaphore,
@@ -215,7 +262,7 @@ async def fetch_federation_tournaments(
     month: int,
     max_retries: int = 3,
     retry_delay: float = 1.0,
-) -> Tuple[str, str, List[Tournament], Optional[str], Optional[str]]:
+) -> Tuple[str, str, List[Tournament], Optional[str], Optional[bytes]]:
     """
     Fetch tournaments for one federation.
 
@@ -230,17 +277,11 @@ async def fetch_federation_tournaments(
         retry_delay: Delay in seconds between retries.
 
     Returns:
-        Tuple of (code, name, tournaments, error_message, raw_text).
-        error_message is None on success. raw_text is response text on success, None on error.
+        Tuple of (code, name, tournaments, error_message, raw_content).
+        error_message is None on success. raw_content is the response body
+        (bytes) on success, None on error.
     """
-    period = f"{year}-{month:02d}-01"
-    url = f"{TOURNAMENTS_URL}?country={code}&period={period}"
-
-    # Simple headers that work with curl - no need for Referer or Origin
-    headers = {
-        "X-Requested-With": "XMLHttpRequest",
-        "Accept": "application/json, text/javascript, */*; q=0.01",
-    }
+    url = f"{TOURNAMENTS_URL}?country={code}&period={year}-{month:02d}-01"
 
     for attempt in range(max_retries):
         if _shutdown_requested:
@@ -249,7 +290,7 @@ async def fetch_federation_tournaments(
         async with semaphore:
             try:
                 async with session.get(
-                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)
+                    url, headers=_TOURNAMENTS_HEADERS, timeout=_TOURNAMENTS_TIMEOUT
                 ) as resp:
                     if resp.status != 200:
                         error_msg = f"HTTP {resp.status}"
@@ -258,39 +299,33 @@ async def fetch_federation_tournaments(
                             continue
                         return (code, name, [], error_msg, None)
 
-                    # Read response as text first, then parse as JSON
-                    # This gives us more control and matches curl's behavior
-                    text = await resp.text()
-
-                    # Check if it looks like HTML (starts with <)
-                    if text.strip().startswith("<"):
-                        error_msg = f"Server returned HTML instead of JSON (got {len(text)} chars)"
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(retry_delay * (2**attempt))
-                            continue
-                        return (code, name, [], error_msg, None)
+                    # Parse the body bytes directly; no text decode round-trip
+                    raw = await resp.read()
 
-                    # Try to parse as JSON
+                    # Parse first; only a body that fails to parse is sniffed
+                    # for an HTML error page (HTML is never valid JSON)
+                    error_msg = None
                     try:
-                        data = json.loads(text)
-                    except json.JSONDecodeError as e:
-                        error_msg = f"Failed to parse JSON response: {e}"
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError as e:
+                        if raw.lstrip()[:1] == b"<":
+                            error_msg = f"Server returned HTML instead of JSON (got {len(raw)} bytes)"
+                        else:
+                            error_msg = f"Failed to parse JSON response: {e}"
+                    if error_msg:
                         if attempt < max_retries - 1:
                             await asyncio.sleep(retry_delay * (2**attempt))
                             continue
                         return (code, name, [], error_msg, None)
 
-                    if "data" not in data:
-                        # No tournaments - not an error, might be legitimate
-                        return (code, name, [], None, text)
+                    if not isinstance(data, dict) or not data.get("data"):
+                        # No tournaments (missing/empty/null "data", or a bare
+                        # null/list body) - not an error and not worth a retry
+                        return (code, name, [], None, raw)
 
-                    tournaments = []
-                    for row in data["data"]:
-                        tournament = parse_tournament_row(row, code)
-                        if tournament:
-                            tournaments.append(tournament)
-
-                    return (code, name, tournaments, None, text)
+                    # Parse after releasing the semaphore and connection
+                    rows = data["data"]
+                    break
 
             except asyncio.TimeoutError:
                 error_msg = "Timeout"
@@ -310,8 +345,13 @@ async def fetch_federation_tournaments(
                     await asyncio.sleep(retry_delay * (2**attempt))
                     continue
                 return (code, name, [], error_msg, None)
+    else:
+        return (code, name, [], "Max retries exceeded", None)
 
-    return (code, name, [], "Max retries exceeded", None)
+    # Row parsing runs in a worker thread so the event loop keeps driving the
+    # other federations' requests meanwhile
+    tournaments = await asyncio.to_thread(_parse_batch, rows, code)
+    return (code, name, tournaments, None, raw)
 
 
 async def fetch_available_periods(
@@ -345,6 +385,36 @@ async def fetch_available_periods(
         return []
 
 
+def _encode_outputs(
+    tournaments: List[Tournament], json_tournaments: List[Tournament]
+) -> Tuple[bytes, bytes]:
+    """
+    Encode the IDs file (one ID per line, all tournaments) and the JSON file
+    (json_tournaments as dicts, indented). Shared by the normal and shutdown
+    writes. IDs are encoded as UTF-8: is_valid_tournament_id uses isdigit(),
+    which also accepts non-ASCII digits.
+    """
+    ids_content = (
+        b"\n".join(t.tournament_id.encode("utf-8") for t in tournaments) + b"\n"
+    )
+    json_content = orjson.dumps(
+        [
+            {
+                "tournament_id": t.tournament_id,
+                "name": t.name,
+                "location": t.location,
+                "time_control": t.time_control,
+                "start_date": t.start_date,
+                "end_date": t.end_date,
+                "federation": t.federation,
+            }
+            for t in json_tournaments
+        ],
+        option=orjson.OPT_INDENT_2,
+    )
+    return ids_content, json_content
+
+
 def graceful_shutdown(signum: int, frame) -> None:
     """
     Handle graceful shutdown on SIGINT (Ctrl+C) or SIGTERM.
@@ -361,7 +431,8 @@ def graceful_shutdown(signum: int, frame) -> None:
     logger.warning(f"\nReceived {signal_name}, initiating graceful shutdown...")
 
     # Get state from module-level dict
-    all_tournaments = _shutdown_state.get("all_tournaments", [])
+    unique_tournaments = _shutdown_state.get("unique_tournaments", [])
+    tournament_count = _shutdown_state.get("tournament_count", 0)
     output_path = _shutdown_state.get("output_path")
     log_path = _shutdown_state.get("log_path")
     log_entries = _shutdown_state.get("log_entries", [])
@@ -369,50 +440,25 @@ def graceful_shutdown(signum: int, frame) -> None:
     total_federations = _shutdown_state.get("total_federations", 0)
     processing_start_time = _shutdown_state.get("processing_start_time", time.time())
     output_format = _shutdown_state.get("output_format", "ids")
+    shutdown_json_path = _shutdown_state.get("json_path")
 
-    # Remove duplicates
-    seen_ids = set()
-    unique_tournaments = []
-    for t in all_tournaments:
-        if t.tournament_id not in seen_ids:
-            seen_ids.add(t.tournament_id)
-            unique_tournaments.append(t)
-
-    # Sort by ID as string (IDs are kept as strings; numeric IDs sort correctly)
-    unique_tournaments.sort(key=lambda t: t.tournament_id)
+    # Already deduplicated as results arrived; sort a copy by ID as string
+    # (IDs are kept as strings; numeric IDs sort correctly)
+    unique_tournaments = sorted(unique_tournaments, key=_BY_ID)
 
     # Save partial results (local only; S3/Lambda = all-or-nothing, no partial writes)
     if output_path and unique_tournaments and not is_s3_path(str(output_path)):
         try:
-            output_data = [
-                {
-                    "tournament_id": t.tournament_id,
-                    "name": t.name,
-                    "location": t.location,
-                    "time_control": t.time_control,
-                    "start_date": t.start_date,
-                    "end_date": t.end_date,
-                    "federation": t.federation,
-                }
-                for t in unique_tournaments
-            ]
-            ids_content = "\n".join(t.tournament_id for t in unique_tournaments) + "\n"
-            json_content = json.dumps(output_data, indent=2, ensure_ascii=False)
+            ids_content, json_content = _encode_outputs(
+                unique_tournaments, unique_tournaments
+            )
 
             ids_path = Path(output_path)
             ids_path.parent.mkdir(parents=True, exist_ok=True)
-            ids_path.write_text(ids_content, encoding="utf-8")
-            json_uri_shutdown = _shutdown_state.get("json_uri")
-            if json_uri_shutdown:
-                json_path = Path(json_uri_shutdown)
-            else:
-                json_path = (
-                    ids_path.parent.parent / "tournament_ids_json" / ids_path.name
-                )
-                if json_path.suffix != ".json":
-                    json_path = json_path.with_suffix(".json")
+            ids_path.write_bytes(ids_content)
+            json_path = Path(shutdown_json_path)
             json_path.parent.mkdir(parents=True, exist_ok=True)
-            json_path.write_text(json_content, encoding="utf-8")
+            json_path.write_bytes(json_content)
 
             logger.info(
                 f"Saved {len(unique_tournaments)} unique tournament IDs to {ids_path} and {json_path}"
@@ -436,29 +482,12 @@ def graceful_shutdown(signum: int, frame) -> None:
     print("\n" + "=" * 80)
     print("Graceful Shutdown Summary:")
     print(f"  Federations processed: {processed_count}/{total_federations}")
-    print(f"  Tournament IDs collected: {len(all_tournaments)}")
+    print(f"  Tournament IDs collected: {tournament_count}")
     print(f"  Unique tournament IDs: {len(unique_tournaments)}")
     print(f"  Time elapsed: {format_time(elapsed_time)}")
     if output_path:
-        json_uri_shutdown = _shutdown_state.get("json_uri")
-        if is_s3_path(str(output_path)):
-            json_uri_disp = json_uri_shutdown or _json_uri_from_ids_uri(
-                str(output_path)
-            )
-            print(f"  IDs file: {output_path}")
-            print(f"  JSON file: {json_uri_disp}")
-        else:
-            ids_path = Path(output_path)
-            if json_uri_shutdown:
-                json_path = Path(json_uri_shutdown)
-            else:
-                json_path = (
-                    ids_path.parent.parent / "tournament_ids_json" / ids_path.name
-                )
-                if json_path.suffix != ".json":
-                    json_path = json_path.with_suffix(".json")
-            print(f"  IDs file: {ids_path}")
-            print(f"  JSON file: {json_path}")
+        print(f"  IDs file: {output_path}")
+        print(f"  JSON file: {shutdown_json_path}")
     if log_entries and log_path:
         print(f"  Log saved to: {log_path}")
     print("=" * 80)
@@ -475,6 +504,23 @@ def _raw_tournaments_uri_from_ids_uri(ids_uri: str) -> Optional[str]:
     return None
 
 
+def _shutdown_json_path(output_path: Union[Path, str], json_uri: Optional[str]) -> str:
+    """
+    Where graceful shutdown writes (local) or reports (S3) the tournament JSON.
+    An explicit json_uri wins; otherwise S3 uses the sample URI and local runs
+    use tournament_ids_json/<ids name>.json next to the IDs directory.
+    """
+    if json_uri:
+        return str(json_uri)
+    if is_s3_path(str(output_path)):
+        return _json_uri_from_ids_uri(str(output_path))
+    ids_path = Path(output_path)
+    json_path = ids_path.parent.parent / "tournament_ids_json" / ids_path.name
+    if json_path.suffix != ".json":
+        json_path = json_path.with_suffix(".json")
+    return str(json_path)
+
+
 def _json_uri_from_ids_uri(ids_uri: str) -> str:
     """Derive JSON sample URI from IDs URI."""
     if ids_uri.endswith(".json"):
@@ -565,9 +611,11 @@ async def scrape_month(
 
     # Set up signal handlers for graceful shutdown
     _shutdown_state = {
-        "all_tournaments": [],
+        "unique_tournaments": [],
+        "tournament_count": 0,
         "output_path": output_path,
         "json_uri": json_uri,
+        "json_path": _shutdown_json_path(output_path, json_uri),
         "log_path": None,  # Will be set if log_entries exist
         "log_entries": [],
         "processed_count": 0,
@@ -585,43 +633,87 @@ async def scrape_month(
         _raw_tournaments_uri_from_ids_uri(str(output_path)) if save_raw else None
     )
 
-    # Collect results
-    all_tournaments: List[Tournament] = []
+    # Collect results, deduplicating by tournament_id as they arrive
+    # (dict keeps first-seen order; the first federation to list an ID wins)
+    tournaments_by_id: Dict[str, Tournament] = {}
+    tournament_count = 0
     raw_items: List[Tuple[str, bytes]] = []
     errors = []
     federation_counts = {}
     processed_count = 0
+    # Shutdown state aliases the lists; mutations are visible to the handler
+    _shutdown_state["unique_tournaments"] = tournaments_by_id.values()
+    _shutdown_state["log_entries"] = errors
+    # Per-federation count lines, logged together at each progress tick
+    pending_count_lines: List[str] = []
+
+    def _flush_count_lines():
+        if pending_count_lines:
+            logger.info("\n".join(pending_count_lines))
+            pending_count_lines.clear()
 
     # Simple session - no cookie jar needed, curl works without it
-    async with aiohttp.ClientSession() as session:
-        coros = [
-            fetch_federation_tournaments(
-                session, semaphore, code, name, year, month, max_retries, retry_delay
-            )
-            for code, name in federations
+    async with create_session(max_concurrency) as session:
+        # A fixed pool of max_concurrency workers pulls federations from a queue
+        # and pushes results to another, instead of one task per federation all
+        # waiting on the semaphore (which the workers then never contend on)
+        pending_feds: asyncio.Queue = asyncio.Queue()
+        for fed in federations:
+            pending_feds.put_nowait(fed)
+        fetched: asyncio.Queue = asyncio.Queue()
+
+        async def _worker():
+            while True:
+                try:
+                    code, name = pending_feds.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    fetched.put_nowait(
+                        await fetch_federation_tournaments(
+                            session,
+                            semaphore,
+                            code,
+                            name,
+                            year,
+                            month,
+                            max_retries,
+                            retry_delay,
+                        )
+                    )
+                except Exception as e:
+                    fetched.put_nowait(e)
+                    return
+
+        workers = [
+            asyncio.create_task(_worker())
+            for _ in range(min(max(max_concurrency, 1), len(federations)))
         ]
-        task_objs = [asyncio.create_task(c) for c in coros]
+
+        async def _cancel_workers():
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         # Process results as they complete; fail fast on first federation error
-        for fut in asyncio.as_completed(task_objs):
+        for _ in range(len(federations)):
             if _shutdown_requested:
                 logger.warning("Shutdown requested, cancelling remaining tasks...")
-                for t in task_objs:
-                    if not t.done():
-                        t.cancel()
-                await asyncio.gather(*task_objs, return_exceptions=True)
+                await _cancel_workers()
                 break
 
-            code, name, tournaments, error, raw_text = await fut
+            item = await fetched.get()
+            if isinstance(item, Exception):
+                await _cancel_workers()
+                raise item
+            code, name, tournaments, error, raw_content = item
             processed_count += 1
 
-            if raw_tournaments_uri and not error and raw_text:
-                raw_items.append((code, raw_text.encode("utf-8")))
+            if raw_tournaments_uri and not error and raw_content:
+                raw_items.append((code, raw_content))
 
-            # Update shutdown state
-            _shutdown_state["all_tournaments"] = all_tournaments
+            # Update shutdown state (the lists are shared by reference)
             _shutdown_state["processed_count"] = processed_count
-            _shutdown_state["log_entries"] = errors
 
             if error:
                 errors.append(f"{code} ({name}): {error}")
@@ -631,19 +723,22 @@ async def scrape_month(
                     name,
                     error,
                 )
-                for t in task_objs:
-                    if not t.done():
-                        t.cancel()
-                await asyncio.gather(*task_objs, return_exceptions=True)
+                await _cancel_workers()
                 break
             else:
                 federation_counts[code] = len(tournaments)
-                if tournaments:
-                    logger.info(f"{code} ({name}): {len(tournaments)} tournaments")
-                all_tournaments.extend(tournaments)
+                if tournaments and logger.isEnabledFor(logging.INFO):
+                    pending_count_lines.append(
+                        f"{code} ({name}): {len(tournaments)} tournaments"
+                    )
+                tournament_count += len(tournaments)
+                _shutdown_state["tournament_count"] = tournament_count
+                for t in tournaments:
+                    tournaments_by_id.setdefault(t.tournament_id, t)
 
             # Progress update (print+flush for CloudWatch when Lambda times out)
             if processed_count % 10 == 0 or processed_count == len(federations):
+                _flush_count_lines()
                 elapsed = time.time() - start_time
                 progress_pct = (processed_count / len(federations)) * 100
                 if processed_count > 0:
@@ -679,46 +774,29 @@ async def scrape_month(
                             max(1, rem_ms // 60_000),
                         )
 
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    _flush_count_lines()
+
     # Write concatenated raw JSON from all federations (single file to reduce PUT costs)
     if raw_tournaments_uri and raw_items:
         compressed = build_concatenated_gzip(raw_items)
         write_output(compressed, raw_tournaments_uri)
 
-    # Deduplicate by tournament_id
-    seen_ids = set()
-    unique_tournaments = []
-    for t in all_tournaments:
-        if t.tournament_id not in seen_ids:
-            seen_ids.add(t.tournament_id)
-            unique_tournaments.append(t)
-
     # Sort by ID as string (IDs are kept as strings)
-    unique_tournaments.sort(key=lambda t: t.tournament_id)
+    unique_tournaments = sorted(tournaments_by_id.values(), key=_BY_ID)
 
     # Apply limit if set (for testing)
     if limit > 0:
         unique_tournaments = unique_tournaments[:limit]
         logger.info(f"Limited to first {limit} unique tournaments")
 
-    # Prepare JSON sample (first 50 for sanity check that IDs/metadata look correct)
+    # Full IDs go to data, a JSON sample (first 50, a sanity check that
+    # IDs/metadata look correct) to sample/
     SAMPLE_SIZE = 50
-    sample_tournaments = unique_tournaments[:SAMPLE_SIZE]
-    output_data = [
-        {
-            "tournament_id": t.tournament_id,
-            "name": t.name,
-            "location": t.location,
-            "time_control": t.time_control,
-            "start_date": t.start_date,
-            "end_date": t.end_date,
-            "federation": t.federation,
-        }
-        for t in sample_tournaments
-    ]
-
-    # Write full IDs to data, sample JSON to sample/
-    ids_content = "\n".join(t.tournament_id for t in unique_tournaments) + "\n"
-    json_content = json.dumps(output_data, indent=2, ensure_ascii=False)
+    ids_content, json_content = _encode_outputs(
+        unique_tournaments, unique_tournaments[:SAMPLE_SIZE]
+    )
 
     ids_uri = str(output_path)
     if json_uri is None and is_s3_path(ids_uri):
@@ -740,9 +818,9 @@ async def scrape_month(
         ids_path = Path(output_path)
         json_path = Path(json_uri_val)
         ids_path.parent.mkdir(parents=True, exist_ok=True)
-        ids_path.write_text(ids_content, encoding="utf-8")
+        ids_path.write_bytes(ids_content)
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_path.write_text(json_content, encoding="utf-8")
+        json_path.write_bytes(json_content)
 
     elapsed = time.time() - start_time
 
@@ -758,7 +836,7 @@ async def scrape_month(
         f"  Federations processed: {len(federations) - len(errors)}/{len(federations)}"
     )
     print(f"  Errors: {len(errors)}")
-    print(f"  Total tournaments: {len(all_tournaments)}")
+    print(f"  Total tournaments: {tournament_count}")
     print(f"  Unique tournaments: {len(unique_tournaments)}")
     print(f"  Time taken: {format_time(elapsed)}")
     print(f"  IDs file: {ids_path}")
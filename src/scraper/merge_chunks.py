@@ -169,7 +169,7 @@ def run(
 
     def _write_parquet(table: pa.Table, uri: str) -> None:
         buf = io.BytesIO()
-        pq.write_table(table, buf)
+        pq.write_table(table, buf, compression="zstd", compression_level=3)
         buf.seek(0)
         b, k = parse_s3_uri(uri)
         s3.put_object(Bucket=b, Key=k, Body=buf.getvalue())
@@ -8,8 +8,8 @@ One file per chunk instead of per-tournament to reduce S3 PUT costs.
 """
 
 import gzip
-import io
 import re
+import tempfile
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 
@@ -17,6 +17,37 @@ DELIMITER_PREFIX = b"\n!!FIDE!!id="
 DELIMITER_SUFFIX = b"!!\n"
 
 
+class ConcatenatedGzipWriter:
+    """
+    Incrementally build the concatenated gzip format.
+
+    Each (id, html) pair is compressed as it is added, into a spooled temp file
+    (in memory up to max_memory bytes, then on disk), so callers do not have to
+    hold every raw page until the end of a chunk.
+    """
+
+    def __init__(self, compresslevel: int = 9, max_memory: int = 8 * 1024 * 1024):
+        self._spool = tempfile.SpooledTemporaryFile(max_size=max_memory)
+        self._gz = gzip.GzipFile(
+            fileobj=self._spool, mode="wb", compresslevel=compresslevel
+        )
+        self.count = 0
+
+    def add(self, id_val: str, html: bytes) -> None:
+        """Append one tournament's HTML with its delimiter."""
+        self._gz.write(DELIMITER_PREFIX + id_val.encode("utf-8") + DELIMITER_SUFFIX)
+        self._gz.write(html)
+        self.count += 1
+
+    def getvalue(self) -> bytes:
+        """Finish the gzip stream and return the compressed bytes."""
+        self._gz.close()
+        self._spool.seek(0)
+        data = self._spool.read()
+        self._spool.close()
+        return data
+
+
 def build_concatenated_gzip(items: List[Tuple[str, bytes]]) -> bytes:
     """
     Build gzipped concatenation of (id, html) pairs.
@@ -26,13 +57,10 @@ def build_concatenated_gzip(items: List[Tuple[str, bytes]]) -> bytes:
     """
     if not items:
         return b""
-    buf = io.BytesIO()
+    writer = ConcatenatedGzipWriter()
     for id_val, html in items:
-        buf.write(DELIMITER_PREFIX + id_val.encode("utf-8") + DELIMITER_SUFFIX + html)
-    compressed = io.BytesIO()
-    with gzip.GzipFile(fileobj=compressed, mode="wb", compresslevel=9) as z:
-        z.write(buf.getvalue())
-    return compressed.getvalue()
+        writer.add(id_val, html)
+    return writer.getvalue()
 
 
 def extract_tournament(
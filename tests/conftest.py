@@ -1,9 +1,144 @@
 """Pytest configuration and path setup for scraper tests."""
 
+import os
 import sys
+import time
 from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
 
 # Add src/scraper to path so tests can import scraper modules
 _scraper_path = Path(__file__).parent.parent / "src" / "scraper"
 if str(_scraper_path) not in sys.path:
     sys.path.insert(0, str(_scraper_path))
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Max age of a live page cached under $FIDE_TEST_CACHE before it is refetched
+LIVE_CACHE_TTL_S = 3600
+
+
+def _mock_session(content: bytes) -> MagicMock:
+    """requests-like session whose get() returns a 200 response with content."""
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = content
+    session = MagicMock()
+    session.get.return_value = mock_response
+    return session
+
+
+@pytest.fixture(scope="session")
+def make_mock_session():
+    """Factory for requests-like sessions serving fixed content (see _mock_session)."""
+    return _mock_session
+
+
+@pytest.fixture(scope="session")
+def world_blitz_397341_html():
+    """World Blitz 397341 report page bytes, read once per session."""
+    return (FIXTURES_DIR / "world_blitz_397341_report.html").read_bytes()
+
+
+@pytest.fixture(scope="session")
+def candidates_24_details():
+    """
+    Candidates 2024 details page, read and parsed once per session.
+
+    Returns (fixture_html, details, error) from fetch_tournament_details on
+    a mocked session serving the fixture bytes.
+    """
+    from get_tournament_details import fetch_tournament_details
+
+    fixture_html = (FIXTURES_DIR / "candidates_24_details.html").read_bytes()
+    details, error, _, _ = fetch_tournament_details(
+        "368261", _mock_session(fixture_html)
+    )
+    return fixture_html, details, error
+
+
+@pytest.fixture(scope="session")
+def world_cup_25_report():
+    """
+    World Cup 2025 report page, read and parsed once per session.
+
+    Returns (fixture_html, report, error) from parse_report directly, so the
+    parser can be exercised (or profiled) without a mocked session.
+    """
+    from get_tournament_reports import parse_report
+
+    fixture_html = (FIXTURES_DIR / "world_cup_25_report.html").read_bytes()
+    report, error = parse_report("449502", fixture_html)
+    return fixture_html, report, error
+
+
+@pytest.fixture
+def fixture_report_results(world_cup_25_report, world_blitz_397341_html):
+    """
+    Successful results for the World Cup 449502 and World Blitz 397341 report
+    fixtures, as run() collects them. A fresh list per test; the parsed
+    reports themselves are shared and must not be mutated.
+    """
+    from get_tournament_reports import parse_report
+
+    _, world_cup, error = world_cup_25_report
+    assert error is None
+    blitz, error = parse_report("397341", world_blitz_397341_html)
+    assert error is None
+    return [
+        {"tournament_code": "449502", "success": True, **world_cup},
+        {"tournament_code": "397341", "success": True, **blitz},
+    ]
+
+
+@pytest.fixture(scope="session")
+def world_cup_25_live_report():
+    """
+    Live FIDE World Cup 2025 report (code 449502), fetched once per session.
+
+    With FIDE_TEST_CACHE set to a directory, the raw page is also kept there
+    and reused by later runs for up to LIVE_CACHE_TTL_S, so iterating on the
+    online tests does not refetch it every time. Returns (report, error).
+    """
+    import requests
+
+    from get_tournament_reports import fetch_tournament_report
+
+    cache_dir = os.environ.get("FIDE_TEST_CACHE")
+    cache_path = Path(cache_dir) / "world_cup_25_report.html" if cache_dir else None
+    if (
+        cache_path is not None
+        and cache_path.exists()
+        and time.time() - cache_path.stat().st_mtime < LIVE_CACHE_TTL_S
+    ):
+        report, error, _, _ = fetch_tournament_report(
+            "449502", _mock_session(cache_path.read_bytes())
+        )
+        return report, error
+
+    report, error, _, raw = fetch_tournament_report(
+        "449502", requests.Session(), return_raw=True
+    )
+    if cache_path is not None and error is None and raw is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(raw)
+    return report, error
+
+
+@pytest.fixture(scope="session")
+def downloaded_players():
+    """Live FIDE player list, downloaded and parsed once for all online tests."""
+    from get_player_list import get_player_list
+
+    return get_player_list()
+
+
+@pytest.fixture(scope="session")
+def fide_valid_fed_codes():
+    """Live FIDE federation codes (uppercase) plus the special FID/NON codes."""
+    from get_federations import get_federations_with_retries
+
+    federations = get_federations_with_retries()
+    return frozenset(f["code"].upper() for f in federations) | {"FID", "NON"}
@@ -1,20 +1,41 @@
 """Tests for get_player_list scraper."""
 
+import gzip
 from io import BytesIO
 import zipfile
+from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
+import requests
 
 from get_player_list import (
     DOWNLOAD_URL,
+    OPEN_TITLES,
+    WOMEN_TITLES,
     parse_xml_content,
     process_zip,
-    get_player_list,
     download_player_list,
+    download_player_list_to_file,
     build_report,
+    _compress_xml_gzip,
     _process_zip_internal,
 )
 
+# One player with a lowercase fed and single-letter title, shared by the
+# normalization and zip tests
+TEST_PLAYER_XML = b"""<?xml version="1.0"?>
+<playerslist>
+<player>
+<fideid>10292519</fideid>
+<name>Test Player</name>
+<country>usa</country>
+<sex>M</sex>
+<title>g</title>
+<birthday>1990</birthday>
+</player>
+</playerslist>"""
+
 
 class TestParsePlayerList:
     """Tests for parsing logic using fixtures."""
@@ -55,18 +76,7 @@ class TestParsePlayerList:
 
     def test_parse_xml_content_normalizes_title_and_fed(self):
         """Title (g->GM) and fed (uppercase) are normalized."""
-        xml = b"""<?xml version="1.0"?>
-<playerslist>
-<player>
-<fideid>10292519</fideid>
-<name>Test Player</name>
-<country>usa</country>
-<sex>M</sex>
-<title>g</title>
-<birthday>1990</birthday>
-</player>
-</playerslist>"""
-        players, _ = parse_xml_content(xml)
+        players, _ = parse_xml_content(TEST_PLAYER_XML)
         assert len(players) == 1
         assert players[0]["fed"] == "USA"
         assert players[0]["title"] == "GM"
@@ -121,20 +131,9 @@ class TestParsePlayerList:
 
     def test_process_zip_extracts_and_parses(self):
         """process_zip extracts XML from zip and parses."""
-        xml_content = b"""<?xml version="1.0"?>
-<playerslist>
-<player>
-<fideid>10292519</fideid>
-<name>Test Player</name>
-<country>USA</country>
-<sex>M</sex>
-<title>g</title>
-<birthday>1990</birthday>
-</player>
-</playerslist>"""
         buf = BytesIO()
         with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-            zf.writestr("players_list_xml_foa.xml", xml_content)
+            zf.writestr("players_list_xml_foa.xml", TEST_PLAYER_XML)
 
         players = process_zip(buf.getvalue())
         assert len(players) == 1
@@ -144,6 +143,34 @@ class TestParsePlayerList:
         assert players[0]["title"] == "GM"
         assert players[0]["byear"] == 1990
 
+        buf.seek(0)
+        assert process_zip(buf) == players
+
+    def test_process_zip_internal_keeps_xml_for_raw_copy(self):
+        """The extracted XML stays readable (for the gzip raw copy) after parsing."""
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("players_list_xml_foa.xml", TEST_PLAYER_XML)
+
+        players, _, xml_content = _process_zip_internal(buf.getvalue())
+        assert len(players) == 1
+        assert xml_content[:] == TEST_PLAYER_XML
+        assert gzip.decompress(_compress_xml_gzip(xml_content)) == TEST_PLAYER_XML
+
+    def test_download_to_file_streams_chunks_and_retries(self):
+        """download_player_list_to_file writes streamed chunks; retries failures."""
+        ok = MagicMock()
+        ok.__enter__.return_value = ok
+        ok.iter_content.return_value = [b"PK", b"\x03\x04", b"rest"]
+        session = MagicMock()
+        session.get.side_effect = [requests.ConnectionError("reset"), ok]
+
+        with download_player_list_to_file(retry_delay=0, session=session) as f:
+            assert f.read() == b"PK\x03\x04rest"
+
+        assert session.get.call_count == 2
+        assert session.get.call_args.kwargs["stream"] is True
+
     def test_build_report_produces_expected_structure(self):
         """Report contains players_found, xml_fields_found, odd_by_column, etc."""
         xml = b"""<?xml version="1.0"?>
@@ -181,12 +208,14 @@ class TestGetPlayerListOnline:
             assert any(n.endswith(".xml") for n in names)
 
     @pytest.mark.online
-    def test_get_player_list_returns_non_empty_with_expected_format(self):
+    def test_get_player_list_returns_non_empty_with_expected_format(
+        self, downloaded_players
+    ):
         """
         Endpoint check: full pipeline returns players with expected structure.
         Run with: pytest -m online
         """
-        players = get_player_list()
+        players = downloaded_players
         assert len(players) > 100_000
         p = players[0]
         required = {"id", "name", "byear", "sex", "fed", "title", "w_title"}
@@ -197,56 +226,55 @@ class TestGetPlayerListOnline:
         assert p["sex"] in ("M", "F", None)
 
     @pytest.mark.online
-    def test_player_list_field_validity(self):
+    def test_player_list_field_validity(self, downloaded_players):
         """
         Validate field constraints on downloaded player list.
         Run with: pytest -m online
         """
-        players = get_player_list()
+        players = downloaded_players
         assert len(players) > 0
 
         current_year = __import__("datetime").datetime.now().year
-        OPEN_TITLES = frozenset({"GM", "IM", "FM", "CM"})
-        WOMEN_TITLES = frozenset({"WGM", "WIM", "WFM", "WCM"})
-
-        for p in players:
-            assert isinstance(p["id"], int), f"Invalid id: {p['id']!r}"
-
-            if p.get("byear") is not None:
-                assert (
-                    1900 <= p["byear"] < current_year
-                ), f"byear out of range: {p['byear']} for id={p['id']}"
-
-            if p.get("title"):
-                assert (
-                    p["title"] in OPEN_TITLES
-                ), f"Invalid title (open only): {p['title']!r} for id={p['id']}"
-            if p.get("w_title"):
-                assert (
-                    p["w_title"] in WOMEN_TITLES
-                ), f"Invalid w_title (women only): {p['w_title']!r} for id={p['id']}"
-
-            if p.get("sex") is not None:
-                assert p["sex"] in (
-                    "M",
-                    "F",
-                ), f"Invalid sex: {p['sex']!r} for id={p['id']}"
+
+        # One column-wise pass per field instead of a Python loop over ~1M dicts
+        df = pd.DataFrame.from_records(
+            players, columns=["id", "byear", "title", "w_title", "sex"]
+        )
+
+        def first_bad(mask: pd.Series, col: str) -> str:
+            row = df[mask].iloc[0]
+            return f"{row[col]!r} for id={row['id']}"
+
+        assert pd.api.types.is_integer_dtype(df["id"]), "Non-int ids present"
+
+        byear = df["byear"]
+        bad = byear.notna() & ((byear < 1900) | (byear >= current_year))
+        assert not bad.any(), f"byear out of range: {first_bad(bad, 'byear')}"
+
+        title = df["title"]
+        bad = title.notna() & title.ne("") & ~title.isin(OPEN_TITLES)
+        assert not bad.any(), f"Invalid title (open only): {first_bad(bad, 'title')}"
+
+        w_title = df["w_title"]
+        bad = w_title.notna() & w_title.ne("") & ~w_title.isin(WOMEN_TITLES)
+        assert (
+            not bad.any()
+        ), f"Invalid w_title (women only): {first_bad(bad, 'w_title')}"
+
+        sex = df["sex"]
+        bad = sex.notna() & ~sex.isin(["M", "F"])
+        assert not bad.any(), f"Invalid sex: {first_bad(bad, 'sex')}"
 
     @pytest.mark.online
-    def test_player_list_fed_codes_in_federations(self):
+    def test_player_list_fed_codes_in_federations(
+        self, downloaded_players, fide_valid_fed_codes
+    ):
         """
         Every fed code in the player list must be a valid FIDE federation code.
         Run with: pytest -m online
         """
-        from get_federations import get_federations_with_retries
-
-        federations = get_federations_with_retries()
-        valid_codes = frozenset(c.upper() for c in (f["code"] for f in federations))
-        special_codes = frozenset({"FID", "NON"})
-        valid_codes = valid_codes | special_codes
-
-        players = get_player_list()
-        unique_feds = {p["fed"].upper() for p in players if p.get("fed")}
+        # fed is uppercased by parse_xml_content
+        unique_feds = {p["fed"] for p in downloaded_players if p.get("fed")}
 
-        invalid = unique_feds - valid_codes
+        invalid = unique_feds - fide_valid_fed_codes
         assert not invalid, f"FED codes not in FIDE federation list: {invalid}"
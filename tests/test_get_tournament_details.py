@@ -1,30 +1,28 @@
 """Tests for get_tournament_details scraper."""
 
-from pathlib import Path
+import time
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
 import requests
 
-from get_tournament_details import fetch_tournament_details
+from get_tournament_details import (
+    ParquetCheckpoint,
+    RateLimiter,
+    fetch_tournament_details,
+    flatten_result,
+    iter_fetches,
+    results_to_dataframe,
+)
 
 
 class TestFixtureBasedParsing:
     """Tests using real FIDE HTML fixture. Validates parser against actual format."""
 
-    def test_parses_candidates_24_fixture(self):
+    def test_parses_candidates_24_fixture(self, candidates_24_details):
         """Parse real FIDE Candidates 2024 details HTML. Catches format drift."""
-        fixture_path = Path(__file__).parent / "fixtures" / "candidates_24_details.html"
-        fixture_html = fixture_path.read_bytes()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = fixture_html
-
-        session = MagicMock()
-        session.get.return_value = mock_response
-
-        details, error, _, _ = fetch_tournament_details("368261", session)
+        _, details, error = candidates_24_details
 
         assert error is None
         assert details is not None
@@ -37,27 +35,15 @@ class TestFixtureBasedParsing:
         assert details.get("end_date") == "2024-04-23"
 
     @pytest.mark.online
-    def test_live_fetch_matches_fixture(self):
+    def test_live_fetch_matches_fixture(self, candidates_24_details):
         """
         Smoke test: fetching live from FIDE gives same parsed result as fixture.
         https://ratings.fide.com/tournament_information.phtml?event=368261
         Run with: pytest -m online
         Skip in CI: pytest -m "not online"
         """
-        # Parse fixture
-        fixture_path = Path(__file__).parent / "fixtures" / "candidates_24_details.html"
-        fixture_html = fixture_path.read_bytes()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = fixture_html
-
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-
-        details_fixture, error_fixture, _, _ = fetch_tournament_details(
-            "368261", mock_session
-        )
+        # Parsed fixture (shared, parsed once per session)
+        _, details_fixture, error_fixture = candidates_24_details
         assert error_fixture is None
         assert details_fixture is not None
 
@@ -97,3 +83,91 @@ class TestFixtureBasedParsing:
         assert details["name"]
         assert details["city"]
         assert details["fed"]
+
+
+class TestFetchErrors:
+    """Tests for fetch_tournament_details error handling."""
+
+    def test_not_found_is_not_retried(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        session = MagicMock()
+        session.get.return_value = mock_response
+
+        details, error, num_attempts, _ = fetch_tournament_details("1", session)
+
+        assert details is None
+        assert error == "HTTP 404"
+        assert num_attempts == 1
+        assert session.get.call_count == 1
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter."""
+
+    def test_spaces_requests(self):
+        limiter = RateLimiter(20.0)
+        start = time.monotonic()
+        for _ in range(4):
+            limiter.wait()
+        assert time.monotonic() - start >= 0.15
+
+    def test_zero_rate_is_unlimited(self):
+        limiter = RateLimiter(0)
+        start = time.monotonic()
+        for _ in range(100):
+            limiter.wait()
+        assert time.monotonic() - start < 0.1
+        assert limiter.get_rate() == 0
+
+
+class TestIterFetches:
+    """Tests for iter_fetches() (thread pool sharing one session)."""
+
+    def test_yields_each_id_once_with_workers(
+        self, candidates_24_details, make_mock_session
+    ):
+        session = make_mock_session(candidates_24_details[0])
+
+        ids = [str(i) for i in range(10)]
+        results = dict(iter_fetches(ids, session, RateLimiter(1000.0), workers=3))
+
+        assert sorted(results) == sorted(ids)
+        for details, error, num_attempts, _ in results.values():
+            assert error is None
+            assert details["id"] == "368261"
+            assert num_attempts == 1
+
+
+class TestParquetCheckpoint:
+    """Tests for ParquetCheckpoint (incremental checkpoint writes)."""
+
+    def test_repeated_writes_match_full_save(self, tmp_path):
+        results = [
+            {
+                "tournament_id": "1",
+                "success": True,
+                "details": {
+                    "id": "1",
+                    "name": "Open",
+                    "n_players": "10",
+                    "time_control": "Standard: 90 min",
+                    "start_date": "2024-04-03",
+                },
+            },
+            {"tournament_id": "2", "success": False, "error": "no data found"},
+        ]
+        checkpointer = ParquetCheckpoint()
+        path = tmp_path / "out.parquet.checkpoint"
+
+        flat_rows = [flatten_result(r) for r in results]
+        checkpointer.write(flat_rows[:1], str(path))
+        assert pd.read_parquet(path)["tournament_id"].tolist() == ["1"]
+
+        checkpointer.write(flat_rows, str(path))
+        df = pd.read_parquet(path)
+        expected = results_to_dataframe(results)
+        assert df["tournament_id"].tolist() == ["1", "2"]
+        assert df["n_players"].tolist()[0] == 10
+        assert df["start_date"].iloc[0] == expected["start_date"].iloc[0]
+        assert df["error"].tolist() == expected["error"].tolist()
@@ -1,25 +1,39 @@
 """Unit tests for pure parsing functions in get_tournament_reports."""
 
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pandas as pd
 import pytest
-import requests
 
+import get_tournament_reports
 from get_tournament_reports import (
     ERROR_REPORT_UPDATED_OR_REPLACED,
+    GamesCheckpoint,
+    create_session,
+    details_map_from_df,
     extract_forfeit_indicator,
     fetch_tournament_report,
     flatten_result,
     flatten_to_games,
     format_duration,
     infer_date_format,
+    iter_fetches,
+    load_details_map,
     parse_date_to_iso,
     parse_details_date_to_iso,
+    parse_report,
     parse_round_date,
     parse_score,
+    parse_score_and_forfeit,
     results_to_games_dataframe,
     results_to_players_dataframe,
+    save_csv_sample,
+    save_games_parquet,
 )
 
 
@@ -92,6 +106,29 @@ class TestExtractForfeitIndicator:
         assert extract_forfeit_indicator("0.5") == ""
 
 
+class TestParseScoreAndForfeit:
+    """Tests for parse_score_and_forfeit() (single pass over a score cell)."""
+
+    def test_plain_scores_have_no_forfeit(self):
+        assert parse_score_and_forfeit("1.0") == (1.0, "")
+        assert parse_score_and_forfeit(" 0 ") == (0.0, "")
+        assert parse_score_and_forfeit("½") == (0.5, "")
+
+    def test_forfeits(self):
+        assert parse_score_and_forfeit("Forfeit(-)") == (None, "-")
+        assert parse_score_and_forfeit("Forfeit(+)") == (None, "+")
+        assert parse_score_and_forfeit("+") == (None, "+")
+
+    def test_stray_bytes_fall_back_to_regex(self):
+        assert parse_score_and_forfeit("\u00c20.5") == (0.5, "")
+        assert parse_score_and_forfeit("\u00c2\xa0 0") == (0.0, "")
+
+    def test_empty_or_invalid(self):
+        assert parse_score_and_forfeit("") == (None, "")
+        assert parse_score_and_forfeit(None) == (None, "")
+        assert parse_score_and_forfeit("2.0") == (None, "")
+
+
 class TestParseDetailsDateToIso:
     """Tests for parse_details_date_to_iso()."""
 
@@ -123,6 +160,48 @@ class TestParseDetailsDateToIso:
         assert parse_details_date_to_iso(ts) == "2024-01-15"
 
 
+class TestDetailsMapFromDf:
+    """Tests for details_map_from_df() / load_details_map() (date bounds)."""
+
+    def test_maps_event_code_to_iso_bounds(self):
+        df = pd.DataFrame(
+            {
+                "event_code": ["368261", None, "1"],
+                "success": [True, True, False],
+                "start_date": [pd.Timestamp("2024-04-03"), pd.NaT, pd.NaT],
+                "end_date": [pd.Timestamp("2024-04-23"), pd.NaT, pd.NaT],
+            }
+        )
+        assert details_map_from_df(df) == {
+            "368261": ("2024-04-03", "2024-04-23"),
+            "1": (None, None),
+        }
+        assert details_map_from_df(df, success_only=True) == {
+            "368261": ("2024-04-03", "2024-04-23")
+        }
+
+    def test_falls_back_to_id_column(self):
+        df = pd.DataFrame({"id": ["5"], "start_date": ["2024.12.30"]})
+        assert details_map_from_df(df) == {"5": ("2024-12-30", None)}
+
+    def test_load_details_map_matches_dataframe_path(self, tmp_path):
+        df = pd.DataFrame(
+            {
+                "event_code": ["368261", None, "1"],
+                "name": ["Candidates", "x", "y"],
+                "success": [True, True, False],
+                "start_date": [pd.Timestamp("2024-04-03"), pd.NaT, pd.NaT],
+                "end_date": [pd.Timestamp("2024-04-23"), pd.NaT, pd.NaT],
+            }
+        )
+        path = tmp_path / "details.parquet"
+        df.to_parquet(path, index=False)
+        for success_only in (False, True):
+            assert load_details_map(
+                str(path), success_only=success_only
+            ) == details_map_from_df(df, success_only=success_only)
+
+
 class TestInferDateFormat:
     """Tests for infer_date_format()."""
 
@@ -405,19 +484,9 @@ class TestFlattenToGames:
 class TestFixtureBasedParsing:
     """Tests using real FIDE HTML fixture. Validates parser against actual format."""
 
-    def test_parses_world_cup_25_report_fixture(self):
+    def test_parses_world_cup_25_report_fixture(self, world_cup_25_report):
         """Parse real FIDE World Cup 2025 report HTML. Catches format drift."""
-        fixture_path = Path(__file__).parent / "fixtures" / "world_cup_25_report.html"
-        fixture_html = fixture_path.read_bytes()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = fixture_html
-
-        session = MagicMock()
-        session.get.return_value = mock_response
-
-        report, error, _, _ = fetch_tournament_report("449502", session)
+        _, report, error = world_cup_25_report
 
         assert error is None
         assert report is not None
@@ -543,32 +612,21 @@ class TestFixtureBasedParsing:
         assert error == ERROR_REPORT_UPDATED_OR_REPLACED
 
     @pytest.mark.online
-    def test_live_fetch_matches_fixture(self):
+    def test_live_fetch_matches_fixture(
+        self, world_cup_25_report, world_cup_25_live_report
+    ):
         """
         Smoke test: fetching live from FIDE gives same parsed result as fixture.
         Run with: pytest -m online
         Skip in CI: pytest -m "not online"
         """
-        # Parse fixture
-        fixture_path = Path(__file__).parent / "fixtures" / "world_cup_25_report.html"
-        fixture_html = fixture_path.read_bytes()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.content = fixture_html
-
-        mock_session = MagicMock()
-        mock_session.get.return_value = mock_response
-
-        report_fixture, error_fixture, _, _ = fetch_tournament_report(
-            "449502", mock_session
-        )
+        # Parsed fixture (shared, parsed once per session)
+        _, report_fixture, error_fixture = world_cup_25_report
         assert error_fixture is None
         assert report_fixture is not None
 
-        # Fetch live from FIDE
-        live_session = requests.Session()
-        report_live, error_live, _, _ = fetch_tournament_report("449502", live_session)
+        # Fetch live from FIDE (shared, fetched once per session)
+        report_live, error_live = world_cup_25_live_report
 
         assert error_live is None, f"Live fetch failed: {error_live}"
         assert report_live is not None
@@ -580,13 +638,14 @@ class TestFixtureBasedParsing:
         )
 
     @pytest.mark.online
-    def test_live_endpoint_returns_non_empty_with_expected_format(self):
+    def test_live_endpoint_returns_non_empty_with_expected_format(
+        self, world_cup_25_live_report
+    ):
         """
         Endpoint check: tournament report returns non-empty data with expected structure.
         Run with: pytest -m online
         """
-        live_session = requests.Session()
-        report, error, _, _ = fetch_tournament_report("449502", live_session)
+        report, error = world_cup_25_live_report
 
         assert error is None, f"Fetch failed: {error}"
         assert report is not None
@@ -602,3 +661,212 @@ class TestFixtureBasedParsing:
         assert player["id"]
         assert player["name"]
         assert player["total"] is not None
+
+
+class TestFetchErrors:
+    """Tests for fetch_tournament_report error handling."""
+
+    def test_http_error_is_single_attempt(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        session = MagicMock()
+        session.get.return_value = mock_response
+        attempt_log = []
+
+        report, error, num_attempts, _ = fetch_tournament_report(
+            "1", session, _attempt_log=attempt_log
+        )
+
+        assert report is None
+        assert error == "HTTP 404"
+        assert num_attempts == 1
+        assert session.get.call_count == 1
+        assert [e["error"] for e in attempt_log] == ["HTTP 404"]
+
+    def test_session_retries_transient_statuses(self):
+        retry = create_session().get_adapter("https://ratings.fide.com").max_retries
+        assert 503 in retry.status_forcelist
+        assert retry.connect == 0
+        # Retry-After is ignored so a long server-requested wait cannot stall a fetch
+        assert retry.respect_retry_after_header is False
+
+
+class TestCreateSession:
+    """Tests for create_session() connection pooling."""
+
+    def test_worker_threads_reuse_pooled_connections(self):
+        client_ports = set()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                client_ports.add(self.client_address[1])
+                time.sleep(0.01)  # keep requests in flight concurrently
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_port}/"
+        session = create_session(workers=4)
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                statuses = list(
+                    pool.map(lambda _: session.get(url).status_code, range(40))
+                )
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+        assert statuses == [200] * 40
+        # One connection per worker at most; no reconnect per request
+        assert 1 <= len(client_ports) <= 4
+
+
+class TestIterFetches:
+    """Tests for iter_fetches() (thread pool sharing one session)."""
+
+    def test_yields_each_code_once_with_workers(
+        self, world_blitz_397341_html, make_mock_session
+    ):
+        session = make_mock_session(world_blitz_397341_html)
+
+        codes = [str(i) for i in range(8)]
+        results = dict(iter_fetches(codes, session, workers=3))
+
+        assert sorted(results) == sorted(codes)
+        for report, error, _, _ in results.values():
+            assert error is None
+            assert report["players"]
+
+    def test_fetches_overlap_across_workers(
+        self, world_blitz_397341_html, make_mock_session
+    ):
+        session = make_mock_session(world_blitz_397341_html)
+        mock_response = session.get.return_value
+        # Each get blocks until three are in flight; serial fetches would time out
+        barrier = threading.Barrier(3, timeout=5)
+
+        def _get(*args, **kwargs):
+            barrier.wait()
+            return mock_response
+
+        session.get.side_effect = _get
+
+        codes = [str(i) for i in range(6)]
+        results = dict(iter_fetches(codes, session, workers=3))
+
+        assert sorted(results) == sorted(codes)
+        assert all(error is None for _, error, _, _ in results.values())
+
+    def test_parse_executor_matches_inline_parse(
+        self, world_blitz_397341_html, make_mock_session
+    ):
+        session = make_mock_session(world_blitz_397341_html)
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results = dict(
+                iter_fetches(["397341"], session, workers=2, parse_executor=pool)
+            )
+
+        report, error, _, _ = results["397341"]
+        assert error is None
+        assert (report, error) == parse_report("397341", world_blitz_397341_html)
+
+
+class TestGamesCheckpoint:
+    """Tests for GamesCheckpoint (incremental checkpoint writes)."""
+
+    def test_repeated_writes_match_full_save(self, tmp_path, fixture_report_results):
+        results = fixture_report_results
+        results.insert(1, {"tournament_code": "1", "success": False, "error": "x"})
+        checkpointer = GamesCheckpoint()
+        path = tmp_path / "games.parquet.checkpoint"
+
+        checkpointer.write(results[:1], str(path))
+        first = pd.read_parquet(path)
+        assert len(first) == len(results_to_games_dataframe(results[:1]))
+
+        checkpointer.write(results, str(path))
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(path), results_to_games_dataframe(results)
+        )
+
+    def test_concurrent_table_calls_cache_each_result_once(
+        self, monkeypatch, fixture_report_results
+    ):
+        results = fixture_report_results[:1]
+        expected = len(results_to_games_dataframe(results))
+        build = get_tournament_reports.results_to_games_table
+        # Both threads are inside the flatten before either caches its table
+        barrier = threading.Barrier(2, timeout=5)
+
+        def slow_build(*args, **kwargs):
+            table = build(*args, **kwargs)
+            barrier.wait()
+            return table
+
+        monkeypatch.setattr(
+            get_tournament_reports, "results_to_games_table", slow_build
+        )
+        checkpointer = GamesCheckpoint()
+        threads = [
+            threading.Thread(target=checkpointer.table, args=(results,))
+            for _ in range(2)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert checkpointer.table(results).num_rows == expected
+
+    def test_final_save_reuses_checkpointed_games(
+        self, tmp_path, fixture_report_results
+    ):
+        results = fixture_report_results
+        checkpointer = GamesCheckpoint()
+        checkpointer.write(results[:1], str(tmp_path / "games.parquet.checkpoint"))
+
+        games = save_games_parquet(
+            results, str(tmp_path / "games.parquet"), checkpointer=checkpointer
+        )
+
+        pd.testing.assert_frame_equal(
+            games.to_pandas(), results_to_games_dataframe(results)
+        )
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(tmp_path / "games.parquet"),
+            results_to_games_dataframe(results),
+        )
+
+
+class TestSaveCsvSample:
+    """Tests for save_csv_sample (CSV sample from the in-memory games table)."""
+
+    def test_samples_rows_of_saved_games(self, tmp_path):
+        fixture = Path(__file__).parent / "fixtures" / "world_cup_25_report.html"
+        report, error = parse_report("449502", fixture.read_bytes())
+        assert error is None
+        results = [{"tournament_code": "449502", "success": True, **report}]
+
+        games = save_games_parquet(results, str(tmp_path / "games.parquet"))
+        save_csv_sample(games, str(tmp_path / "sample.csv"), sample_size=10)
+
+        sample = pd.read_csv(tmp_path / "sample.csv", dtype=str)
+        assert len(sample) == 10
+        assert list(sample.columns) == games.column_names
+        all_keys = set(
+            zip(games["white_player_id"].to_pylist(), games["round_number"].to_pylist())
+        )
+        sample_keys = set(
+            zip(sample["white_player_id"], sample["round_number"].astype(int))
+        )
+        assert sample_keys <= all_keys
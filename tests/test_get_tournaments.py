@@ -1,6 +1,9 @@
 """Tests for get_tournaments scraper."""
 
 import asyncio
+import contextlib
+import json
+import signal
 import tempfile
 from pathlib import Path
 
@@ -8,12 +11,70 @@ import pytest
 
 aiohttp = pytest.importorskip("aiohttp")
 
+import get_tournaments
 from get_tournaments import (
+    _encode_outputs,
+    create_session,
     fetch_federation_tournaments,
     is_valid_tournament_id,
+    parse_tournament_row,
     read_federations,
+    scrape_month,
 )
 
+from aiohttp import web
+
+_SAMPLE_BODY = (
+    b'{"data":[["399495","<a href=\\/report.phtml?event=399495>4th Annual'
+    b' Forester Open<\\/a>","Forest","s","2025-12-01",'
+    b'"<a href=\\/report.phtml?event=399495>2025-12-03<\\/a>","","",""]]}'
+)
+
+
+@contextlib.asynccontextmanager
+async def _local_server(monkeypatch, handler):
+    """Serve handler as TOURNAMENTS_URL on a local port for the block's duration."""
+    app = web.Application()
+    app.router.add_get("/a_tournaments.php", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(
+        get_tournaments,
+        "TOURNAMENTS_URL",
+        f"http://127.0.0.1:{port}/a_tournaments.php",
+    )
+    try:
+        yield
+    finally:
+        await runner.cleanup()
+
+
+def _fetch_from_local_server(monkeypatch, body: bytes, **fetch_kwargs):
+    """Run fetch_federation_tournaments against a local server returning body."""
+
+    async def handler(request):
+        resp = web.Response(body=body, content_type="application/json")
+        resp.enable_compression()
+        return resp
+
+    async def _run():
+        async with _local_server(monkeypatch, handler):
+            async with create_session() as session:
+                return await fetch_federation_tournaments(
+                    session,
+                    asyncio.Semaphore(1),
+                    "USA",
+                    "United States of America",
+                    2025,
+                    12,
+                    **fetch_kwargs,
+                )
+
+    return asyncio.run(_run())
+
 
 class TestValidationHelpers:
     """Tests for validation helpers."""
@@ -71,6 +132,239 @@ class TestReadFederations:
             path.unlink()
 
 
+class TestParseTournamentRow:
+    """Tests for parse_tournament_row() link-cell extraction."""
+
+    def test_extracts_link_text(self):
+        row = [
+            "399495",
+            "<a href=/report.phtml?event=399495>A <b>B</b></a>",
+            "Forest",
+            "s",
+            "2025-12-01",
+            "<a href=/report.phtml?event=399495>2025-12-03</a>",
+        ]
+        t = parse_tournament_row(row, "USA")
+        assert t.name == "A <b>B</b>"
+        assert t.end_date == "2025-12-03"
+
+    def test_falls_back_to_stripping_tags(self):
+        row = ["1", "<b>Open</b> Cup ", "X", "r", "2025-12-01", "2025-12-02"]
+        t = parse_tournament_row(row, "USA")
+        assert t.name == "Open Cup"
+        assert t.end_date == "2025-12-02"
+
+
+class TestEncodeOutputs:
+    """Tests for _encode_outputs() (IDs and JSON file contents)."""
+
+    def test_non_ascii_digit_ids_are_utf8_encoded(self):
+        # isdigit() accepts e.g. Arabic-Indic digits, so such IDs get through
+        row = ["١٢٣", "Open", "X", "r", "2025-12-01", "2025-12-02"]
+        t = parse_tournament_row(row, "USA")
+        assert t is not None
+
+        ids_content, json_content = _encode_outputs([t], [t])
+
+        assert ids_content == "١٢٣\n".encode("utf-8")
+        assert "١٢٣" in json_content.decode("utf-8")
+
+
+class TestFetchFederationTournaments:
+    """Tests for fetch_federation_tournaments() against a local server."""
+
+    def test_parses_rows_and_returns_raw_bytes(self, monkeypatch):
+        code, _, tournaments, error, raw = _fetch_from_local_server(
+            monkeypatch, _SAMPLE_BODY
+        )
+
+        assert error is None
+        assert code == "USA"
+        assert raw == _SAMPLE_BODY
+        assert len(tournaments) == 1
+        t = tournaments[0]
+        assert t.tournament_id == "399495"
+        assert t.name == "4th Annual Forester Open"
+        assert t.location == "Forest"
+        assert t.start_date == "2025-12-01"
+        assert t.end_date == "2025-12-03"
+        assert t.federation == "USA"
+
+    def test_large_compressed_payload(self, monkeypatch):
+        row = (
+            b'["399495","<a href=\\/report.phtml?event=399495>Open<\\/a>",'
+            b'"Forest","s","2025-12-01","2025-12-03","","",""]'
+        )
+        body = b'{"data":[' + b",".join([row] * 20_000) + b"]}"
+        assert len(body) > 2 * 1024 * 1024
+
+        _, _, tournaments, error, raw = _fetch_from_local_server(monkeypatch, body)
+
+        assert error is None
+        assert raw == body
+        assert len(tournaments) == 20_000
+
+    def test_session_reuses_pooled_connections(self, monkeypatch):
+        ports = set()
+
+        async def handler(request):
+            ports.add(request.transport.get_extra_info("peername")[1])
+            await asyncio.sleep(0.01)
+            return web.Response(body=_SAMPLE_BODY, content_type="application/json")
+
+        async def _run():
+            async with _local_server(monkeypatch, handler):
+                async with create_session(max_concurrency=2) as session:
+                    semaphore = asyncio.Semaphore(2)
+                    return await asyncio.gather(
+                        *(
+                            fetch_federation_tournaments(
+                                session, semaphore, f"F{i}", "Fed", 2025, 12
+                            )
+                            for i in range(8)
+                        )
+                    )
+
+        results = asyncio.run(_run())
+
+        assert all(error is None for _, _, _, error, _ in results)
+        assert 1 <= len(ports) <= 2
+
+    @pytest.mark.parametrize("body", [b"null", b"[]", b"{}", b'{"data":null}'])
+    def test_empty_responses_are_not_retried(self, monkeypatch, body):
+        _, _, tournaments, error, raw = _fetch_from_local_server(
+            monkeypatch, body, retry_delay=60.0
+        )
+
+        assert error is None
+        assert tournaments == []
+        assert raw == body
+
+    def test_html_response_is_an_error(self, monkeypatch):
+        _, _, tournaments, error, raw = _fetch_from_local_server(
+            monkeypatch, b"  <html>blocked</html>", max_retries=1
+        )
+
+        assert tournaments == []
+        assert raw is None
+        assert error.startswith("Server returned HTML instead of JSON")
+
+
+def _rows_body(*rows) -> bytes:
+    """JSON body for a federation listing; each row is (id, name)."""
+    return json.dumps(
+        {
+            "data": [
+                [tid, name, "City", "s", "2025-12-01", "2025-12-02"]
+                for tid, name in rows
+            ]
+        }
+    ).encode()
+
+
+def _scrape_month(monkeypatch, tmp_path, handler, codes, **kwargs):
+    """
+    Run scrape_month for 2025-12 over codes against a local server running
+    handler, writing to tmp_path. Restores the signal handlers it installs.
+    """
+    feds_path = tmp_path / "federations.csv"
+    feds_path.write_text("code,name\n" + "".join(f"{c},Fed {c}\n" for c in codes))
+    saved = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+
+    async def _run():
+        async with _local_server(monkeypatch, handler):
+            return await asyncio.wait_for(
+                scrape_month(
+                    2025,
+                    12,
+                    feds_path,
+                    tmp_path / "data" / "tournament_ids.txt",
+                    json_uri=str(tmp_path / "sample.json"),
+                    save_raw=False,
+                    **kwargs,
+                ),
+                timeout=10,
+            )
+
+    try:
+        return asyncio.run(_run())
+    finally:
+        for sig, handler_ in saved.items():
+            signal.signal(sig, handler_)
+
+
+class TestScrapeMonth:
+    """Tests for scrape_month() (worker pool, dedup, outputs) against a local server."""
+
+    def test_dedupes_ids_first_federation_wins_and_writes_sorted(
+        self, monkeypatch, tmp_path
+    ):
+        bodies = {
+            "USA": _rows_body(("300", "Usa Open"), ("100", "Usa Shared")),
+            "CAN": _rows_body(("100", "Can Shared"), ("200", "Can Open")),
+        }
+
+        async def handler(request):
+            return web.Response(
+                body=bodies[request.query["country"]], content_type="application/json"
+            )
+
+        tournaments, n_errors, n_total = _scrape_month(
+            monkeypatch, tmp_path, handler, ["USA", "CAN"]
+        )
+
+        assert (n_errors, n_total) == (0, 2)
+        assert [t.tournament_id for t in tournaments] == ["100", "200", "300"]
+        ids_file = tmp_path / "data" / "tournament_ids.txt"
+        assert ids_file.read_text() == "100\n200\n300\n"
+        sample = json.loads((tmp_path / "sample.json").read_text())
+        assert [t["tournament_id"] for t in sample] == ["100", "200", "300"]
+        # USA is fetched first (one worker), so its copy of 100 is kept
+        assert sample[0]["federation"] == "USA"
+        assert sample[0]["name"] == "Usa Shared"
+
+    def test_federation_http_error_fails_fast(self, monkeypatch, tmp_path):
+        requested = []
+
+        async def handler(request):
+            code = request.query["country"]
+            requested.append(code)
+            if code == "BAD":
+                return web.Response(status=500)
+            return web.Response(
+                body=_rows_body((code[1:], "Open")), content_type="application/json"
+            )
+
+        codes = ["BAD"] + [f"F{i}" for i in range(1, 11)]
+        _, n_errors, n_total = _scrape_month(
+            monkeypatch, tmp_path, handler, codes, max_retries=1
+        )
+
+        assert (n_errors, n_total) == (1, 11)
+        # Workers are cancelled after the error; at most the one request the
+        # single worker had already started goes out
+        assert requested[0] == "BAD"
+        assert len(requested) <= 2
+
+    def test_worker_exception_is_reraised(self, monkeypatch, tmp_path):
+        async def failing_fetch(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        async def handler(request):
+            return web.Response(body=b"{}", content_type="application/json")
+
+        monkeypatch.setattr(
+            get_tournaments, "fetch_federation_tournaments", failing_fetch
+        )
+
+        # Re-raised from the main loop rather than hanging on fetched.get()
+        # (_scrape_month's wait_for timeout would surface a hang instead)
+        with pytest.raises(RuntimeError, match="boom"):
+            _scrape_month(
+                monkeypatch, tmp_path, handler, ["USA", "CAN"], max_concurrency=2
+            )
+
+
 class TestGetTournaments:
     """Tests for tournament listing scraper."""
 
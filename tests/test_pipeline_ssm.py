@@ -29,6 +29,8 @@ def test_ensure_run_name_applies_ssm_when_key_not_in_input(monkeypatch):
             "max_concurrency": 8,
             "details_rate_limit": 0.4,
             "reports_rate_limit": 0.25,
+            "details_workers": 6,
+            "reports_workers": 2,
         },
     )
     out = ensure_run_name.lambda_handler(
@@ -39,6 +41,8 @@ def test_ensure_run_name_applies_ssm_when_key_not_in_input(monkeypatch):
     assert out["max_concurrency"] == 8
     assert out["details_rate_limit"] == 0.4
     assert out["reports_rate_limit"] == 0.25
+    assert out["details_workers"] == 6
+    assert out["reports_workers"] == 2
 
 
 def test_ensure_run_name_execution_input_overrides_ssm(monkeypatch):
@@ -72,6 +76,8 @@ def test_ensure_run_name_code_defaults_when_no_ssm(monkeypatch):
     assert out["max_concurrency"] == 5
     assert out["details_rate_limit"] == 0.25
     assert out["reports_rate_limit"] == 0.4
+    assert out["details_workers"] == 4
+    assert out["reports_workers"] == 4
 
 
 def test_load_ssm_skips_without_lambda_env_even_if_param_set(monkeypatch):